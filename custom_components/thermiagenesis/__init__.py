@@ -3,30 +3,130 @@ import asyncio
 import logging
 import time
 from datetime import datetime
-from datetime import timedelta
+from functools import partial
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST
 from homeassistant.const import CONF_PORT
 from homeassistant.const import CONF_TYPE
-from homeassistant.helpers.typing import ConfigType
+from homeassistant.core import callback
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.helpers.update_coordinator import UpdateFailed
-from pythermiagenesis import ThermiaGenesis
+from homeassistant.util import dt as dt_util
+from pythermiagenesis.const import REG_DISCRETE_INPUT
 
+from .alarms import alarm_registers
+from .alarms import AlarmEngine
+from .burst import BURST_INTERVAL
+from .burst import BurstRecorder
+from .capabilities import async_find_unsupported
+from .capabilities import CAPABILITIES_VERSION
+from .capabilities import EXC_ILLEGAL_VALUE
+from .capabilities import FIRMWARE_REGISTERS
+from .capabilities import firmware_version
+from .capabilities import model_registers
+from .climate import climate_registers
+from .const import ATTR_DEFAULT_ENABLED
+from .const import ATTR_FIRMWARE
+from .const import CLIMATE_TYPES
+from .const import CONF_UNIT_ID
+from .const import DATA_POLL_GROUP
+from .const import DEFAULT_UNIT_ID
 from .const import DOMAIN
+from .const import EVENT_ALARM
+from .const import HEATPUMP_ATTRIBUTES
+from .const import HEATPUMP_SENSOR
+from .const import POLL_FAST
+from .const import POLL_NORMAL
+from .const import POLL_ONCE
+from .const import POLL_TIER_INTERVALS
+from .const import WRITE_DEPENDENCIES
+from .demand import DemandPolicy
+from .entity import ATTR_MODEL
+from .entity import entity_unique_id
+from .gateway import async_get_gateway
+from .gateway import Gateway
+from .metadata import platform_metadata
+from .metadata import PLATFORM_TYPES
+from .metadata import register_metadata
+from .metrics import ModbusMetrics
+from .metrics import read_sizes
+from .metrics import write_sizes
+from .planner import CONDITIONAL_REGISTERS
+from .planner import plan_reads
+from .planner import plan_writes
+from .polling import PollGroup
+from .quarantine import is_bad_address
+from .quarantine import Quarantine
+from .quarantine import register_addresses
+from .scheduler import PRIORITY_POLL
+from .scheduler import PRIORITY_READ
+from .scheduler import PRIORITY_WRITE
+from .tuning import AdaptiveTuner
 
 PLATFORMS = ["sensor", "binary_sensor", "climate", "switch", "number"]
 
-SCAN_INTERVAL = timedelta(seconds=30)
+# Tick at the rate of the fastest tier, each tick only reads registers that are due
+SCAN_INTERVAL = POLL_TIER_INTERVALS[POLL_FAST]
+# Queued writes to number and climate entities are collected for this long
+WRITE_DEBOUNCE = 0.5
+SNAPSHOT_VERSION = 1
+# Persist the latest values at most this often, in seconds
+SNAPSHOT_INTERVAL = 300
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def poll_tier(register):
+    """Return the poll tier declared for a register."""
+    for platform in PLATFORM_TYPES:
+        meta = register_metadata(platform).get(register)
+        if meta is not None:
+            return meta.poll_tier
+    return POLL_NORMAL
+
+
+def startup_registers(hass, kind, entry_id=None):
+    """Return the registers read by the entities that will be enabled.
+
+    Entities in the entity registry keep their enabled state, new entities
+    are enabled when their type is enabled by default.
+    """
+    registry = er.async_get(hass)
+
+    def enabled(platform, key, default):
+        entity_id = registry.async_get_entity_id(
+            platform, DOMAIN, entity_unique_id(entry_id, key)
+        )
+        if entity_id is None:
+            return default
+        return not registry.async_get(entity_id).disabled
+
+    registers = []
+    if enabled("sensor", "heatpump", True):
+        registers.append(HEATPUMP_SENSOR)
+        registers.extend(attr[0] for attr in HEATPUMP_ATTRIBUTES)
+    for platform in PLATFORM_TYPES:
+        for meta in platform_metadata(platform, kind):
+            if enabled(platform, meta.name, meta.default_enabled):
+                registers.append(meta.name)
+    for name, meta in CLIMATE_TYPES.items():
+        if enabled("climate", name, meta[ATTR_DEFAULT_ENABLED]):
+            registers.extend(climate_registers(meta))
+    # Alarm events are fired whether or not any alarm entity is enabled
+    registers.extend(meta.name for meta in alarm_registers(kind).values())
+    return registers
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType):
     """Set up the ThermiaGenesis component."""
     return True
@@ -37,14 +137,41 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     host = entry.data[CONF_HOST]
     port = entry.data[CONF_PORT]
     kind = entry.data[CONF_TYPE]
+    unit_id = entry.data.get(CONF_UNIT_ID, DEFAULT_UNIT_ID)
 
     coordinator = ThermiaGenesisDataUpdateCoordinator(
-        hass, host=host, port=port, kind=kind
+        hass,
+        host=host,
+        port=port,
+        kind=kind,
+        entry_id=entry.entry_id,
+        poll_group=hass.data.setdefault(DATA_POLL_GROUP, PollGroup()),
+        unit_id=unit_id,
+        gateway=async_get_gateway(hass, host, port, unit_id),
     )
-    await coordinator.async_refresh()
+    # Read everything the entities need in one go instead of an empty first
+    # refresh followed by a second one once the entities registered
+    coordinator.registerAttribute(startup_registers(hass, kind, entry.entry_id))
+    # Entities are only created for the registers the heat pump answers for,
+    # as far as an earlier probe found
+    probed = await coordinator.async_load_capabilities()
+    if await coordinator.async_restore_snapshot():
+        # Start with the values from before the restart and refresh them
+        # without holding up the setup
+        entry.async_create_background_task(
+            hass, _async_refresh_and_probe(coordinator), f"{DOMAIN} first refresh"
+        )
+    else:
+        await coordinator.async_refresh()
 
-    if not coordinator.last_update_success:
-        raise ConfigEntryNotReady
+        if not coordinator.last_update_success:
+            raise ConfigEntryNotReady
+        if probed:
+            entry.async_create_background_task(
+                hass, coordinator.async_probe_capabilities(), f"{DOMAIN} probe"
+            )
+        else:
+            await coordinator.async_probe_capabilities()
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
@@ -54,6 +181,42 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     return True
 
 
+async def _async_refresh_and_probe(coordinator):
+    # The probe comes second so the restored values are confirmed first, and a
+    # heat pump that can't be reached doesn't delay the refresh
+    await coordinator.async_refresh()
+    if coordinator.last_update_success:
+        await coordinator.async_probe_capabilities()
+
+
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry):
+    """Scope the ids of an entry created before several heat pumps were supported."""
+    if entry.version == 1:
+        legacy = entity_unique_id(None, "")
+
+        @callback
+        def migrate_unique_id(entity_entry):
+            key = entity_entry.unique_id[len(legacy) :]
+            if not entity_entry.unique_id.startswith(legacy) or key.startswith(
+                f"{entry.entry_id}_"
+            ):
+                return None
+            return {"new_unique_id": entity_unique_id(entry.entry_id, key)}
+
+        await er.async_migrate_entries(hass, entry.entry_id, migrate_unique_id)
+        device_registry = dr.async_get(hass)
+        device = device_registry.async_get_device(identifiers={(DOMAIN, ATTR_MODEL)})
+        if device is not None and entry.entry_id in device.config_entries:
+            device_registry.async_update_device(
+                device.id, new_identifiers={(DOMAIN, entry.entry_id)}
+            )
+        hass.config_entries.async_update_entry(
+            entry, data={CONF_UNIT_ID: DEFAULT_UNIT_ID, **entry.data}, version=2
+        )
+        _LOGGER.info(f"Migrated {entry.title} to version 2")
+    return True
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Unload a config entry."""
     unload_ok = all(
@@ -65,21 +228,69 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
         )
     )
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry):
+    """Remove the snapshot and capabilities stored for a config entry."""
+    await Store(hass, SNAPSHOT_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
+    await Store(
+        hass, CAPABILITIES_VERSION, f"{DOMAIN}.{entry.entry_id}.capabilities"
+    ).async_remove()
+
+
 class ThermiaGenesisDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching ThermiaGenesis data from the heat pump."""
 
-    def __init__(self, hass, host, port, kind):
+    def __init__(
+        self,
+        hass,
+        host,
+        port,
+        kind,
+        entry_id=None,
+        poll_group=None,
+        unit_id=DEFAULT_UNIT_ID,
+        gateway=None,
+    ):
         """Initialize."""
-        self.thermia = ThermiaGenesis(
-            host, port=port, kind=kind, delay=0.05, max_registers=16
-        )
+        self.entry_id = entry_id
+        self.unit_id = unit_id
+        if gateway is None:
+            gateway = Gateway(hass, host, port, unit_id)
+            gateway.add(unit_id)
+        self.gateway = gateway
+        self.connection = gateway.connection
+        self.scheduler = gateway.scheduler
+        self.tuner = AdaptiveTuner()
+        self.metrics = ModbusMetrics()
+        self.alarms = AlarmEngine(kind)
+        self.burst = BurstRecorder(kind)
+        self.demand = DemandPolicy(kind)
         self.kind = kind
         self.attributes = {}
+        self._last_read = {}
+        self._changed = None
+        self.last_changed = None
+        self._notified_success = None
+        self._pending_writes = {}
+        self._pending_flush = None
+        self._unsub_flush = None
+        self.stale = False
+        self._store = None
+        self._capabilities = None
+        if entry_id is not None:
+            self._store = Store(hass, SNAPSHOT_VERSION, f"{DOMAIN}.{entry_id}")
+            self._capabilities = Store(
+                hass, CAPABILITIES_VERSION, f"{DOMAIN}.{entry_id}.capabilities"
+            )
+        self.firmware = None
+        self.unsupported = set()
+        self.quarantine = Quarantine()
+        self._snapshot_at = 0
 
         super().__init__(
             hass,
@@ -87,43 +298,486 @@ class ThermiaGenesisDataUpdateCoordinator(DataUpdateCoordinator):
             name=DOMAIN,
             update_interval=SCAN_INTERVAL,
         )
+        self.poll_offset = 0
+        self._poll_shift = 0
+        self.poll_group = poll_group if poll_group is not None else PollGroup()
+        self.poll_group.add(self)
+
+    def set_poll_offset(self, offset):
+        """Poll offset, a fraction of the poll interval, later than offset 0.
+
+        The next scheduled poll is delayed once by the change in offset. Every
+        poll is scheduled an interval after the whole second the previous one
+        ended in, so the later polls keep the shift rounded to whole seconds.
+        """
+        self._poll_shift += offset - self.poll_offset
+        self.poll_offset = offset
+
+    @callback
+    def _schedule_refresh(self):
+        """Schedule the next poll, shifted once after a new poll offset."""
+        super()._schedule_refresh()
+        if not self._poll_shift or self._unsub_refresh is None:
+            return
+        delay = round(self._poll_shift % 1 * SCAN_INTERVAL.total_seconds())
+        self._poll_shift = 0
+        if not delay:
+            return
+        _LOGGER.debug(f"Shifting the polls by {delay} s")
+        self._async_unsub_refresh()
+        loop = self.hass.loop
+        next_refresh = (
+            int(loop.time()) + self._microsecond + self._update_interval_seconds + delay
+        )
+        self._unsub_refresh = loop.call_at(
+            next_refresh, self.hass.async_run_hass_job, self._job
+        ).cancel
 
     async def _async_update_data(self):
-        """Update data via library."""
-        data = {}
+        """Update data from the heat pump."""
+        self._changed = None
         try:
-            start_time = time.time()
-            registers = self.attributes.keys()
-            data = await self.thermia.async_update(only_registers=registers)
-            # for reg in registers:
-            #    #await self.thermia.async_update(only_registers=[reg]) #registers)
-            #    print(f"Got {reg}: {self.thermia.data[reg]}")
-            _LOGGER.debug(data)
+            async with self.poll_group.session():
+                start_time = time.time()
+                values, read_at = await self._async_read_registers(
+                    self._due_registers(time.monotonic()), PRIORITY_POLL
+                )
+            _LOGGER.debug(values)
             end_time = time.time()
+            self.metrics.record_poll(end_time - start_time)
             _LOGGER.debug(
                 f"{datetime.now()} Fetching heatpump data took {end_time - start_time} s"
             )
 
-        except (ConnectionError) as error:
+        except ConnectionError as error:
             raise UpdateFailed(error)
+        data = self._merge(values, read_at)
+        if self.quarantine.until:
+            for name in [name for name in data if self.quarantine.excludes(name)]:
+                del data[name]
+        transitions = self.alarms.transitions()
+        for meta, active in transitions:
+            _LOGGER.info(f"Alarm {meta.label} {'raised' if active else 'cleared'}")
+            self.hass.bus.async_fire(
+                EVENT_ALARM,
+                {"alarm": meta.name, "label": meta.label, "active": active},
+            )
+        now = time.monotonic()
+        if self.burst.record(now, dt_util.utcnow().isoformat(), data, transitions):
+            if self.burst.active(now):
+                _LOGGER.info("Alarm changed, polling at the burst rate")
+                self.update_interval = BURST_INTERVAL
+            else:
+                _LOGGER.info("Burst ended, polling at the normal rate")
+                self.update_interval = SCAN_INTERVAL
+        if self.demand.update(data):
+            _LOGGER.debug("Demand picked up, reading the demand registers")
+            for name in self.demand.registers - values.keys():
+                self._last_read.pop(name, None)
+        # Everyone is notified once restored values have been confirmed
+        self._changed = None if self.stale else self._changed_registers(data)
+        self.stale = False
+        if self._store is not None and time.monotonic() >= self._snapshot_at:
+            self._snapshot_at = time.monotonic() + SNAPSHOT_INTERVAL
+            self._store.async_delay_save(self._snapshot)
         return data
 
+    async def async_load_capabilities(self):
+        """Use the result of an earlier probe, return True if there is one."""
+        stored = await self._async_stored_capabilities()
+        if stored is None:
+            return False
+        self.firmware = stored[ATTR_FIRMWARE]
+        self.unsupported = set(stored["unsupported"]) - CONDITIONAL_REGISTERS.keys()
+        return True
+
+    async def _async_stored_capabilities(self):
+        if self._capabilities is None:
+            return None
+        stored = await self._capabilities.async_load()
+        if not stored or stored["kind"] != self.kind:
+            return None
+        return stored
+
+    async def async_probe_capabilities(self):
+        """Find the registers the heat pump doesn't answer for.
+
+        The result is stored per firmware version, so the registers are only
+        probed at the first setup and after a firmware update. When the heat
+        pump can't be reached the current result is kept. Registers that only
+        timed out may be there on a less busy bus, and conditional registers
+        may only fail because they aren't enabled. Those are quarantined rather
+        than stored.
+        """
+        stored = await self._async_stored_capabilities()
+        try:
+            values = {}
+            for block in plan_reads(FIRMWARE_REGISTERS, self.kind):
+                values.update(block.decode(await self._async_probe_block(block)))
+            firmware = firmware_version(values)
+            if stored and stored[ATTR_FIRMWARE] == firmware:
+                await self.async_load_capabilities()
+                return
+            _LOGGER.info(f"Probing the registers of firmware {firmware}")
+            # Conditional registers are probed only if known to be enabled
+            failures = await async_find_unsupported(
+                self._async_probe_block,
+                model_registers(self.kind),
+                self.kind,
+                self.tuner.max_block,
+                known=self.data or {},
+            )
+        except ConnectionError as error:
+            _LOGGER.warning(f"Could not probe the heat pump registers: {error}")
+            return
+        self.firmware = firmware
+        self.unsupported = set()
+        for name, error in failures.items():
+            if is_bad_address(error) and name not in CONDITIONAL_REGISTERS:
+                self.unsupported.add(name)
+            else:
+                self.quarantine.add(register_addresses(name), time.monotonic())
+        if self.unsupported:
+            _LOGGER.info(
+                f"Not polling unsupported registers {sorted(self.unsupported)}"
+            )
+        if self._capabilities is not None:
+            await self._capabilities.async_save(
+                {
+                    "kind": self.kind,
+                    ATTR_FIRMWARE: self.firmware,
+                    "unsupported": sorted(self.unsupported),
+                }
+            )
+
+    async def _async_probe_block(self, block):
+        return await self.scheduler.async_run(
+            PRIORITY_READ, partial(self._async_read_block, block, tune=False)
+        )
+
+    async def async_restore_snapshot(self):
+        """Restore the values persisted before the last restart.
+
+        Restored values are marked stale until the first live read. Registers
+        read recently before the restart are not due again right away, except
+        for those that are read only once.
+        Returns True if a snapshot was restored.
+        """
+        if self._store is None:
+            return False
+        snapshot = await self._store.async_load()
+        if not snapshot or snapshot.get("kind") != self.kind:
+            return False
+        offset = time.monotonic() - time.time()
+        for name, read_at in snapshot["read_at"].items():
+            if poll_tier(name) != POLL_ONCE:
+                self._last_read[name] = read_at + offset
+        self.data = snapshot["data"]
+        self.alarms.load(self.data)
+        self.stale = True
+        _LOGGER.debug(f"Restored {len(self.data)} values from the last snapshot")
+        return True
+
+    def _snapshot(self):
+        """Return the values and their wall clock read times for storage."""
+        offset = time.time() - time.monotonic()
+        return {
+            "kind": self.kind,
+            "data": self.data,
+            "read_at": {name: last + offset for name, last in self._last_read.items()},
+        }
+
+    async def _async_read_registers(self, registers, priority, known=None):
+        """Read registers in planned blocks through the request scheduler.
+
+        Returns the decoded values and the time each of them was read. A block
+        failing on an illegal address or value doesn't fail the read, the
+        addresses at fault are isolated and quarantined instead.
+        """
+        self.quarantine.release_due(time.monotonic())
+        if known is None:
+            known = self.data or {}
+        blocks = plan_reads(
+            [
+                name
+                for name in registers
+                if name not in self.unsupported and not self.quarantine.excludes(name)
+            ],
+            self.kind,
+            known=known,
+            max_block=self.tuner.max_block,
+            avoid=self.quarantine,
+        )
+        values = {}
+        read_at = {}
+        for block in blocks:
+            try:
+                raw = await self.scheduler.async_run(
+                    priority,
+                    partial(self._async_read_block, block),
+                    key=(self.unit_id, block.reg_type, block.start, block.count),
+                )
+            except ConnectionError as error:
+                if not self._blames_addresses(block, error):
+                    raise
+                await self._async_isolate(block, priority, known, values, read_at)
+                continue
+            self._decode_block(block, raw, values, read_at)
+        return values, read_at
+
+    def _blames_addresses(self, block, error):
+        """Return True if a failed read points at addresses of the block.
+
+        Illegal value is also the answer to a request that is too large. For
+        a block larger than any read so far it is left to the tuner, which
+        shrinks the blocks.
+        """
+        if not is_bad_address(error):
+            return False
+        return error.code != EXC_ILLEGAL_VALUE or self.tuner.fits(
+            block.reg_type, block.count
+        )
+
+    async def _async_isolate(self, block, priority, known, values, read_at):
+        """Bisect a failing block and quarantine the addresses at fault.
+
+        The addresses are those of the smallest failing parts that no part
+        read fine covered. The values of the parts that read fine are kept.
+        """
+        covered = set()
+        failed = [(block.start, block.end)]
+
+        async def read(part):
+            try:
+                raw = await self.scheduler.async_run(
+                    priority, partial(self._async_read_block, part, tune=False)
+                )
+            except ConnectionError:
+                failed.append((part.start, part.end))
+                raise
+            covered.update(range(part.start, part.end + 1))
+            self._decode_block(part, raw, values, read_at)
+
+        if len(block.slots) > 1:
+            await async_find_unsupported(
+                read,
+                block.slots,
+                self.kind,
+                self.tuner.max_block,
+                known=known,
+                check=is_bad_address,
+            )
+        bad = set()
+        for start, end in failed:
+            if any(
+                (start, end) != other and start <= other[0] and other[1] <= end
+                for other in failed
+            ):
+                continue
+            bad.update(
+                (block.reg_type, address)
+                for address in range(start, end + 1)
+                if address not in covered
+            )
+        self.quarantine.add(bad, time.monotonic())
+
+    def _decode_block(self, block, raw, values, read_at):
+        """Add the values of a block read to values and read_at."""
+        now = time.monotonic()
+        if block.reg_type == REG_DISCRETE_INPUT:
+            self.alarms.update(block.start, raw)
+        if self.quarantine.strikes:
+            self.quarantine.confirm(block.reg_type, block.start, block.end)
+        for name, value in block.decode(raw).items():
+            values[name] = value
+            read_at[name] = now
+            self._last_read[name] = max(self._last_read.get(name, 0), now)
+
+    def _merge(self, values, read_at):
+        """Return the current data updated with values no newer read replaced."""
+        data = dict(self.data or {})
+        for name, value in values.items():
+            if self._last_read.get(name, 0) <= read_at[name]:
+                data[name] = value
+        return data
+
+    async def _async_read_block(self, block, tune=True):
+        """Read a block, feeding the outcome to the tuner and metrics.
+
+        Bisecting a block is expected to fail, and so are bad addresses, so
+        they don't make the tuner back off.
+        """
+        await self.connection.async_ensure_open()
+        await asyncio.sleep(self.tuner.delay)
+        start = time.monotonic()
+        try:
+            values = await self.connection.async_read(block, self.unit_id)
+        except ConnectionError as error:
+            if tune and not self._blames_addresses(block, error):
+                self.tuner.record_failure(block.reg_type, error)
+            self.metrics.record_failure(block.slots, error, read_sizes(block))
+            raise
+        latency = time.monotonic() - start
+        self.tuner.record_success(block.reg_type, latency, block.count)
+        self.metrics.record_read(block, latency)
+        return values
+
+    async def _async_write_block(self, block):
+        """Write a block, feeding the outcome to the tuner and metrics."""
+        await self.connection.async_ensure_open()
+        await asyncio.sleep(self.tuner.delay)
+        start = time.monotonic()
+        try:
+            await self.connection.async_write(block, self.unit_id)
+        except ConnectionError as error:
+            self.tuner.record_failure(None, error)
+            self.metrics.record_failure(block.names, error, write_sizes(block))
+            raise
+        self.metrics.record_write(block, time.monotonic() - start)
+
+    def _changed_registers(self, data):
+        """Return the registers whose value differs from the current data."""
+        previous = self.data or {}
+        changed = {
+            name
+            for name, value in data.items()
+            if name not in previous or previous[name] != value
+        }
+        return changed | (previous.keys() - data.keys())
+
+    @callback
+    def async_update_listeners(self):
+        """Notify listeners whose registers changed in the latest update.
+
+        Listeners added with a context of register names are only called when
+        one of those registers changed. Everyone is notified when availability
+        changes or when the data was set without a diff. The notified set stays
+        available as last_changed, None meaning everything may have changed.
+        """
+        changed = self._changed
+        self._changed = None
+        if self._notified_success != self.last_update_success:
+            changed = None
+        self._notified_success = self.last_update_success
+        self.last_changed = changed
+        for update_callback, context in list(self._listeners.values()):
+            if changed is None or context is None or not changed.isdisjoint(context):
+                update_callback()
+
+    def _due_registers(self, now):
+        """Return the registered attributes whose poll tier is due."""
+        # Allow half a tick of slack so timer jitter doesn't skip a whole tick
+        slack = SCAN_INTERVAL.total_seconds() / 2
+        due = []
+        for name, tier in self.attributes.items():
+            last = self._last_read.get(name)
+            if last is None:
+                due.append(name)
+                continue
+            interval = POLL_TIER_INTERVALS[self.demand.tier(name, tier)]
+            if interval is not None and now - last >= interval.total_seconds() - slack:
+                due.append(name)
+        if self.burst.active(now):
+            due.extend(name for name in self.burst.registers if name not in due)
+        return due
+
     async def _async_set_data(self, register, value):
-        """Set data via library."""
+        """Write a coil or holding register on the heat pump."""
+        return await self._async_set_data_many({register: value})
+
+    async def _async_set_data_many(self, writes):
+        """Write several registers and read back what they affect.
+
+        Adjacent registers are written with a single Write Multiple request so
+        the heat pump never sees a half applied pair. The written registers and
+        their WRITE_DEPENDENCIES are then read back right away, and only the
+        entities whose registers changed are notified.
+        """
+        blocks = plan_writes(writes)
+        read_back = []
+        for register in writes:
+            read_back.append(register)
+            read_back.extend(WRITE_DEPENDENCIES.get(register, []))
         try:
-            await self.thermia.async_set(register, value)
-        except (ConnectionError) as error:
+            for block in blocks:
+                await self.scheduler.async_run(
+                    PRIORITY_WRITE, partial(self._async_write_block, block)
+                )
+        except ConnectionError as error:
             raise UpdateFailed(error)
-        return self.thermia.data
+        # Plan with the written values, they may enable conditional registers
+        await self._async_read_back(read_back, {**(self.data or {}), **writes})
+        return self.data
+
+    async def _async_queue_set_data(self, writes):
+        """Queue writes and apply them together after a short debounce.
+
+        Writes arriving within WRITE_DEBOUNCE of the first queued write are
+        coalesced, keeping only the last value for each register, and are
+        applied with one _async_set_data_many call. Callers wait until their
+        write has been applied and see any error it raised.
+        """
+        self._pending_writes.update(writes)
+        if self._pending_flush is None:
+            self._pending_flush = self.hass.loop.create_future()
+            self._unsub_flush = async_call_later(
+                self.hass, WRITE_DEBOUNCE, self._async_flush_writes
+            )
+        await asyncio.shield(self._pending_flush)
+
+    async def _async_flush_writes(self, _now=None):
+        """Apply the queued writes."""
+        future = self._pending_flush
+        writes = self._pending_writes
+        self._pending_flush = None
+        self._pending_writes = {}
+        self._unsub_flush = None
+        _LOGGER.debug(f"Applying queued writes {writes}")
+        try:
+            await self._async_set_data_many(writes)
+        except Exception as error:  # pylint: disable=broad-except
+            future.set_exception(error)
+        else:
+            future.set_result(None)
+
+    async def _async_read_back(self, registers, known=None):
+        """Read back registers after a write and notify affected entities.
+
+        The write went through even if the read back fails, the next poll
+        picks up the values then.
+        """
+        try:
+            values, read_at = await self._async_read_registers(
+                registers, PRIORITY_READ, known
+            )
+        except ConnectionError as error:
+            _LOGGER.warning(f"Could not read back {sorted(registers)}: {error}")
+            await self.async_request_refresh()
+            return
+        data = self._merge(values, read_at)
+        self._changed = self._changed_registers(data)
+        self.data = data
+        self.async_update_listeners()
+
+    async def async_shutdown(self):
+        """Stop polling and close the connection to the heat pump."""
+        await super().async_shutdown()
+        self.poll_group.remove(self)
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            await self._async_flush_writes()
+        await self.gateway.async_release(self.unit_id)
+        if self._store is not None and self.data and not self.stale:
+            await self._store.async_save(self._snapshot())
 
     def registerAttribute(self, attribute):
         if type(attribute) is list:
             for name in attribute:
                 _LOGGER.info(f"Register attribute for update: {name}")
-                self.attributes[name] = True
+                self.attributes[name] = poll_tier(name)
         else:
             _LOGGER.info(f"Register attribute for update: {attribute}")
-            self.attributes[attribute] = True
+            self.attributes[attribute] = poll_tier(attribute)
 
     async def wantsRefresh(self, attribute):
         await self.coordinator.async_request_refresh()
@@ -0,0 +1,78 @@
+"""Alarm tracking of the ThermiaGenesis discrete inputs as a bitset."""
+from functools import lru_cache
+
+from pythermiagenesis.const import REG_DISCRETE_INPUT
+
+from .const import CLASS_ALARM
+from .metadata import platform_metadata
+
+
+@lru_cache(maxsize=None)
+def alarm_registers(kind):
+    """Return the alarm discrete inputs of a model by address."""
+    return {
+        meta.address: meta
+        for meta in platform_metadata("binary_sensor", kind)
+        if meta.device_class == CLASS_ALARM and meta.reg_type == REG_DISCRETE_INPUT
+    }
+
+
+def set_bits(bits):
+    """Yield the indexes of the set bits, lowest first."""
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+class AlarmEngine:
+    """Keep the alarm discrete inputs as one integer, bit n being address n.
+
+    Raw discrete input blocks are folded in as they are read. Transitions are
+    the XOR against the bits reported last, so an unchanged alarm state costs
+    a single integer comparison however many alarms the model has.
+    """
+
+    def __init__(self, kind):
+        """Initialize."""
+        self.alarms = alarm_registers(kind)
+        self.names = [meta.name for meta in self.alarms.values()]
+        self.mask = sum(1 << address for address in self.alarms)
+        self.bits = 0
+        self._masks = {meta.name: 1 << address for address, meta in self.alarms.items()}
+        self._reported = None
+
+    def update(self, start, values):
+        """Fold the raw values of a discrete input block into the bitset."""
+        packed = 0
+        for offset, value in enumerate(values):
+            if value:
+                packed |= 1 << offset
+        block = ((1 << len(values)) - 1) << start
+        self.bits = (self.bits & ~block) | (packed << start & self.mask)
+
+    def load(self, data):
+        """Set the bitset from decoded register values."""
+        self.bits = 0
+        for name, mask in self._masks.items():
+            if data.get(name):
+                self.bits |= mask
+
+    def active(self):
+        """Return the metadata of the active alarms."""
+        return [self.alarms[address] for address in set_bits(self.bits)]
+
+    def transitions(self):
+        """Return (metadata, active) of the alarms changed since the last call.
+
+        The first call only records the alarms active at startup.
+        """
+        if self._reported is None:
+            self._reported = self.bits
+            return []
+        changed = self.bits ^ self._reported
+        self._reported = self.bits
+        return [
+            (self.alarms[address], bool(self.bits >> address & 1))
+            for address in set_bits(changed)
+        ]
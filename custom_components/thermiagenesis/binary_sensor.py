@@ -1,17 +1,14 @@
 import logging
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
-from pythermiagenesis.const import REGISTERS
 
-from .const import ATTR_CLASS
-from .const import ATTR_DEFAULT_ENABLED
-from .const import ATTR_LABEL
 from .const import ATTR_MANUFACTURER
-from .const import BINARY_SENSOR_TYPES
 from .const import DOMAIN
+from .entity import entity_unique_id
+from .metadata import platform_metadata
+from .metadata import register_metadata
 
 ATTR_COUNTER = "counter"
-ATTR_FIRMWARE = "firmware"
 ATTR_MODEL = "Diplomat Inverter Duo"
 
 _LOGGER = logging.getLogger(__name__)
@@ -24,36 +21,36 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     sensors = []
 
     device_info = {
-        "identifiers": {(DOMAIN, ATTR_MODEL)},
+        "identifiers": {(DOMAIN, config_entry.entry_id)},
         "name": ATTR_MODEL,
         "manufacturer": ATTR_MANUFACTURER,
         "model": ATTR_MODEL,
-        "sw_version": coordinator.data.get(ATTR_FIRMWARE),
+        "sw_version": coordinator.firmware,
     }
 
-    for sensor in BINARY_SENSOR_TYPES:
-        if REGISTERS[sensor][coordinator.kind]:
-            sensors.append(ThermiaBinarySensor(coordinator, sensor, device_info))
+    for meta in platform_metadata("binary_sensor", coordinator.kind):
+        if meta.name not in coordinator.unsupported:
+            sensors.append(ThermiaBinarySensor(coordinator, meta.name, device_info))
     async_add_entities(sensors, False)
 
 
 class ThermiaBinarySensor(BinarySensorEntity):
     """Define a Thermia generic sensor."""
 
+    _attr_should_poll = False
+
     def __init__(self, coordinator, kind, device_info):
         """Initialize."""
-        self._name = f"{BINARY_SENSOR_TYPES[kind][ATTR_LABEL]}"
-        # self._name = f"{coordinator.data[ATTR_MODEL]} {SENSOR_TYPES[kind][ATTR_LABEL]}"
-        self._unique_id = f"thermiagenesis_{kind}"
-        self._device_info = device_info
+        self.meta = register_metadata("binary_sensor")[kind]
+        # Static metadata is resolved once instead of on every state write
+        self._attr_name = self.meta.label
+        self._attr_unique_id = entity_unique_id(coordinator.entry_id, kind)
+        self._attr_device_info = device_info
+        self._attr_device_class = self.meta.device_class
+        self._attr_extra_state_attributes = {}
+        self._attr_entity_registry_enabled_default = self.meta.default_enabled
         self.coordinator = coordinator
         self.kind = kind
-        self._attrs = {}
-
-    @property
-    def name(self):
-        """Return the name."""
-        return self._name
 
     @property
     def is_on(self):
@@ -62,41 +59,16 @@ class ThermiaBinarySensor(BinarySensorEntity):
         return val
 
     @property
-    def device_class(self):
-        """Return the device class."""
-        if ATTR_CLASS not in BINARY_SENSOR_TYPES[self.kind]:
-            return None
-        return BINARY_SENSOR_TYPES[self.kind][ATTR_CLASS]
-
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes."""
-        return self._attrs
-
-    @property
-    def unique_id(self):
-        """Return a unique_id for this entity."""
-        return self._unique_id
+    def assumed_state(self):
+        """Return True while showing values restored from before a restart."""
+        return self.coordinator.stale
 
     @property
     def available(self):
         """Return True if entity is available."""
-        return self.coordinator.last_update_success
-
-    @property
-    def should_poll(self):
-        """Return the polling requirement of the entity."""
-        return False
-
-    @property
-    def device_info(self):
-        """Return the device info."""
-        return self._device_info
-
-    @property
-    def entity_registry_enabled_default(self):
-        """Return if the entity should be enabled when first added to the entity registry."""
-        return BINARY_SENSOR_TYPES[self.kind][ATTR_DEFAULT_ENABLED]
+        return self.coordinator.last_update_success and not (
+            self.coordinator.quarantine.excludes(self.kind)
+        )
 
     def async_write_ha_state(self):
         super().async_write_ha_state()
@@ -105,7 +77,7 @@ class ThermiaBinarySensor(BinarySensorEntity):
         self.coordinator.registerAttribute(self.kind)
         """Connect to dispatcher listening for entity data notifications."""
         self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.async_add_listener(self.async_write_ha_state, (self.kind,))
         )
 
     async def async_update(self):
@@ -0,0 +1,95 @@
+"""Fast polling and capture around ThermiaGenesis alarms."""
+from collections import deque
+from datetime import timedelta
+from functools import lru_cache
+
+from .const import HEATPUMP_ALARMS
+from .const import POLL_FAST
+from .const import POLL_NORMAL
+from .const import UNIT_TEMPERATURE
+from .metadata import platform_metadata
+
+# Poll interval and length of a burst after an alarm transition
+BURST_INTERVAL = timedelta(seconds=1)
+BURST_DURATION = timedelta(minutes=2)
+# Samples kept from before the alarm, at the normal poll rate
+PRE_SAMPLES = 12
+# Captures kept in memory for diagnostics
+MAX_CAPTURES = 5
+
+
+@lru_cache(maxsize=None)
+def burst_registers(kind):
+    """Return the temperature, pressure and compressor registers of a model.
+
+    This covers the registers of HEATPUMP_ATTRIBUTES that change during
+    operation, which are all sensor types as well.
+    """
+    return tuple(
+        meta.name
+        for meta in platform_metadata("sensor", kind)
+        if meta.poll_tier in (POLL_FAST, POLL_NORMAL)
+        and (meta.unit == UNIT_TEMPERATURE or meta.name.startswith("input_compressor"))
+    )
+
+
+class BurstRecorder:
+    """Record the burst registers around alarm transitions.
+
+    Every poll adds a sample. Outside a burst the samples go to a short ring
+    buffer, when one of the HEATPUMP_ALARMS flips a capture starts with that
+    buffer as the pre window and collects the samples polled at the burst
+    rate until the burst ends. Another flip during a burst extends it.
+    """
+
+    def __init__(self, kind):
+        """Initialize."""
+        self.registers = burst_registers(kind) + tuple(HEATPUMP_ALARMS)
+        self.captures = deque(maxlen=MAX_CAPTURES)
+        self.until = None
+        self._history = deque(maxlen=PRE_SAMPLES)
+        self._capture = None
+
+    def active(self, now):
+        """Return True while polling at the burst rate."""
+        return self.until is not None and now < self.until
+
+    def record(self, now, timestamp, data, transitions):
+        """Add a sample of the latest poll and start or end bursts.
+
+        transitions are the (metadata, active) alarm changes of the poll.
+        Returns True if the burst state changed.
+        """
+        started = False
+        for meta, active in transitions:
+            if meta.name not in HEATPUMP_ALARMS:
+                continue
+            if self._capture is None:
+                self._capture = {
+                    "alarm": meta.name,
+                    "active": active,
+                    "started": timestamp,
+                    "pre": list(self._history),
+                    "post": [],
+                }
+                self.captures.append(self._capture)
+                started = True
+            self.until = now + BURST_DURATION.total_seconds()
+
+        sample = {"time": timestamp}
+        for name in self.registers:
+            sample[name] = data.get(name)
+        if self._capture is None:
+            self._history.append(sample)
+            return False
+        self._capture["post"].append(sample)
+        if not self.active(now):
+            self._capture = None
+            self.until = None
+            self._history.clear()
+            return True
+        return started
+
+    def as_dict(self):
+        """Return the captures for diagnostics."""
+        return list(self.captures)
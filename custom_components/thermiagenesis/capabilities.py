@@ -0,0 +1,78 @@
+"""Find the registers a ThermiaGenesis heat pump actually answers for."""
+import logging
+
+from pythermiagenesis.const import ATTR_INPUT_SOFTWARE_VERSION_MAJOR
+from pythermiagenesis.const import ATTR_INPUT_SOFTWARE_VERSION_MICRO
+from pythermiagenesis.const import ATTR_INPUT_SOFTWARE_VERSION_MINOR
+from pythermiagenesis.const import REGISTERS
+
+from .connection import ModbusExceptionError
+from .connection import ModbusTimeoutError
+from .planner import plan_reads
+
+_LOGGER = logging.getLogger(__name__)
+
+CAPABILITIES_VERSION = 1
+FIRMWARE_REGISTERS = [
+    ATTR_INPUT_SOFTWARE_VERSION_MAJOR,
+    ATTR_INPUT_SOFTWARE_VERSION_MINOR,
+    ATTR_INPUT_SOFTWARE_VERSION_MICRO,
+]
+EXC_ILLEGAL_ADDRESS = 2
+EXC_ILLEGAL_VALUE = 3
+# Exception codes meaning the register isn't there
+UNSUPPORTED_CODES = {EXC_ILLEGAL_ADDRESS, EXC_ILLEGAL_VALUE}
+
+
+def model_registers(kind):
+    """Return every register the register map lists for a model."""
+    return [name for name, meta in REGISTERS.items() if meta[kind]]
+
+
+def firmware_version(values):
+    """Return the firmware version from the decoded FIRMWARE_REGISTERS."""
+    return ".".join(str(int(values[name])) for name in FIRMWARE_REGISTERS)
+
+
+def is_unsupported(error):
+    """Return True if a failed read means a register doesn't respond."""
+    if isinstance(error, ModbusExceptionError):
+        return error.code in UNSUPPORTED_CODES
+    return isinstance(error, ModbusTimeoutError)
+
+
+async def async_find_unsupported(
+    read, registers, kind, max_block=None, known=None, check=is_unsupported
+):
+    """Return the registers that fail to read, with the error they failed with.
+
+    The registers are read in planned blocks. A block failing with an error
+    check accepts, by default an illegal address, illegal value or timeout,
+    is split in two halves which are read again, until the failing registers
+    are isolated. Other errors are raised. Conditional registers are only
+    read if known enables them.
+    """
+    unsupported = {}
+    pending = [list(registers)]
+    requests = 0
+    while pending:
+        names = pending.pop()
+        for block in plan_reads(names, kind, known=known, max_block=max_block):
+            requests += 1
+            try:
+                await read(block)
+            except ConnectionError as error:
+                if not check(error):
+                    raise
+                slots = list(block.slots)
+                if len(slots) == 1:
+                    unsupported[slots[0]] = error
+                    continue
+                half = len(slots) // 2
+                pending.append(slots[:half])
+                pending.append(slots[half:])
+    _LOGGER.debug(
+        f"Probed {len(registers)} registers in {requests} requests, "
+        f"{len(unsupported)} don't respond"
+    )
+    return unsupported
@@ -23,8 +23,8 @@ from .const import ATTR_STATUS
 from .const import CLIMATE_TYPES
 from .const import DOMAIN
 from .const import KEY_STATUS_VALUE
+from .entity import entity_unique_id
 
-ATTR_FIRMWARE = "firmware"
 ATTR_MODEL = "Diplomat Inverter Duo"
 
 _LOGGER = logging.getLogger(__name__)
@@ -32,6 +32,23 @@ _LOGGER = logging.getLogger(__name__)
 SUPPORT_FLAGS = ClimateEntityFeature(0)
 
 
+def climate_registers(meta):
+    """Return the registers read by a climate entity."""
+    register_attr = []
+    if ATTR_TEMPERATURE in meta:
+        register_attr.append(meta[ATTR_TEMPERATURE])
+    if ATTR_CURRENT_TEMPERATURE in meta:
+        register_attr.append(meta[ATTR_CURRENT_TEMPERATURE])
+    if ATTR_TARGET_TEMP_HIGH in meta:
+        register_attr.append(meta[ATTR_TARGET_TEMP_HIGH])
+    if ATTR_TARGET_TEMP_LOW in meta:
+        register_attr.append(meta[ATTR_TARGET_TEMP_LOW])
+    if ATTR_ENABLED in meta:
+        register_attr.append(meta[ATTR_ENABLED])
+    register_attr.append(ATTR_STATUS)
+    return register_attr
+
+
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Add Thermia entities from a config_entry."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
@@ -39,15 +56,16 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     sensors = []
 
     device_info = {
-        "identifiers": {(DOMAIN, ATTR_MODEL)},
+        "identifiers": {(DOMAIN, config_entry.entry_id)},
         "name": ATTR_MODEL,
         "manufacturer": ATTR_MANUFACTURER,
         "model": ATTR_MODEL,
-        "sw_version": coordinator.data.get(ATTR_FIRMWARE),
+        "sw_version": coordinator.firmware,
     }
 
-    for sensor in CLIMATE_TYPES:
-        sensors.append(ThermiaClimateSensor(coordinator, sensor, device_info))
+    for sensor, meta in CLIMATE_TYPES.items():
+        if coordinator.unsupported.isdisjoint(climate_registers(meta)):
+            sensors.append(ThermiaClimateSensor(coordinator, sensor, device_info))
 
     async_add_entities(sensors, False)
 
@@ -63,7 +81,7 @@ class ThermiaClimateSensor(ClimateEntity):
         self.meta = CLIMATE_TYPES[kind]
         self._name = f"{self.meta[ATTR_LABEL]}"
         # self._name = f"{coordinator.data[ATTR_MODEL]} {SENSOR_TYPES[kind][ATTR_LABEL]}"
-        self._unique_id = f"thermiagenesis_{kind}"
+        self._unique_id = entity_unique_id(coordinator.entry_id, kind)
         self._device_info = device_info
         self.coordinator = coordinator
         self._hvac_mode = HVACAction.IDLE
@@ -147,6 +165,11 @@ class ThermiaClimateSensor(ClimateEntity):
         """Return a unique_id for this entity."""
         return self._unique_id
 
+    @property
+    def assumed_state(self):
+        """Return True while showing values restored from before a restart."""
+        return self.coordinator.stale
+
     @property
     def available(self):
         """Return True if entity is available."""
@@ -196,7 +219,7 @@ class ThermiaClimateSensor(ClimateEntity):
 
     async def async_set_hvac_mode(self, hvac_mode: str):
         """Set new target hvac mode."""
-        print(f"Set hvac mode {hvac_mode}")
+        _LOGGER.debug(f"Set hvac mode {hvac_mode}")
         if hvac_mode == HVACMode.OFF:
             await self.coordinator._async_set_data(self.meta[ATTR_ENABLED], False)
         if hvac_mode == HVACMode.AUTO:
@@ -212,21 +235,13 @@ class ThermiaClimateSensor(ClimateEntity):
         super().async_write_ha_state()
 
     async def async_added_to_hass(self):
-        register_attr = []
-        if ATTR_TEMPERATURE in self.meta:
-            register_attr.append(self.meta[ATTR_TEMPERATURE])
-        if ATTR_CURRENT_TEMPERATURE in self.meta:
-            register_attr.append(self.meta[ATTR_CURRENT_TEMPERATURE])
-        if ATTR_TARGET_TEMP_HIGH in self.meta:
-            register_attr.append(self.meta[ATTR_TARGET_TEMP_HIGH])
-        if ATTR_TARGET_TEMP_LOW in self.meta:
-            register_attr.append(self.meta[ATTR_TARGET_TEMP_LOW])
-        if ATTR_ENABLED in self.meta:
-            register_attr.append(self.meta[ATTR_ENABLED])
+        register_attr = climate_registers(self.meta)
         self.coordinator.registerAttribute(register_attr)
         """Connect to dispatcher listening for entity data notifications."""
         self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.async_add_listener(
+                self.async_write_ha_state, tuple(register_attr)
+            )
         )
 
     async def async_update(self):
@@ -235,8 +250,7 @@ class ThermiaClimateSensor(ClimateEntity):
 
     async def async_set_temperature(self, **kwargs):
         """Set new target temperature."""
-        print("Set temperature")
-        print(kwargs)
+        _LOGGER.debug(f"Set temperature {kwargs}")
         writes = {}
         if ATTR_TARGET_TEMP_LOW in kwargs:
             writes[self.meta[ATTR_TARGET_TEMP_LOW]] = kwargs[ATTR_TARGET_TEMP_LOW]
@@ -244,6 +258,5 @@ class ThermiaClimateSensor(ClimateEntity):
             writes[self.meta[ATTR_TARGET_TEMP_HIGH]] = kwargs[ATTR_TARGET_TEMP_HIGH]
         if ATTR_TEMPERATURE in kwargs:
             writes[self.meta[ATTR_TEMPERATURE]] = kwargs[ATTR_TEMPERATURE]
-        for i, (reg, val) in enumerate(writes.items()):
-            print(f"Write {reg} value {val}")
-            await self.coordinator._async_set_data(reg, val)
+        _LOGGER.debug(f"Write {writes}")
+        await self.coordinator._async_queue_set_data(writes)
@@ -1,5 +1,6 @@
 """Adds config flow for ThermiaGenesis heat pump."""
 import logging
+from functools import partial
 
 import voluptuous as vol
 from homeassistant import config_entries
@@ -7,17 +8,24 @@ from homeassistant.const import CONF_HOST
 from homeassistant.const import CONF_PORT
 from homeassistant.const import CONF_TYPE
 from homeassistant.helpers.selector import selector
-from pythermiagenesis import ThermiaConnectionError
-from pythermiagenesis import ThermiaGenesis
 from pythermiagenesis.const import ATTR_COIL_ENABLE_HEAT
 
+from .connection import ThermiaConnection
+from .const import CONF_NETWORK
+from .const import CONF_UNIT_ID
+from .const import DATA_GATEWAYS
+from .const import DEFAULT_UNIT_ID
 from .const import DOMAIN  # pylint:disable=unused-import
+from .discovery import async_scan
+from .planner import plan_reads
+from .scheduler import PRIORITY_READ
 
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST, default=""): str,
         vol.Required(CONF_PORT, default="502"): int,
         vol.Required(CONF_TYPE, default="inverter"): str,
+        vol.Required(CONF_UNIT_ID, default=DEFAULT_UNIT_ID): int,
     }
 )
 
@@ -28,12 +36,14 @@ _LOGGER = logging.getLogger(__name__)
 class ThermiaGenesisConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Porsche Connect."""
 
-    VERSION = 1
+    VERSION = 2
     CONNECTION_CLASS = config_entries.CONN_CLASS_LOCAL_POLL
 
     def __init__(self):
         """Initialize."""
         self._errors = {}
+        self._found = {}
+        self._port = None
 
     async def _validate_input(self, data):
         """Validate the user input allows us to connect.
@@ -41,20 +51,51 @@ class ThermiaGenesisConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
         """
 
-        thermia = ThermiaGenesis(
-            data[CONF_HOST],
-            data[CONF_PORT],
-            kind=data[CONF_TYPE],
+        unit_id = data.get(CONF_UNIT_ID, DEFAULT_UNIT_ID)
+        blocks = plan_reads([ATTR_COIL_ENABLE_HEAT], data[CONF_TYPE])
+        gateway = self.hass.data.get(DATA_GATEWAYS, {}).get(
+            (data[CONF_HOST], data[CONF_PORT])
         )
-        _LOGGER.debug("Attempt connect...")
-        await thermia.async_update(only_registers=[ATTR_COIL_ENABLE_HEAT])
-        return {"title": data[CONF_HOST] + ":" + str(data[CONF_PORT])}
+        if gateway is not None:
+            # Gateways often take a single session, so a unit behind one in use
+            # is checked through the open connection
+            _LOGGER.debug("Attempt read through the gateway in use...")
+            for block in blocks:
+                await gateway.scheduler.async_run(
+                    PRIORITY_READ, partial(self._async_read, gateway, block, unit_id)
+                )
+        else:
+            connection = ThermiaConnection(
+                self.hass, data[CONF_HOST], data[CONF_PORT], unit_id
+            )
+            _LOGGER.debug("Attempt connect...")
+            try:
+                await connection.async_ensure_open()
+                for block in blocks:
+                    await connection.async_read(block)
+            finally:
+                await connection.async_close()
+        title = data[CONF_HOST] + ":" + str(data[CONF_PORT])
+        if unit_id != DEFAULT_UNIT_ID:
+            title += f" unit {unit_id}"
+        return {"title": title}
+
+    @staticmethod
+    async def _async_read(gateway, block, unit_id):
+        """Read a block from a unit through a gateway in use."""
+        await gateway.connection.async_ensure_open()
+        return await gateway.connection.async_read(block, unit_id)
 
     async def _show_config_form(self, user_input):  # pylint: disable=unused-argument
         """Show the configuration form to edit location data."""
-        defaults = user_input or {CONF_HOST: "", CONF_PORT: 502, CONF_TYPE: "inverter"}
+        defaults = user_input or {
+            CONF_HOST: "",
+            CONF_PORT: 502,
+            CONF_TYPE: "inverter",
+            CONF_UNIT_ID: DEFAULT_UNIT_ID,
+        }
         return self.async_show_form(
-            step_id="user",
+            step_id="manual",
             data_schema=vol.Schema(
                 {
                     vol.Required(CONF_HOST, default=defaults[CONF_HOST]): str,
@@ -66,6 +107,10 @@ class ThermiaGenesisConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                             }
                         }
                     ),
+                    vol.Required(
+                        CONF_UNIT_ID,
+                        default=defaults.get(CONF_UNIT_ID, DEFAULT_UNIT_ID),
+                    ): int,
                 }
             ),
             errors=self._errors,
@@ -73,12 +118,31 @@ class ThermiaGenesisConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def async_step_user(self, user_input=None):
         """Handle the initial step."""
+        if user_input is not None:
+            return await self.async_step_manual(user_input)
+        return self.async_show_menu(step_id="user", menu_options=["manual", "scan"])
+
+    async def async_step_manual(self, user_input=None):
+        """Handle a heat pump entered by its address."""
         self._errors = {}
         if user_input is not None:
+            # Entries created before units were supported have no unit id
+            address = (
+                user_input[CONF_HOST],
+                user_input[CONF_PORT],
+                user_input.get(CONF_UNIT_ID, DEFAULT_UNIT_ID),
+            )
+            for entry in self._async_current_entries(include_ignore=False):
+                if address == (
+                    entry.data[CONF_HOST],
+                    entry.data[CONF_PORT],
+                    entry.data.get(CONF_UNIT_ID, DEFAULT_UNIT_ID),
+                ):
+                    return self.async_abort(reason="already_configured")
             try:
                 info = await self._validate_input(user_input)
                 return self.async_create_entry(title=info["title"], data=user_input)
-            except ThermiaConnectionError:
+            except ConnectionError:
                 _LOGGER.info("Connect error")
                 self._errors["base"] = "connection_error"
             except ValueError:
@@ -91,6 +155,67 @@ class ThermiaGenesisConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return await self._show_config_form(user_input)
 
+    async def async_step_scan(self, user_input=None):
+        """Search a network for heat pumps."""
+        self._errors = {}
+        if user_input is not None:
+            try:
+                found = await async_scan(
+                    self.hass, user_input[CONF_NETWORK], user_input[CONF_PORT]
+                )
+            except ValueError:
+                self._errors[CONF_NETWORK] = "invalid_network"
+            else:
+                configured = {
+                    (entry.data[CONF_HOST], entry.data[CONF_PORT])
+                    for entry in self._async_current_entries()
+                    if entry.data.get(CONF_UNIT_ID, DEFAULT_UNIT_ID) == DEFAULT_UNIT_ID
+                }
+                self._found = {
+                    host: kind
+                    for host, kind in found.items()
+                    if (host, user_input[CONF_PORT]) not in configured
+                }
+                self._port = user_input[CONF_PORT]
+                if self._found:
+                    return await self.async_step_select()
+                self._errors["base"] = "no_devices_found"
+
+        defaults = user_input or {CONF_NETWORK: "", CONF_PORT: 502}
+        return self.async_show_form(
+            step_id="scan",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_NETWORK, default=defaults[CONF_NETWORK]): str,
+                    vol.Required(CONF_PORT, default=defaults[CONF_PORT]): int,
+                }
+            ),
+            errors=self._errors,
+        )
+
+    async def async_step_select(self, user_input=None):
+        """Pick one of the heat pumps found."""
+        if user_input is not None:
+            host = user_input[CONF_HOST]
+            data = {
+                CONF_HOST: host,
+                CONF_PORT: self._port,
+                CONF_TYPE: self._found[host],
+                CONF_UNIT_ID: DEFAULT_UNIT_ID,
+            }
+            return self.async_create_entry(title=f"{host}:{self._port}", data=data)
+
+        return self.async_show_form(
+            step_id="select",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_HOST): vol.In(
+                        {host: f"{host} ({kind})" for host, kind in self._found.items()}
+                    ),
+                }
+            ),
+        )
+
 
 # class ThermiaGenesisConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 #     """Handle a config flow for ThermiaGenesis heat pump."""
@@ -0,0 +1,167 @@
+"""Long lived Modbus TCP connection to a ThermiaGenesis heat pump."""
+import logging
+import random
+import time
+
+from pyModbusTCP.client import ModbusClient
+from pyModbusTCP.constants import MB_EXCEPT_ERR
+from pyModbusTCP.constants import MB_TIMEOUT_ERR
+from pythermiagenesis.const import ATTR_INPUT_FIRST_PRIORITISED_DEMAND
+from pythermiagenesis.const import KEY_ADDRESS
+from pythermiagenesis.const import REG_COIL
+from pythermiagenesis.const import REG_DISCRETE_INPUT
+from pythermiagenesis.const import REG_HOLDING
+from pythermiagenesis.const import REG_INPUT
+from pythermiagenesis.const import REGISTERS
+
+_LOGGER = logging.getLogger(__name__)
+
+CONNECT_TIMEOUT = 5
+# Probe the connection before use when it has been idle for this long
+PROBE_IDLE_TIME = 60
+PROBE_ADDRESS = REGISTERS[ATTR_INPUT_FIRST_PRIORITISED_DEMAND][KEY_ADDRESS]
+BACKOFF_BASE = 2
+BACKOFF_MAX = 300
+
+
+class ModbusTimeoutError(ConnectionError):
+    """The heat pump did not answer in time."""
+
+
+class ModbusExceptionError(ConnectionError):
+    """The heat pump answered with a Modbus exception response."""
+
+    def __init__(self, message, code):
+        """Initialize."""
+        super().__init__(message)
+        self.code = code
+
+
+class ThermiaConnection:
+    """Hold one Modbus TCP connection open between polls and writes.
+
+    Behind an RTU-to-TCP gateway the connection is shared by several units,
+    reads and writes then name the unit they address.
+    """
+
+    def __init__(self, hass, host, port, unit_id=1, timeout=CONNECT_TIMEOUT):
+        """Initialize."""
+        self.hass = hass
+        self.host = host
+        self.port = port
+        self.unit_id = unit_id
+        self._client = ModbusClient(host, port=port, unit_id=unit_id, timeout=timeout)
+        self._last_io = None
+        self._failures = 0
+        self._retry_at = 0
+
+    @property
+    def is_open(self):
+        """Return True if the socket is open."""
+        return self._client.is_open()
+
+    async def async_ensure_open(self):
+        """Make sure there is a healthy connection, reconnecting if needed."""
+        now = time.monotonic()
+        if self._client.is_open():
+            if self._last_io is not None and now - self._last_io < PROBE_IDLE_TIME:
+                return
+            if await self.hass.async_add_executor_job(self._probe):
+                return
+            _LOGGER.info(
+                f"Connection to {self.host}:{self.port} is stale, reconnecting"
+            )
+            await self.async_close()
+
+        if now < self._retry_at:
+            raise ConnectionError(
+                f"Waiting {self._retry_at - now:.0f} s before reconnecting to "
+                f"{self.host}:{self.port}"
+            )
+        _LOGGER.info(
+            "Attempting to open a Modbus TCP connection to %s:%s", self.host, self.port
+        )
+        if not await self.hass.async_add_executor_job(self._client.open):
+            self._failures += 1
+            self._retry_at = now + self._backoff()
+            raise ConnectionError(f"Failed to connect to {self.host}:{self.port}")
+        self._failures = 0
+        self._retry_at = 0
+        self._last_io = time.monotonic()
+
+    async def async_close(self):
+        """Close the connection."""
+        self._last_io = None
+        await self.hass.async_add_executor_job(self._client.close)
+
+    async def async_read(self, block, unit_id=None):
+        """Read a planned block and return the raw values."""
+        return await self.hass.async_add_executor_job(
+            self._read_block, block, unit_id or self.unit_id
+        )
+
+    async def async_write(self, block, unit_id=None):
+        """Write a planned block of coils or holding registers."""
+        await self.hass.async_add_executor_job(
+            self._write_block, block, unit_id or self.unit_id
+        )
+
+    def _backoff(self):
+        """Return a jittered exponential delay before the next reconnect."""
+        delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (self._failures - 1))
+        return delay * random.uniform(0.5, 1.5)
+
+    def _probe(self):
+        """Check that the device still answers on the open socket."""
+        return self._client.read_input_registers(PROBE_ADDRESS, 1) is not None
+
+    def _check(self, result, what):
+        if result is None:
+            error = self._client.last_error()
+            message = (
+                f"Failed to {what}: {self._client.last_error_txt()} "
+                f"({self._client.last_except_txt()})"
+            )
+            if error == MB_TIMEOUT_ERR:
+                raise ModbusTimeoutError(message)
+            if error == MB_EXCEPT_ERR:
+                raise ModbusExceptionError(message, self._client.last_except())
+            raise ConnectionError(message)
+        self._last_io = time.monotonic()
+        return result
+
+    def _read_block(self, block, unit_id):
+        self._client.unit_id(unit_id)
+        if block.reg_type == REG_COIL:
+            values = self._client.read_coils(block.start, block.count)
+        elif block.reg_type == REG_DISCRETE_INPUT:
+            values = self._client.read_discrete_inputs(block.start, block.count)
+        elif block.reg_type == REG_INPUT:
+            values = self._client.read_input_registers(block.start, block.count)
+        elif block.reg_type == REG_HOLDING:
+            values = self._client.read_holding_registers(block.start, block.count)
+        return self._check(
+            values, f"read {block.reg_type} {block.start} length {block.count}"
+        )
+
+    def _write_block(self, block, unit_id):
+        self._client.unit_id(unit_id)
+        if block.reg_type == REG_COIL:
+            if block.count == 1:
+                result = self._client.write_single_coil(block.start, block.values[0])
+            else:
+                result = self._client.write_multiple_coils(block.start, block.values)
+        elif block.reg_type == REG_HOLDING:
+            if block.count == 1:
+                result = self._client.write_single_register(
+                    block.start, block.values[0]
+                )
+            else:
+                result = self._client.write_multiple_registers(
+                    block.start, block.values
+                )
+        else:
+            raise ValueError(f"Can not write to {block.reg_type} registers")
+        return self._check(
+            result or None, f"write {block.reg_type} {block.start} length {block.count}"
+        )
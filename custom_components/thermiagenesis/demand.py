@@ -0,0 +1,61 @@
+"""Demand-aware poll rates for ThermiaGenesis heat pumps."""
+from functools import lru_cache
+
+from pythermiagenesis.const import ATTR_INPUT_COMPRESSOR_CURRENT_GEAR
+
+from .const import HEATPUMP_SENSOR
+from .const import POLL_FAST
+from .const import POLL_NORMAL
+from .metadata import platform_metadata
+
+# Prioritised demands during which the compressor is not running
+IDLE_DEMANDS = {"OFF", "Standby", "No demand"}
+# Tier of the demand registers while idle
+IDLE_TIER = POLL_NORMAL
+DEMAND_WORDS = ("compressor", "brine", "supply")
+
+
+@lru_cache(maxsize=None)
+def demand_registers(kind):
+    """Return the fast compressor, brine and supply registers of a model.
+
+    The demand and the current gear drive the policy and keep their tier.
+    """
+    return frozenset(
+        meta.name
+        for meta in platform_metadata("sensor", kind)
+        if meta.poll_tier == POLL_FAST
+        and meta.name != ATTR_INPUT_COMPRESSOR_CURRENT_GEAR
+        and any(word in meta.name for word in DEMAND_WORDS)
+    )
+
+
+class DemandPolicy:
+    """Slow down the demand registers while the heat pump is idle.
+
+    Idle is decided from HEATPUMP_SENSOR, an unknown demand counts as active.
+    Leaving idle or a gear change means the demand registers should be read
+    right away rather than when their tier is due.
+    """
+
+    def __init__(self, kind):
+        """Initialize."""
+        self.registers = demand_registers(kind)
+        self.idle = False
+        self._gear = None
+
+    def tier(self, name, tier):
+        """Return the tier a register is polled at under the current demand."""
+        if self.idle and name in self.registers:
+            return IDLE_TIER
+        return tier
+
+    def update(self, data):
+        """Track the latest data, return True if the demand picked up."""
+        idle = data.get(HEATPUMP_SENSOR) in IDLE_DEMANDS
+        gear = data.get(ATTR_INPUT_COMPRESSOR_CURRENT_GEAR)
+        woke = self.idle and not idle
+        shifted = self._gear is not None and gear != self._gear
+        self.idle = idle
+        self._gear = gear
+        return woke or shifted
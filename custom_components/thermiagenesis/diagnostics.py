@@ -0,0 +1,28 @@
+"""Diagnostics support for ThermiaGenesis."""
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_HOST
+
+from .const import DOMAIN
+
+TO_REDACT = {CONF_HOST}
+
+
+async def async_get_config_entry_diagnostics(hass, config_entry):
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    return {
+        "entry": async_redact_data(dict(config_entry.data), TO_REDACT),
+        "kind": coordinator.kind,
+        "unit_id": coordinator.unit_id,
+        "firmware": coordinator.firmware,
+        "unsupported": sorted(coordinator.unsupported),
+        "quarantine": coordinator.quarantine.as_dict(),
+        "gateway_units": sorted(coordinator.gateway.units),
+        "registered_attributes": len(coordinator.attributes),
+        "stale": coordinator.stale,
+        "idle": coordinator.demand.idle,
+        "poll_group": coordinator.poll_group.as_dict(),
+        "tuning": coordinator.tuner.as_dict(),
+        "metrics": coordinator.metrics.as_dict(),
+        "alarm_captures": coordinator.burst.as_dict(),
+    }
@@ -0,0 +1,102 @@
+"""Search a network for ThermiaGenesis heat pumps."""
+import asyncio
+import ipaddress
+import logging
+from contextlib import suppress
+from functools import lru_cache
+
+from pythermiagenesis.const import ATTR_COIL_ENABLE_HEAT
+from pythermiagenesis.const import KEY_ADDRESS
+from pythermiagenesis.const import KEY_REG_TYPE
+from pythermiagenesis.const import REGISTER_RANGES
+from pythermiagenesis.const import REGISTERS
+
+from .connection import ModbusExceptionError
+from .connection import ThermiaConnection
+from .const import DEFAULT_UNIT_ID
+from .const import MODEL_INVERTER
+from .const import MODEL_MEGA
+from .planner import plan_reads
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds to wait for a host to accept a connection or answer a request
+SCAN_TIMEOUT = 1
+# Hosts probed at the same time
+SCAN_PARALLEL = 32
+# Refuse to search networks larger than a /22
+MAX_HOSTS = 1024
+
+
+@lru_cache(maxsize=None)
+def mega_fingerprint():
+    """Return a Mega register at an address where an Inverter has none.
+
+    An Inverter answers a read of it with an illegal address exception.
+    """
+    for name, meta in REGISTERS.items():
+        if not meta[MODEL_MEGA] or meta[MODEL_INVERTER]:
+            continue
+        ranges = REGISTER_RANGES[MODEL_INVERTER][meta[KEY_REG_TYPE]]
+        if not any(first <= meta[KEY_ADDRESS] <= last for first, last in ranges):
+            return name
+    return None
+
+
+async def async_identify(hass, host, port, unit_id=DEFAULT_UNIT_ID):
+    """Return the model of the heat pump at host, None if there is none."""
+    connection = ThermiaConnection(hass, host, port, unit_id, timeout=SCAN_TIMEOUT)
+    try:
+        await connection.async_ensure_open()
+        # Both models have this register
+        for block in plan_reads([ATTR_COIL_ENABLE_HEAT], MODEL_INVERTER):
+            await connection.async_read(block)
+        try:
+            for block in plan_reads([mega_fingerprint()], MODEL_MEGA):
+                await connection.async_read(block)
+        except ModbusExceptionError:
+            return MODEL_INVERTER
+        return MODEL_MEGA
+    except ConnectionError as error:
+        _LOGGER.debug(f"No heat pump at {host}:{port}: {error}")
+        return None
+    finally:
+        await connection.async_close()
+
+
+async def _async_port_open(host, port):
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port), SCAN_TIMEOUT
+        )
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    with suppress(OSError):
+        await writer.wait_closed()
+    return True
+
+
+async def async_scan(hass, network, port):
+    """Return the model of every heat pump found in a network by host.
+
+    Hosts are first checked for an open port without using an executor
+    thread, only those accepting connections are identified over Modbus.
+    Raises ValueError for an invalid or too large network.
+    """
+    addresses = ipaddress.ip_network(network, strict=False)
+    # Checked before listing the hosts, a large network would exhaust memory
+    if addresses.num_addresses > MAX_HOSTS:
+        raise ValueError(f"{network} has more than {MAX_HOSTS} hosts")
+    hosts = list(addresses.hosts())
+    semaphore = asyncio.Semaphore(SCAN_PARALLEL)
+
+    async def probe(host):
+        async with semaphore:
+            if not await _async_port_open(host, port):
+                return None
+            return await async_identify(hass, host, port)
+
+    _LOGGER.debug(f"Searching {len(hosts)} hosts in {network} for heat pumps")
+    models = await asyncio.gather(*(probe(str(host)) for host in hosts))
+    return {str(host): model for host, model in zip(hosts, models) if model is not None}
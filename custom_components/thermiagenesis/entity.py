@@ -8,11 +8,21 @@ from .const import ATTR_MANUFACTURER
 from .const import DOMAIN
 
 ATTR_MODEL = "Diplomat Inverter Duo"
-ATTR_FIRMWARE = "firmware"
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
 
+def entity_unique_id(entry_id, key):
+    """Return the unique id of an entity of a config entry.
+
+    Ids without an entry are the ones used before several heat pumps could
+    be set up.
+    """
+    if entry_id is None:
+        return f"thermiagenesis_{key}"
+    return f"thermiagenesis_{entry_id}_{key}"
+
+
 class ThermiaGenesisEntity(CoordinatorEntity):
     def __init__(self, coordinator, config_entry, kind, meta=None):
         super().__init__(coordinator)
@@ -28,11 +38,11 @@ class ThermiaGenesisEntity(CoordinatorEntity):
     @property
     def device_info(self):
         return {
-            "identifiers": {(DOMAIN, ATTR_MODEL)},
+            "identifiers": {(DOMAIN, self.config_entry.entry_id)},
             "name": ATTR_MODEL,
             "manufacturer": ATTR_MANUFACTURER,
             "model": ATTR_MODEL,
-            "sw_version": self.coordinator.data.get(ATTR_FIRMWARE),
+            "sw_version": self.coordinator.firmware,
         }
 
     @property
@@ -64,11 +74,11 @@ class HeatpumpEntity(CoordinatorEntity):
     @property
     def device_info(self):
         return {
-            "identifiers": {(DOMAIN, ATTR_MODEL)},
+            "identifiers": {(DOMAIN, self.config_entry.entry_id)},
             "name": ATTR_MODEL,
             "manufacturer": ATTR_MANUFACTURER,
             "model": ATTR_MODEL,
-            "sw_version": self.coordinator.data.get(ATTR_FIRMWARE),
+            "sw_version": self.coordinator.firmware,
         }
 
     @property
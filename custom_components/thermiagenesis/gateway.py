@@ -0,0 +1,52 @@
+"""Modbus TCP endpoints shared by the ThermiaGenesis units behind them."""
+import logging
+
+from .connection import ThermiaConnection
+from .const import DATA_GATEWAYS
+from .scheduler import RequestScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class Gateway:
+    """One connection and request queue for every unit at a host and port.
+
+    Several heat pumps behind an RTU-to-TCP gateway are told apart by their
+    unit id. Sharing the connection and the queue keeps the gateway to one
+    TCP session and one request at a time.
+    """
+
+    def __init__(self, hass, host, port, unit_id=1):
+        """Initialize."""
+        self.hass = hass
+        self.key = (host, port)
+        self.connection = ThermiaConnection(hass, host, port, unit_id)
+        self.scheduler = RequestScheduler(hass, f"{host}:{port}")
+        self.units = set()
+
+    def add(self, unit_id):
+        """Add a unit using the gateway."""
+        self.units.add(unit_id)
+
+    async def async_release(self, unit_id):
+        """Remove a unit, closing the gateway once no unit uses it."""
+        self.units.discard(unit_id)
+        if self.units:
+            return
+        gateways = self.hass.data.get(DATA_GATEWAYS, {})
+        if gateways.get(self.key) is self:
+            del gateways[self.key]
+        await self.scheduler.async_stop()
+        await self.connection.async_close()
+
+
+def async_get_gateway(hass, host, port, unit_id=1):
+    """Return the gateway for a host and port, creating it on first use."""
+    gateways = hass.data.setdefault(DATA_GATEWAYS, {})
+    gateway = gateways.get((host, port))
+    if gateway is None:
+        gateway = gateways[(host, port)] = Gateway(hass, host, port, unit_id)
+    else:
+        _LOGGER.debug(f"Sharing the connection to {host}:{port} with unit {unit_id}")
+    gateway.add(unit_id)
+    return gateway
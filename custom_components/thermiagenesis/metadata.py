@@ -0,0 +1,96 @@
+"""Compiled register metadata for the ThermiaGenesis platforms."""
+from collections import namedtuple
+from functools import lru_cache
+
+from pythermiagenesis.const import KEY_ADDRESS
+from pythermiagenesis.const import KEY_DATATYPE
+from pythermiagenesis.const import KEY_REG_TYPE
+from pythermiagenesis.const import KEY_SCALE
+from pythermiagenesis.const import REGISTERS
+
+from .const import ATTR_CLASS
+from .const import ATTR_DEFAULT_ENABLED
+from .const import ATTR_ICON
+from .const import ATTR_LABEL
+from .const import ATTR_MAX_VALUE
+from .const import ATTR_MIN_VALUE
+from .const import ATTR_POLL_TIER
+from .const import ATTR_STATE_CLASS
+from .const import ATTR_UNIT
+from .const import BINARY_SENSOR_TYPES
+from .const import NUMBER_TYPES
+from .const import POLL_NORMAL
+from .const import SENSOR_TYPES
+from .const import SWITCH_TYPES
+
+PLATFORM_TYPES = {
+    "sensor": SENSOR_TYPES,
+    "binary_sensor": BINARY_SENSOR_TYPES,
+    "number": NUMBER_TYPES,
+    "switch": SWITCH_TYPES,
+}
+
+# Immutable, slotted record of everything static about a register entity
+RegisterMeta = namedtuple(
+    "RegisterMeta",
+    [
+        "name",
+        "platform",
+        "reg_type",
+        "address",
+        "datatype",
+        "scale",
+        "label",
+        "icon",
+        "unit",
+        "device_class",
+        "state_class",
+        "default_enabled",
+        "poll_tier",
+        "min_value",
+        "max_value",
+    ],
+)
+
+
+def _compile(platform, name, meta):
+    register = REGISTERS[name]
+    return RegisterMeta(
+        name=name,
+        platform=platform,
+        reg_type=register[KEY_REG_TYPE],
+        address=register[KEY_ADDRESS],
+        datatype=register[KEY_DATATYPE],
+        scale=register[KEY_SCALE],
+        label=meta[ATTR_LABEL],
+        icon=meta.get(ATTR_ICON),
+        unit=meta.get(ATTR_UNIT),
+        device_class=meta.get(ATTR_CLASS),
+        state_class=meta.get(ATTR_STATE_CLASS),
+        default_enabled=meta[ATTR_DEFAULT_ENABLED],
+        poll_tier=meta.get(ATTR_POLL_TIER, POLL_NORMAL),
+        min_value=meta.get(ATTR_MIN_VALUE),
+        max_value=meta.get(ATTR_MAX_VALUE),
+    )
+
+
+@lru_cache(maxsize=None)
+def register_metadata(platform):
+    """Return the compiled metadata of a platform by register name.
+
+    The table is built on first use and shared afterwards.
+    """
+    return {
+        name: _compile(platform, name, meta)
+        for name, meta in PLATFORM_TYPES[platform].items()
+    }
+
+
+@lru_cache(maxsize=None)
+def platform_metadata(platform, kind):
+    """Return the compiled metadata of the registers a model has."""
+    return tuple(
+        meta
+        for meta in register_metadata(platform).values()
+        if REGISTERS[meta.name][kind]
+    )
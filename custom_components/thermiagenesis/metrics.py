@@ -0,0 +1,186 @@
+"""Modbus request statistics for ThermiaGenesis diagnostics."""
+import math
+
+from .connection import ModbusExceptionError
+from .connection import ModbusTimeoutError
+from .const import DIAGNOSTIC_BYTES
+from .const import DIAGNOSTIC_FAILURES
+from .const import DIAGNOSTIC_POLL_DURATION
+from .const import DIAGNOSTIC_REQUESTS
+from .planner import BIT_TYPES
+
+# Upper bounds of the latency histogram buckets in milliseconds
+LATENCY_BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# MBAP header including the unit id
+MBAP_SIZE = 7
+EXCEPTION_RESPONSE_SIZE = MBAP_SIZE + 2
+
+
+def payload_size(reg_type, count):
+    """Return the number of data bytes for count addresses."""
+    if reg_type in BIT_TYPES:
+        return math.ceil(count / 8)
+    return count * 2
+
+
+def read_sizes(block):
+    """Return the request and response size of a block read in bytes."""
+    return MBAP_SIZE + 5, MBAP_SIZE + 2 + payload_size(block.reg_type, block.count)
+
+
+def write_sizes(block):
+    """Return the request and response size of a block write in bytes."""
+    if block.count == 1:
+        return MBAP_SIZE + 5, MBAP_SIZE + 5
+    return MBAP_SIZE + 6 + payload_size(block.reg_type, block.count), MBAP_SIZE + 5
+
+
+class LatencyHistogram:
+    """Count latencies in fixed buckets."""
+
+    def __init__(self):
+        """Initialize."""
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, latency):
+        """Add a latency in seconds."""
+        latency_ms = latency * 1000
+        index = 0
+        while index < len(LATENCY_BUCKETS) and latency_ms > LATENCY_BUCKETS[index]:
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.total += latency_ms
+        self.max = max(self.max, latency_ms)
+
+    def as_dict(self):
+        """Return the histogram for diagnostics."""
+        buckets = {f"<={bound}ms": n for bound, n in zip(LATENCY_BUCKETS, self.counts)}
+        buckets[f">{LATENCY_BUCKETS[-1]}ms"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count, 2) if self.count else None,
+            "max_ms": round(self.max, 2),
+            "buckets": buckets,
+        }
+
+
+class ModbusMetrics:
+    """Collect latencies, failures and traffic of the Modbus requests.
+
+    Reads are tracked per block and writes per written block. Failures are
+    counted against every register the failing request covered, so the
+    registers that make a poll slow or fail stand out.
+    """
+
+    def __init__(self):
+        """Initialize."""
+        self.reads = {}
+        self.writes = {}
+        self.polls = LatencyHistogram()
+        self.last_poll = None
+        self.registers = {}
+        self.requests = 0
+        self.failures = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self._failed = set()
+
+    @property
+    def bytes(self):
+        """Return the number of bytes sent and received."""
+        return self.bytes_sent + self.bytes_received
+
+    def record_poll(self, duration):
+        """Record the duration of a poll in seconds."""
+        self.last_poll = duration
+        self.polls.observe(duration)
+
+    def record_read(self, block, latency):
+        """Record a successful block read."""
+        self._record(self.reads, block, latency, read_sizes(block))
+        self._succeeded(block.slots)
+
+    def record_write(self, block, latency):
+        """Record a successful block write."""
+        self._record(self.writes, block, latency, write_sizes(block))
+        self._succeeded(block.names)
+
+    def record_failure(self, names, error, sizes):
+        """Record a failed request covering the given registers."""
+        self.requests += 1
+        self.failures += 1
+        if isinstance(error, ModbusTimeoutError):
+            self.bytes_sent += sizes[0]
+            counter = "timeouts"
+        elif isinstance(error, ModbusExceptionError):
+            self.bytes_sent += sizes[0]
+            self.bytes_received += EXCEPTION_RESPONSE_SIZE
+            counter = "exceptions"
+        else:
+            counter = "errors"
+        for name in names:
+            stats = self._register(name)
+            if name in self._failed:
+                stats["retries"] += 1
+            if counter == "exceptions":
+                stats[counter][error.code] = stats[counter].get(error.code, 0) + 1
+            else:
+                stats[counter] += 1
+            self._failed.add(name)
+
+    def value(self, key):
+        """Return the value shown by a diagnostic sensor."""
+        if key == DIAGNOSTIC_POLL_DURATION:
+            if self.last_poll is None:
+                return None
+            return round(self.last_poll * 1000)
+        if key == DIAGNOSTIC_REQUESTS:
+            return self.requests
+        if key == DIAGNOSTIC_FAILURES:
+            return self.failures
+        if key == DIAGNOSTIC_BYTES:
+            return self.bytes
+        return None
+
+    def as_dict(self):
+        """Return the statistics for diagnostics."""
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "polls": self.polls.as_dict(),
+            "reads": {key: hist.as_dict() for key, hist in self.reads.items()},
+            "writes": {key: hist.as_dict() for key, hist in self.writes.items()},
+            "registers": self.registers,
+        }
+
+    def _record(self, histograms, block, latency, sizes):
+        self.requests += 1
+        self.bytes_sent += sizes[0]
+        self.bytes_received += sizes[1]
+        key = f"{block.reg_type} {block.start}-{block.start + block.count - 1}"
+        if key not in histograms:
+            histograms[key] = LatencyHistogram()
+        histograms[key].observe(latency)
+
+    def _register(self, name):
+        if name not in self.registers:
+            self.registers[name] = {
+                "retries": 0,
+                "timeouts": 0,
+                "errors": 0,
+                "exceptions": {},
+            }
+        return self.registers[name]
+
+    def _succeeded(self, names):
+        for name in names:
+            if name in self._failed:
+                self._failed.discard(name)
+                self.registers[name]["retries"] += 1
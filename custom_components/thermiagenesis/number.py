@@ -3,20 +3,14 @@ import logging
 from homeassistant.components.number import NumberEntity
 from homeassistant.const import PERCENTAGE
 from homeassistant.const import UnitOfTemperature
-from pythermiagenesis.const import REGISTERS
 
-from .const import ATTR_DEFAULT_ENABLED
-from .const import ATTR_ICON
-from .const import ATTR_LABEL
 from .const import ATTR_MANUFACTURER
-from .const import ATTR_MAX_VALUE
-from .const import ATTR_MIN_VALUE
-from .const import ATTR_UNIT
 from .const import DOMAIN
-from .const import NUMBER_TYPES
+from .entity import entity_unique_id
+from .metadata import platform_metadata
+from .metadata import register_metadata
 
 ATTR_COUNTER = "counter"
-ATTR_FIRMWARE = "firmware"
 ATTR_MODEL = "Diplomat Inverter Duo"
 
 _LOGGER = logging.getLogger(__name__)
@@ -29,16 +23,16 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     numbers = []
 
     device_info = {
-        "identifiers": {(DOMAIN, ATTR_MODEL)},
+        "identifiers": {(DOMAIN, config_entry.entry_id)},
         "name": ATTR_MODEL,
         "manufacturer": ATTR_MANUFACTURER,
         "model": ATTR_MODEL,
-        "sw_version": coordinator.data.get(ATTR_FIRMWARE),
+        "sw_version": coordinator.firmware,
     }
 
-    for number in NUMBER_TYPES:
-        if REGISTERS[number][coordinator.kind]:
-            numbers.append(ThermiaGenericNumber(coordinator, number, device_info))
+    for meta in platform_metadata("number", coordinator.kind):
+        if meta.name not in coordinator.unsupported:
+            numbers.append(ThermiaGenericNumber(coordinator, meta.name, device_info))
     async_add_entities(numbers, False)
 
 
@@ -53,86 +47,54 @@ def range_for_unit(unit):
 class ThermiaGenericNumber(NumberEntity):
     """Define a Thermia generic sensor."""
 
+    _attr_should_poll = False
+    _attr_native_step = 1
+
     def __init__(self, coordinator, kind, device_info):
         """Initialize."""
-        self._name = f"{NUMBER_TYPES[kind][ATTR_LABEL]}"
-        # self._name = f"{coordinator.data[ATTR_MODEL]} {SENSOR_TYPES[kind][ATTR_LABEL]}"
-        self._unique_id = f"thermiagenesis_{kind}"
-        self._device_info = device_info
+        self.meta = register_metadata("number")[kind]
+        # Static metadata is resolved once instead of on every state write
+        self._attr_name = self.meta.label
+        self._attr_unique_id = entity_unique_id(coordinator.entry_id, kind)
+        self._attr_device_info = device_info
+        self._attr_icon = self.meta.icon
+        self._attr_native_unit_of_measurement = self.meta.unit
+        self._attr_entity_registry_enabled_default = self.meta.default_enabled
+        range = range_for_unit(self.meta.unit)
+        self._attr_native_min_value = (
+            range[0] if self.meta.min_value is None else self.meta.min_value
+        )
+        self._attr_native_max_value = (
+            range[1] if self.meta.max_value is None else self.meta.max_value
+        )
         self.coordinator = coordinator
         self.kind = kind
-        meta = NUMBER_TYPES[kind]
-        range = range_for_unit(meta.get(ATTR_UNIT, None))
-        self.min = meta.get(ATTR_MIN_VALUE, range[0])
-        self.max = meta.get(ATTR_MAX_VALUE, range[1])
-        self._attrs = {}
-
-    @property
-    def name(self):
-        """Return the name."""
-        return self._name
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
         return self.coordinator.data.get(self.kind)
 
-    @property
-    def native_min_value(self):
-        """Return the state of the sensor."""
-        return self.min
-
-    @property
-    def native_max_value(self):
-        """Return the state of the sensor."""
-        return self.max
-
-    @property
-    def native_step(self):
-        """Return the state of the sensor."""
-        return 1
-
     async def async_set_native_value(self, value: float) -> None:
         """Change the selected option."""
         _LOGGER.info("Writing holding register %s value %s", self.kind, value)
-        await self.coordinator._async_set_data(self.kind, value)
+        await self.coordinator._async_queue_set_data({self.kind: value})
         _LOGGER.debug("Done writing")
-        self.async_schedule_update_ha_state()
 
     @property
-    def native_unit_of_measurement(self):
-        """Return the unit the value is expressed in."""
-        return NUMBER_TYPES[self.kind].get(ATTR_UNIT, None)
-
-    @property
-    def icon(self):
-        """Return the icon."""
-        return NUMBER_TYPES[self.kind][ATTR_ICON]
-
-    @property
-    def unique_id(self):
-        """Return a unique_id for this entity."""
-        return self._unique_id
-
-    @property
-    def device_info(self):
-        """Return the device info."""
-        return self._device_info
+    def assumed_state(self):
+        """Return True while showing values restored from before a restart."""
+        return self.coordinator.stale
 
     def async_write_ha_state(self):
         super().async_write_ha_state()
 
-    @property
-    def entity_registry_enabled_default(self):
-        """Return if the entity should be enabled when first added to the entity registry."""
-        return NUMBER_TYPES[self.kind][ATTR_DEFAULT_ENABLED]
-
     async def async_added_to_hass(self):
         await super().async_added_to_hass()
         """Connect to dispatcher listening for entity data notifications."""
         self.coordinator.registerAttribute(self.kind)
         self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.async_add_listener(self.async_write_ha_state, (self.kind,))
         )
 
     async def async_update(self):
@@ -0,0 +1,240 @@
+"""Read planner that coalesces register reads into Modbus block requests."""
+import logging
+
+from pyModbusTCP.utils import word_list_to_long
+from pythermiagenesis.const import ATTR_COIL_ENABLE_FIXED_SYSTEM_SUPPLY_SET_POINT
+from pythermiagenesis.const import ATTR_HOLDING_FIXED_SYSTEM_SUPPLY_SET_POINT
+from pythermiagenesis.const import KEY_ADDRESS
+from pythermiagenesis.const import KEY_DATATYPE
+from pythermiagenesis.const import KEY_REG_TYPE
+from pythermiagenesis.const import KEY_SCALE
+from pythermiagenesis.const import REG_COIL
+from pythermiagenesis.const import REG_DISCRETE_INPUT
+from pythermiagenesis.const import REG_HOLDING
+from pythermiagenesis.const import REG_INPUT
+from pythermiagenesis.const import REG_TYPES
+from pythermiagenesis.const import REGISTER_RANGES
+from pythermiagenesis.const import REGISTERS
+from pythermiagenesis.const import TYPE_INT
+from pythermiagenesis.const import TYPE_LONG
+from pythermiagenesis.const import TYPE_LONG_LE
+from pythermiagenesis.const import TYPE_STATUS
+
+_LOGGER = logging.getLogger(__name__)
+
+BIT_TYPES = (REG_COIL, REG_DISCRETE_INPUT)
+
+# Largest number of addresses fetched by a single block read
+DEFAULT_MAX_BLOCK = {
+    REG_COIL: 64,
+    REG_DISCRETE_INPUT: 64,
+    REG_INPUT: 32,
+    REG_HOLDING: 32,
+}
+
+# Bytes on the wire for one extra request/response pair (MBAP header, function
+# code, addressing and byte count in both directions). Reading a gap is cheaper
+# than splitting the block as long as the gap costs fewer bytes than this.
+ROUND_TRIP_COST = 24
+
+# Registers the controller only answers when another register enables them
+CONDITIONAL_REGISTERS = {
+    ATTR_HOLDING_FIXED_SYSTEM_SUPPLY_SET_POINT: ATTR_COIL_ENABLE_FIXED_SYSTEM_SUPPLY_SET_POINT,
+}
+
+STATUS_NAMES = {
+    0: "OFF",
+    1: "Manual Operation",
+    2: "Defrost",
+    3: "Hot water",
+    4: "Heat",
+    5: "Cool",
+    6: "Pool",
+    7: "Anti legionella",
+    98: "Standby",
+    99: "No demand",
+}
+
+
+def register_width(name):
+    """Return the number of addresses a register occupies."""
+    if REGISTERS[name][KEY_DATATYPE] in (TYPE_LONG, TYPE_LONG_LE):
+        return 2
+    return 1
+
+
+def gap_cost(reg_type, gap):
+    """Return the number of payload bytes spent reading a gap of addresses."""
+    if reg_type in BIT_TYPES:
+        return gap / 8
+    return gap * 2
+
+
+class ReadBlock:
+    """A single Modbus read covering one or more registers."""
+
+    def __init__(self, reg_type, start, end, range_end):
+        """Initialize."""
+        self.reg_type = reg_type
+        self.start = start
+        self.end = end
+        self.range_end = range_end
+        self.slots = {}
+
+    def __repr__(self):
+        return f"ReadBlock({self.reg_type} {self.start}-{self.end}, {len(self.slots)} registers)"
+
+    @property
+    def count(self):
+        """Return the number of addresses read by this block."""
+        return self.end - self.start + 1
+
+    def add(self, name, address, width):
+        """Add a register to the block."""
+        self.slots[name] = address - self.start
+        self.end = max(self.end, address + width - 1)
+
+    def decode(self, values):
+        """Decode raw block values into a dict of register values."""
+        data = {}
+        for name, offset in self.slots.items():
+            meta = REGISTERS[name]
+            datatype = meta[KEY_DATATYPE]
+            val = values[offset]
+            if datatype == TYPE_LONG:
+                val = word_list_to_long(values[offset : offset + 2])[0]
+            elif datatype == TYPE_LONG_LE:
+                val = word_list_to_long(values[offset : offset + 2], False)[0]
+            elif datatype == TYPE_INT:
+                if val == 32767:
+                    val = 0
+                if val > 32767:
+                    val = val - 65536
+            elif datatype == TYPE_STATUS:
+                val = STATUS_NAMES.get(val, "OFF")
+            if meta[KEY_SCALE] != 1:
+                val = val / meta[KEY_SCALE]
+            data[name] = val
+        return data
+
+
+class WriteBlock:
+    """A single Modbus write covering one or more adjacent registers."""
+
+    def __init__(self, reg_type, start):
+        """Initialize."""
+        self.reg_type = reg_type
+        self.start = start
+        self.names = []
+        self.values = []
+
+    def __repr__(self):
+        return f"WriteBlock({self.reg_type} {self.start}, {self.values})"
+
+    @property
+    def count(self):
+        """Return the number of addresses written by this block."""
+        return len(self.values)
+
+
+def encode_value(name, value):
+    """Convert a register value into the raw value written to the heat pump."""
+    meta = REGISTERS[name]
+    if meta[KEY_REG_TYPE] == REG_COIL:
+        return bool(value)
+    raw = int(value * meta[KEY_SCALE])
+    if meta[KEY_DATATYPE] == TYPE_INT and raw < 0:
+        raw = 65536 + raw
+    return raw
+
+
+def _range_end(kind, reg_type, address):
+    for start, end in REGISTER_RANGES[kind][reg_type]:
+        if start <= address <= end:
+            return end
+    # Not covered by a known register block, only read it on its own
+    return address
+
+
+def plan_reads(
+    registers, kind, known=None, max_block=None, round_trip_cost=None, avoid=()
+):
+    """Group registers into the smallest list of block reads.
+
+    Registers are grouped by register type and address. Neighbouring registers
+    are merged into one block as long as the block stays within one of the
+    controller's register ranges, fits within max_block addresses, reading
+    the gap between them is cheaper than an extra round trip and the gap
+    covers none of the (register type, address) pairs to avoid.
+    """
+    if known is None:
+        known = {}
+    if max_block is None:
+        max_block = DEFAULT_MAX_BLOCK
+    if round_trip_cost is None:
+        round_trip_cost = ROUND_TRIP_COST
+
+    by_type = {reg_type: [] for reg_type in REG_TYPES}
+    for name in set(registers):
+        meta = REGISTERS.get(name)
+        if meta is None or not meta[kind]:
+            continue
+        enabled_by = CONDITIONAL_REGISTERS.get(name)
+        if enabled_by is not None and not known.get(enabled_by):
+            continue
+        by_type[meta[KEY_REG_TYPE]].append((meta[KEY_ADDRESS], name))
+
+    blocks = []
+    for reg_type in REG_TYPES:
+        block = None
+        for address, name in sorted(by_type[reg_type]):
+            width = register_width(name)
+            end = address + width - 1
+            if (
+                block is None
+                or end > block.range_end
+                or end - block.start + 1 > max_block[reg_type]
+                or gap_cost(reg_type, address - block.end - 1) > round_trip_cost
+                or any(
+                    (reg_type, gap) in avoid for gap in range(block.end + 1, address)
+                )
+            ):
+                block = ReadBlock(
+                    reg_type,
+                    address,
+                    end,
+                    max(end, _range_end(kind, reg_type, address)),
+                )
+                blocks.append(block)
+            block.add(name, address, width)
+
+    _LOGGER.debug(f"Planned {len(blocks)} block reads for {len(registers)} registers")
+    return blocks
+
+
+def plan_writes(writes):
+    """Group register writes into as few Modbus write requests as possible.
+
+    Writes to adjacent coils or holding registers are merged into one block so
+    they are applied by a single Write Multiple request.
+    """
+    items = []
+    for name, value in writes.items():
+        meta = REGISTERS[name]
+        if meta[KEY_REG_TYPE] not in (REG_COIL, REG_HOLDING):
+            raise ValueError(f"{name} can not be changed")
+        items.append((meta[KEY_REG_TYPE], meta[KEY_ADDRESS], name, value))
+
+    blocks = []
+    block = None
+    for reg_type, address, name, value in sorted(items):
+        if (
+            block is None
+            or block.reg_type != reg_type
+            or address != block.start + block.count
+        ):
+            block = WriteBlock(reg_type, address)
+            blocks.append(block)
+        block.names.append(name)
+        block.values.append(encode_value(name, value))
+    return blocks
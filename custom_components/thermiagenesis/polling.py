@@ -0,0 +1,54 @@
+"""Polling shared by all ThermiaGenesis heat pumps of an installation."""
+import asyncio
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+# Heat pumps polled at the same time, whatever the number of entries
+MAX_SESSIONS = 2
+
+
+class PollGroup:
+    """Stagger and limit the polls of several heat pumps.
+
+    Members get poll offsets spread evenly over the interval of each poll
+    tier, and at most max_sessions of them read from their heat pump at a
+    time.
+    Writes don't wait for a session so user actions stay responsive.
+    """
+
+    def __init__(self, max_sessions=MAX_SESSIONS):
+        """Initialize."""
+        self.max_sessions = max_sessions
+        self.members = []
+        self._sessions = asyncio.Semaphore(max_sessions)
+
+    def add(self, coordinator):
+        """Add a coordinator and restagger the members."""
+        self.members.append(coordinator)
+        self._stagger()
+
+    def remove(self, coordinator):
+        """Remove a coordinator and restagger the remaining members."""
+        if coordinator in self.members:
+            self.members.remove(coordinator)
+            self._stagger()
+
+    def session(self):
+        """Return the context manager a poll runs in."""
+        return self._sessions
+
+    def _stagger(self):
+        # A heat pump on its own keeps its offset
+        if len(self.members) < 2:
+            return
+        for index, member in enumerate(self.members):
+            member.set_poll_offset(index / len(self.members))
+        _LOGGER.debug(f"Staggered the polls of {len(self.members)} heat pumps")
+
+    def as_dict(self):
+        """Return the group for diagnostics."""
+        return {
+            "members": len(self.members),
+            "max_sessions": self.max_sessions,
+        }
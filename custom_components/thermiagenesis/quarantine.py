@@ -0,0 +1,91 @@
+"""Quarantine of ThermiaGenesis addresses that fail to read."""
+import logging
+from datetime import timedelta
+
+from pythermiagenesis.const import KEY_ADDRESS
+from pythermiagenesis.const import KEY_REG_TYPE
+from pythermiagenesis.const import REGISTERS
+
+from .capabilities import UNSUPPORTED_CODES
+from .connection import ModbusExceptionError
+from .planner import register_width
+
+_LOGGER = logging.getLogger(__name__)
+
+# Time before a quarantined address is read again, doubled on every failure
+REPROBE_INTERVAL = timedelta(minutes=10)
+MAX_REPROBE_INTERVAL = timedelta(hours=6)
+
+
+def register_addresses(name):
+    """Return the (register type, address) pairs a register occupies."""
+    meta = REGISTERS[name]
+    return {
+        (meta[KEY_REG_TYPE], meta[KEY_ADDRESS] + offset)
+        for offset in range(register_width(name))
+    }
+
+
+def is_bad_address(error):
+    """Return True if a failed read points at the addresses read.
+
+    Timeouts and busy responses say nothing about the addresses and are left
+    to the caller.
+    """
+    return isinstance(error, ModbusExceptionError) and error.code in UNSUPPORTED_CODES
+
+
+class Quarantine:
+    """Addresses left out of the polls after an illegal address or value.
+
+    Every address is released again after its reprobe delay, which doubles
+    each time it fails again until a read covering it succeeds.
+    """
+
+    def __init__(self):
+        """Initialize."""
+        self.until = {}
+        self.strikes = {}
+
+    def __contains__(self, address):
+        """Return True if the (register type, address) pair is quarantined."""
+        return address in self.until
+
+    def excludes(self, name):
+        """Return True if a register is left out of the polls."""
+        if not self.until or name not in REGISTERS:
+            return False
+        return not self.until.keys().isdisjoint(register_addresses(name))
+
+    def add(self, addresses, now):
+        """Quarantine addresses that failed to read."""
+        if not addresses:
+            return
+        for address in addresses:
+            strikes = self.strikes.get(address, 0) + 1
+            self.strikes[address] = strikes
+            delay = min(
+                REPROBE_INTERVAL.total_seconds() * 2 ** (strikes - 1),
+                MAX_REPROBE_INTERVAL.total_seconds(),
+            )
+            self.until[address] = now + delay
+        _LOGGER.warning(f"Quarantined addresses {sorted(addresses)}")
+
+    def release_due(self, now):
+        """Release the addresses due to be read again, return them."""
+        due = {address for address, until in self.until.items() if now >= until}
+        for address in due:
+            del self.until[address]
+        if due:
+            _LOGGER.debug(f"Reprobing quarantined addresses {sorted(due)}")
+        return due
+
+    def confirm(self, reg_type, start, end):
+        """Forget the failures of addresses a read covered successfully."""
+        for address in list(self.strikes):
+            if address[0] == reg_type and start <= address[1] <= end:
+                del self.strikes[address]
+
+    def as_dict(self):
+        """Return the quarantined addresses for diagnostics."""
+        return sorted(f"{reg_type}:{address}" for reg_type, address in self.until)
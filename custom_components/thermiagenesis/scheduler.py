@@ -0,0 +1,82 @@
+"""Single-flight Modbus request scheduler for ThermiaGenesis."""
+import asyncio
+import heapq
+import itertools
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+PRIORITY_WRITE = 0
+PRIORITY_READ = 1
+PRIORITY_POLL = 2
+
+
+class RequestScheduler:
+    """Run Modbus transactions one at a time in priority order.
+
+    User writes go before targeted reads, which go before background polls.
+    Requests with the same key that are still waiting in the queue are only
+    performed once and every caller gets the same result.
+    """
+
+    def __init__(self, hass, name):
+        """Initialize."""
+        self.hass = hass
+        self.name = name
+        self._queue = []
+        self._pending = {}
+        self._counter = itertools.count()
+        self._worker = None
+
+    @property
+    def queued(self):
+        """Return the number of requests waiting to run."""
+        return len(self._queue)
+
+    async def async_run(self, priority, job, key=None):
+        """Queue job, a coroutine function, and return its result once it ran."""
+        future = self._pending.get(key) if key is not None else None
+        if future is None:
+            future = self.hass.loop.create_future()
+            heapq.heappush(
+                self._queue, (priority, next(self._counter), key, job, future)
+            )
+            if key is not None:
+                self._pending[key] = future
+            if self._worker is None or self._worker.done():
+                self._worker = self.hass.async_create_background_task(
+                    self._async_work(), f"{self.name} request scheduler"
+                )
+        else:
+            _LOGGER.debug(f"Joining pending request {key}")
+        return await asyncio.shield(future)
+
+    async def _async_work(self):
+        while self._queue:
+            _, _, key, job, future = heapq.heappop(self._queue)
+            if key is not None:
+                self._pending.pop(key, None)
+            try:
+                result = await job()
+            except asyncio.CancelledError:
+                # The worker stops, don't leave anyone waiting on it
+                future.cancel()
+                self._fail_queued(f"{self.name} request was cancelled")
+                raise
+            except Exception as error:  # pylint: disable=broad-except
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    async def async_stop(self):
+        """Fail queued requests and wait for the one in flight."""
+        self._fail_queued(f"{self.name} is shutting down")
+        # Waiting doesn't raise the CancelledError a cancelled job ended it with
+        if self._worker is not None and not self._worker.done():
+            await asyncio.wait([self._worker])
+
+    def _fail_queued(self, message):
+        while self._queue:
+            _, _, _, _, future = heapq.heappop(self._queue)
+            future.set_exception(ConnectionError(message))
+        self._pending = {}
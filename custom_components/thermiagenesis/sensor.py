@@ -1,28 +1,36 @@
 import logging
 
 from homeassistant.components.sensor import SensorStateClass
+from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
-from pythermiagenesis.const import REGISTERS
+from homeassistant.helpers.entity import EntityCategory
 
-from .const import ATTR_CLASS
-from .const import ATTR_DEFAULT_ENABLED
+from .const import ALARM_SENSOR
 from .const import ATTR_ICON
 from .const import ATTR_LABEL
 from .const import ATTR_MANUFACTURER
 from .const import ATTR_STATE_CLASS
 from .const import ATTR_UNIT
+from .const import DIAGNOSTIC_SENSOR_TYPES
 from .const import DOMAIN
 from .const import HEATPUMP_ALARMS
 from .const import HEATPUMP_ATTRIBUTES
 from .const import HEATPUMP_SENSOR
-from .const import SENSOR_TYPES
+from .entity import entity_unique_id
+from .metadata import platform_metadata
+from .metadata import register_metadata
 
 ATTR_COUNTER = "counter"
-ATTR_FIRMWARE = "firmware"
 ATTR_MODEL = "Diplomat Inverter Duo"
 
 _LOGGER = logging.getLogger(__name__)
 
+# Attribute label and unit of every register shown by the heatpump sensor
+HEATPUMP_LABELS = {
+    register: ((register.split("_", 1)[-1]).title(), unit)
+    for register, unit in HEATPUMP_ATTRIBUTES
+}
+
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Add Thermia entities from a config_entry."""
@@ -31,17 +39,20 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     sensors = []
 
     device_info = {
-        "identifiers": {(DOMAIN, ATTR_MODEL)},
+        "identifiers": {(DOMAIN, config_entry.entry_id)},
         "name": ATTR_MODEL,
         "manufacturer": ATTR_MANUFACTURER,
         "model": ATTR_MODEL,
-        "sw_version": coordinator.data.get(ATTR_FIRMWARE),
+        "sw_version": coordinator.firmware,
     }
 
     sensors.append(ThermiaHeatpumpSensor(coordinator, HEATPUMP_SENSOR, device_info))
-    for sensor in SENSOR_TYPES:
-        if REGISTERS[sensor][coordinator.kind]:
-            sensors.append(ThermiaGenericSensor(coordinator, sensor, device_info))
+    for meta in platform_metadata("sensor", coordinator.kind):
+        if meta.name not in coordinator.unsupported:
+            sensors.append(ThermiaGenericSensor(coordinator, meta.name, device_info))
+    sensors.append(ThermiaAlarmSensor(coordinator, ALARM_SENSOR, device_info))
+    for sensor in DIAGNOSTIC_SENSOR_TYPES:
+        sensors.append(ThermiaDiagnosticSensor(coordinator, sensor, device_info))
     async_add_entities(sensors, False)
 
 
@@ -52,11 +63,13 @@ class ThermiaHeatpumpSensor(Entity):
         """Initialize."""
         self._name = "Heatpump"
         # self._name = f"{coordinator.data[ATTR_MODEL]} {SENSOR_TYPES[kind][ATTR_LABEL]}"
-        self._unique_id = "thermiagenesis_heatpump"
+        self._unique_id = entity_unique_id(coordinator.entry_id, "heatpump")
+        self.meta = register_metadata("sensor")[kind]
         self._device_info = device_info
         self.coordinator = coordinator
         self.kind = kind
         self._attrs = {}
+        self._alarm = False
 
     @property
     def name(self):
@@ -72,20 +85,12 @@ class ThermiaHeatpumpSensor(Entity):
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
-        for attr in HEATPUMP_ATTRIBUTES:
-            label = (attr[0].split("_", 1)[-1]).title()
-            val = self.coordinator.data.get(attr[0])
-            if attr[1]:
-                val = f"{val} {attr[1]}"
-            self._attrs[label] = val
-        if self.has_alarm():
-            self._attrs["Active alarms"] = ""
         return self._attrs
 
     @property
     def icon(self):
         """Return the icon."""
-        if self.has_alarm():
+        if self._alarm:
             return "mdi-alert"
         return "mdi-pulse"
 
@@ -97,7 +102,12 @@ class ThermiaHeatpumpSensor(Entity):
     @property
     def unit_of_measurement(self):
         """Return the unit the value is expressed in."""
-        return SENSOR_TYPES[self.kind].get(ATTR_UNIT, None)
+        return self.meta.unit
+
+    @property
+    def assumed_state(self):
+        """Return True while showing values restored from before a restart."""
+        return self.coordinator.stale
 
     @property
     def available(self):
@@ -125,17 +135,36 @@ class ThermiaHeatpumpSensor(Entity):
                 return True
         return False
 
-    def async_write_ha_state(self):
-        super().async_write_ha_state()
+    def _update_attributes(self, changed=None):
+        """Recompute the attributes of the registers that changed."""
+        data = self.coordinator.data or {}
+        for register, (label, unit) in HEATPUMP_LABELS.items():
+            if changed is None or register in changed:
+                val = data.get(register)
+                self._attrs[label] = f"{val} {unit}" if unit else val
+        if changed is None or not changed.isdisjoint(HEATPUMP_ALARMS):
+            self._alarm = self.has_alarm()
+            if self._alarm:
+                self._attrs["Active alarms"] = ""
+            else:
+                self._attrs.pop("Active alarms", None)
+
+    @callback
+    def _handle_coordinator_update(self):
+        self._update_attributes(self.coordinator.last_changed)
+        self.async_write_ha_state()
 
     async def async_added_to_hass(self):
         register_attr = [self.kind]
         for attr in HEATPUMP_ATTRIBUTES:
             register_attr.append(attr[0])
         self.coordinator.registerAttribute(register_attr)
+        self._update_attributes()
         """Connect to dispatcher listening for entity data notifications."""
         self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.async_add_listener(
+                self._handle_coordinator_update, tuple(register_attr + HEATPUMP_ALARMS)
+            )
         )
 
     async def async_update(self):
@@ -146,20 +175,23 @@ class ThermiaHeatpumpSensor(Entity):
 class ThermiaGenericSensor(Entity):
     """Define a Thermia generic sensor."""
 
+    _attr_should_poll = False
+
     def __init__(self, coordinator, kind, device_info):
         """Initialize."""
-        self._name = f"{SENSOR_TYPES[kind][ATTR_LABEL]}"
-        # self._name = f"{coordinator.data[ATTR_MODEL]} {SENSOR_TYPES[kind][ATTR_LABEL]}"
-        self._unique_id = f"thermiagenesis_{kind}"
-        self._device_info = device_info
+        self.meta = register_metadata("sensor")[kind]
+        # Static metadata is resolved once instead of on every state write
+        self._attr_name = self.meta.label
+        self._attr_unique_id = entity_unique_id(coordinator.entry_id, kind)
+        self._attr_device_info = device_info
+        self._attr_icon = self.meta.icon
+        self._attr_unit_of_measurement = self.meta.unit
+        self._attr_device_class = self.meta.device_class
+        self._attr_extra_state_attributes = {}
+        self._attr_entity_registry_enabled_default = self.meta.default_enabled
+        self._state_class = self.meta.state_class or SensorStateClass.MEASUREMENT
         self.coordinator = coordinator
         self.kind = kind
-        self._attrs = {}
-
-    @property
-    def name(self):
-        """Return the name."""
-        return self._name
 
     @property
     def state(self):
@@ -168,68 +200,112 @@ class ThermiaGenericSensor(Entity):
         return val
 
     @property
-    def extra_state_attributes(self):
-        """Return the state attributes."""
-        return self._attrs
+    def state_class(self):
+        """Return de device class of the sensor."""
+        return self._state_class
 
     @property
-    def icon(self):
-        """Return the icon."""
-        return SENSOR_TYPES[self.kind][ATTR_ICON]
+    def assumed_state(self):
+        """Return True while showing values restored from before a restart."""
+        return self.coordinator.stale
 
     @property
-    def unique_id(self):
-        """Return a unique_id for this entity."""
-        return self._unique_id
+    def available(self):
+        """Return True if entity is available."""
+        return self.coordinator.last_update_success and not (
+            self.coordinator.quarantine.excludes(self.kind)
+        )
 
-    @property
-    def unit_of_measurement(self):
-        """Return the unit the value is expressed in."""
-        return SENSOR_TYPES[self.kind].get(ATTR_UNIT, None)
+    def async_write_ha_state(self):
+        super().async_write_ha_state()
 
-    @property
-    def device_class(self):
-        """Return de device class of the sensor."""
-        return SENSOR_TYPES[self.kind].get(ATTR_CLASS, None)
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        """Connect to dispatcher listening for entity data notifications."""
+        self.coordinator.registerAttribute(self.kind)
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self.async_write_ha_state, (self.kind,))
+        )
+
+    async def async_update(self):
+        """Update Thermia entity."""
+        await self.coordinator.async_request_refresh()
+
+
+class ThermiaAlarmSensor(Entity):
+    """Define a sensor counting the active alarms of the heat pump."""
+
+    _attr_should_poll = False
+
+    def __init__(self, coordinator, kind, device_info):
+        """Initialize."""
+        self._attr_name = "Active Alarms"
+        self._attr_unique_id = entity_unique_id(coordinator.entry_id, kind)
+        self._attr_device_info = device_info
+        self.coordinator = coordinator
+        self.kind = kind
+        self._update_alarms()
 
     @property
-    def state_class(self):
-        """Return de device class of the sensor."""
-        return SENSOR_TYPES[self.kind].get(
-            ATTR_STATE_CLASS, SensorStateClass.MEASUREMENT
-        )
+    def assumed_state(self):
+        """Return True while showing values restored from before a restart."""
+        return self.coordinator.stale
 
     @property
     def available(self):
         """Return True if entity is available."""
         return self.coordinator.last_update_success
 
-    @property
-    def should_poll(self):
-        """Return the polling requirement of the entity."""
-        return False
+    def _update_alarms(self):
+        """Recompute the state from the alarm bitset."""
+        labels = [meta.label for meta in self.coordinator.alarms.active()]
+        self._attr_state = len(labels)
+        self._attr_extra_state_attributes = {"alarms": labels}
+        self._attr_icon = "mdi:alert" if labels else "mdi:check-circle-outline"
 
-    @property
-    def device_info(self):
-        """Return the device info."""
-        return self._device_info
+    @callback
+    def _handle_coordinator_update(self):
+        self._update_alarms()
+        self.async_write_ha_state()
 
-    def async_write_ha_state(self):
-        super().async_write_ha_state()
+    async def async_added_to_hass(self):
+        """Update only when one of the alarms changed."""
+        self.async_on_remove(
+            self.coordinator.async_add_listener(
+                self._handle_coordinator_update, tuple(self.coordinator.alarms.names)
+            )
+        )
+
+
+class ThermiaDiagnosticSensor(Entity):
+    """Define a sensor showing statistics of the Modbus requests."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_should_poll = False
+
+    def __init__(self, coordinator, kind, device_info):
+        """Initialize."""
+        self._attr_name = DIAGNOSTIC_SENSOR_TYPES[kind][ATTR_LABEL]
+        self._attr_unique_id = entity_unique_id(coordinator.entry_id, kind)
+        self._attr_icon = DIAGNOSTIC_SENSOR_TYPES[kind][ATTR_ICON]
+        self._attr_unit_of_measurement = DIAGNOSTIC_SENSOR_TYPES[kind][ATTR_UNIT]
+        self._attr_device_info = device_info
+        self.coordinator = coordinator
+        self.kind = kind
 
     @property
-    def entity_registry_enabled_default(self):
-        """Return if the entity should be enabled when first added to the entity registry."""
-        return SENSOR_TYPES[self.kind][ATTR_DEFAULT_ENABLED]
+    def state(self):
+        """Return the state."""
+        return self.coordinator.metrics.value(self.kind)
+
+    @property
+    def state_class(self):
+        """Return the state class of the sensor."""
+        return DIAGNOSTIC_SENSOR_TYPES[self.kind][ATTR_STATE_CLASS]
 
     async def async_added_to_hass(self):
-        await super().async_added_to_hass()
-        """Connect to dispatcher listening for entity data notifications."""
-        self.coordinator.registerAttribute(self.kind)
+        """Update after every poll, whichever registers changed."""
         self.async_on_remove(
             self.coordinator.async_add_listener(self.async_write_ha_state)
         )
-
-    async def async_update(self):
-        """Update Thermia entity."""
-        await self.coordinator.async_request_refresh()
@@ -0,0 +1,104 @@
+"""Adaptive request pacing for ThermiaGenesis heat pumps."""
+import logging
+
+from pythermiagenesis.const import REG_TYPES
+
+from .connection import ModbusTimeoutError
+from .planner import BIT_TYPES
+from .planner import DEFAULT_MAX_BLOCK
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_DELAY = 0.05
+MIN_DELAY = 0.0
+MAX_DELAY = 2.0
+# Never back off to less than this after an error
+MIN_BACKOFF_DELAY = 0.05
+DELAY_DECREASE = 0.8
+DELAY_INCREASE = 2
+
+MIN_BLOCK = 8
+# Stay well below the Modbus limits of 2000 bits and 125 registers per request
+MAX_BLOCK = {True: 256, False: 120}
+BLOCK_STEP = {True: 16, False: 8}
+
+# Consecutive fast requests needed before speeding up
+SUCCESS_STREAK = 20
+# A request this much slower than the average counts as the device struggling
+SLOW_FACTOR = 2
+LATENCY_WEIGHT = 0.1
+
+
+class AdaptiveTuner:
+    """Tune the inter-request delay and block size to what the device keeps up with.
+
+    The delay is decreased and the block size increased after a streak of fast
+    successful requests, and both are backed off immediately on timeouts or
+    exception responses.
+    """
+
+    def __init__(self):
+        """Initialize."""
+        self.delay = DEFAULT_DELAY
+        self.max_block = dict(DEFAULT_MAX_BLOCK)
+        self.latency = None
+        self.requests = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.good_block = {reg_type: 0 for reg_type in REG_TYPES}
+        self._streak = 0
+
+    def record_success(self, reg_type, latency, count=0):
+        """Record a successful request and speed up if the device keeps up."""
+        self.requests += 1
+        self.good_block[reg_type] = max(self.good_block[reg_type], count)
+        if self.latency is None:
+            self.latency = latency
+        slow = latency > self.latency * SLOW_FACTOR
+        self.latency += (latency - self.latency) * LATENCY_WEIGHT
+        if slow:
+            self._streak = 0
+            return
+        self._streak += 1
+        if self._streak < SUCCESS_STREAK:
+            return
+        self._streak = 0
+        self.delay = max(MIN_DELAY, round(self.delay * DELAY_DECREASE, 4))
+        is_bits = reg_type in BIT_TYPES
+        self.max_block[reg_type] = min(
+            MAX_BLOCK[is_bits], self.max_block[reg_type] + BLOCK_STEP[is_bits]
+        )
+        _LOGGER.debug(
+            f"Speeding up to delay {self.delay} s and {reg_type} blocks of "
+            f"{self.max_block[reg_type]}"
+        )
+
+    def fits(self, reg_type, count):
+        """Return True if a block of count addresses is known not to be too large."""
+        return count <= max(MIN_BLOCK, self.good_block[reg_type])
+
+    def record_failure(self, reg_type, error):
+        """Record a failed request and back off."""
+        self.requests += 1
+        if isinstance(error, ModbusTimeoutError):
+            self.timeouts += 1
+        else:
+            self.errors += 1
+        self._streak = 0
+        self.delay = min(MAX_DELAY, max(MIN_BACKOFF_DELAY, self.delay * DELAY_INCREASE))
+        if reg_type is not None:
+            self.max_block[reg_type] = max(MIN_BLOCK, self.max_block[reg_type] // 2)
+        _LOGGER.debug(
+            f"Backing off to delay {self.delay} s and block sizes {self.max_block}"
+        )
+
+    def as_dict(self):
+        """Return the tuned values for diagnostics."""
+        return {
+            "delay": self.delay,
+            "max_block": {reg_type: self.max_block[reg_type] for reg_type in REG_TYPES},
+            "latency": self.latency,
+            "requests": self.requests,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+        }
@@ -3,9 +3,26 @@ from unittest.mock import patch
 
 import pytest
 
+from .simulator import HeatPumpSimulator
+
 pytest_plugins = "pytest_homeassistant_custom_component"
 
 
+def pytest_addoption(parser):
+    """Add the option to run the benchmarks."""
+    parser.addoption("--benchmark", action="store_true", help="run the poll benchmarks")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the benchmarks unless asked for."""
+    if config.getoption("--benchmark"):
+        return
+    skip = pytest.mark.skip(reason="needs --benchmark to run")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
 # This fixture is used to prevent HomeAssistant from attempting to create and dismiss persistent
 # notifications. These calls would fail without this fixture since the persistent_notification
 # integration is never loaded during a test.
@@ -37,3 +54,13 @@ def error_get_data_fixture():
         side_effect=Exception,
     ):
         yield
+
+
+# Local Modbus TCP heat pump to run the integration against the real I/O path.
+@pytest.fixture(name="simulator")
+async def simulator_fixture(socket_enabled):
+    """Start a simulated inverter heat pump."""
+    simulator = HeatPumpSimulator()
+    await simulator.start()
+    yield simulator
+    await simulator.stop()
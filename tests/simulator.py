@@ -0,0 +1,294 @@
+"""Simulated Thermia Genesis heat pump speaking Modbus TCP.
+
+The simulator serves the Inverter or Mega register map from pythermiagenesis
+on a local port so the integration can be tested and benchmarked against the
+real Modbus code path. Latency, jitter, per-request limits, dropped
+connections and exception responses can be configured to mimic a slow or
+unreliable controller.
+"""
+import asyncio
+import logging
+import random
+import struct
+
+from custom_components.thermiagenesis.planner import encode_value
+from custom_components.thermiagenesis.planner import STATUS_NAMES
+from pythermiagenesis.const import KEY_ADDRESS
+from pythermiagenesis.const import KEY_DATATYPE
+from pythermiagenesis.const import KEY_REG_TYPE
+from pythermiagenesis.const import KEY_SCALE
+from pythermiagenesis.const import REG_COIL
+from pythermiagenesis.const import REG_DISCRETE_INPUT
+from pythermiagenesis.const import REG_HOLDING
+from pythermiagenesis.const import REG_INPUT
+from pythermiagenesis.const import REG_TYPES
+from pythermiagenesis.const import REGISTER_RANGES
+from pythermiagenesis.const import REGISTERS
+from pythermiagenesis.const import TYPE_BIT
+from pythermiagenesis.const import TYPE_LONG
+from pythermiagenesis.const import TYPE_LONG_LE
+from pythermiagenesis.const import TYPE_STATUS
+
+_LOGGER = logging.getLogger(__name__)
+
+FC_READ_COILS = 1
+FC_READ_DISCRETE_INPUTS = 2
+FC_READ_HOLDING_REGISTERS = 3
+FC_READ_INPUT_REGISTERS = 4
+FC_WRITE_SINGLE_COIL = 5
+FC_WRITE_SINGLE_REGISTER = 6
+FC_WRITE_MULTIPLE_COILS = 15
+FC_WRITE_MULTIPLE_REGISTERS = 16
+
+READ_FUNCTIONS = {
+    FC_READ_COILS: REG_COIL,
+    FC_READ_DISCRETE_INPUTS: REG_DISCRETE_INPUT,
+    FC_READ_HOLDING_REGISTERS: REG_HOLDING,
+    FC_READ_INPUT_REGISTERS: REG_INPUT,
+}
+
+EXC_ILLEGAL_FUNCTION = 1
+EXC_ILLEGAL_ADDRESS = 2
+EXC_ILLEGAL_VALUE = 3
+EXC_DEVICE_BUSY = 6
+EXC_GATEWAY_TARGET = 11
+
+STATUS_HEAT = next(code for code, name in STATUS_NAMES.items() if name == "Heat")
+
+
+def seed_value(name):
+    """Return a plausible raw value for a register."""
+    meta = REGISTERS[name]
+    address = meta[KEY_ADDRESS]
+    if meta[KEY_DATATYPE] == TYPE_BIT:
+        # Alarms and other discrete inputs start cleared
+        return meta[KEY_REG_TYPE] == REG_COIL and address % 2 == 0
+    if meta[KEY_DATATYPE] == TYPE_STATUS:
+        return STATUS_HEAT
+    if meta[KEY_DATATYPE] in (TYPE_LONG, TYPE_LONG_LE):
+        return address * 1000
+    return ((address * 37) % 50 + 10) * meta[KEY_SCALE]
+
+
+class SimulatedHeatPump:
+    """Register map of one simulated heat pump."""
+
+    def __init__(self, kind):
+        """Initialize."""
+        self.kind = kind
+        self.memory = {reg_type: {} for reg_type in REG_TYPES}
+        for name, meta in REGISTERS.items():
+            if meta[kind]:
+                self.set_raw(name, seed_value(name))
+
+    def set_raw(self, name, raw):
+        """Store a raw register value, splitting longs into two words."""
+        meta = REGISTERS[name]
+        memory = self.memory[meta[KEY_REG_TYPE]]
+        address = meta[KEY_ADDRESS]
+        if meta[KEY_DATATYPE] == TYPE_LONG:
+            memory[address], memory[address + 1] = raw >> 16, raw & 0xFFFF
+        elif meta[KEY_DATATYPE] == TYPE_LONG_LE:
+            memory[address], memory[address + 1] = raw & 0xFFFF, raw >> 16
+        else:
+            memory[address] = raw
+
+    def set_value(self, name, value):
+        """Store a value the way the heat pump would report it."""
+        meta = REGISTERS[name]
+        if meta[KEY_DATATYPE] in (TYPE_LONG, TYPE_LONG_LE):
+            self.set_raw(name, int(value * meta[KEY_SCALE]))
+        else:
+            self.set_raw(name, encode_value(name, value))
+
+    def in_range(self, reg_type, start, count):
+        """Return True if all addresses are registers or in a register range."""
+        ranges = REGISTER_RANGES[self.kind][reg_type]
+        return all(
+            address in self.memory[reg_type]
+            or any(first <= address <= last for first, last in ranges)
+            for address in range(start, start + count)
+        )
+
+    def read(self, reg_type, start, count):
+        """Return raw values, unused addresses read as zero."""
+        memory = self.memory[reg_type]
+        return [memory.get(address, 0) for address in range(start, start + count)]
+
+    def write(self, reg_type, start, values):
+        """Store raw values written by a client."""
+        memory = self.memory[reg_type]
+        for offset, value in enumerate(values):
+            memory[start + offset] = value
+
+
+class HeatPumpSimulator:
+    """Asyncio Modbus TCP server in front of one or more simulated heat pumps.
+
+    latency and jitter delay every response by latency plus a random amount of
+    up to jitter seconds. Requests for more than max_bits or max_registers
+    addresses are answered with an illegal data value exception. drop_rate and
+    exception_rate are the chances that a request drops the connection or is
+    answered with a busy exception. fail_addresses maps (register type,
+    address) to the exception code returned for any read or write touching it.
+    """
+
+    def __init__(
+        self,
+        kind="inverter",
+        latency=0.0,
+        jitter=0.0,
+        max_bits=2000,
+        max_registers=125,
+        drop_rate=0.0,
+        exception_rate=0.0,
+        fail_addresses=None,
+        unit_ids=(1,),
+        seed=0,
+    ):
+        """Initialize."""
+        self.units = {unit_id: SimulatedHeatPump(kind) for unit_id in unit_ids}
+        self.latency = latency
+        self.jitter = jitter
+        self.max_bits = max_bits
+        self.max_registers = max_registers
+        self.drop_rate = drop_rate
+        self.exception_rate = exception_rate
+        self.fail_addresses = dict(fail_addresses or {})
+        self.random = random.Random(seed)
+        self.host = "127.0.0.1"
+        self.port = None
+        self.requests = 0
+        self.bytes_received = 0
+        self.bytes_sent = 0
+        self.connections = 0
+        self.log = []
+        self._server = None
+        self._writers = set()
+        self._handlers = set()
+
+    @property
+    def pump(self):
+        """Return the heat pump behind the first unit id."""
+        return next(iter(self.units.values()))
+
+    async def start(self, port=0):
+        """Start listening, on a free port unless one is given."""
+        self._server = await asyncio.start_server(self._handle, self.host, port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        """Close all connections and stop listening."""
+        self.drop_connections()
+        self._server.close()
+        await self._server.wait_closed()
+        if self._handlers:
+            await asyncio.wait(self._handlers)
+
+    def drop_connections(self):
+        """Close every open client connection without a response."""
+        for writer in list(self._writers):
+            writer.close()
+        self._writers.clear()
+
+    def reset_stats(self):
+        """Forget the request counters."""
+        self.requests = 0
+        self.bytes_received = 0
+        self.bytes_sent = 0
+        self.log = []
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        self._writers.add(writer)
+        self._handlers.add(asyncio.current_task())
+        try:
+            while True:
+                header = await reader.readexactly(7)
+                transaction, _, length, unit_id = struct.unpack(">HHHB", header)
+                pdu = await reader.readexactly(length - 1)
+                self.requests += 1
+                self.bytes_received += len(header) + len(pdu)
+                self.log.append((unit_id, pdu[0]))
+                if self.latency or self.jitter:
+                    await asyncio.sleep(
+                        self.latency + self.random.uniform(0, self.jitter)
+                    )
+                if self.drop_rate and self.random.random() < self.drop_rate:
+                    _LOGGER.debug(f"Dropping connection on request {self.requests}")
+                    break
+                response = self._respond(unit_id, pdu)
+                frame = (
+                    struct.pack(">HHHB", transaction, 0, len(response) + 1, unit_id)
+                    + response
+                )
+                self.bytes_sent += len(frame)
+                writer.write(frame)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            self._handlers.discard(asyncio.current_task())
+            writer.close()
+
+    def _respond(self, unit_id, pdu):
+        function = pdu[0]
+        pump = self.units.get(unit_id)
+        if pump is None:
+            return _exception(function, EXC_GATEWAY_TARGET)
+        if self.exception_rate and self.random.random() < self.exception_rate:
+            return _exception(function, EXC_DEVICE_BUSY)
+
+        if function in READ_FUNCTIONS:
+            reg_type = READ_FUNCTIONS[function]
+            start, count = struct.unpack(">HH", pdu[1:5])
+        elif function in (FC_WRITE_SINGLE_COIL, FC_WRITE_SINGLE_REGISTER):
+            reg_type = REG_COIL if function == FC_WRITE_SINGLE_COIL else REG_HOLDING
+            start, value = struct.unpack(">HH", pdu[1:5])
+            count = 1
+            values = [value == 0xFF00] if reg_type == REG_COIL else [value]
+        elif function in (FC_WRITE_MULTIPLE_COILS, FC_WRITE_MULTIPLE_REGISTERS):
+            reg_type = REG_COIL if function == FC_WRITE_MULTIPLE_COILS else REG_HOLDING
+            start, count = struct.unpack(">HH", pdu[1:5])
+            payload = pdu[6:]
+            if reg_type == REG_COIL:
+                values = [bool(payload[i // 8] >> (i % 8) & 1) for i in range(count)]
+            else:
+                values = list(struct.unpack(f">{count}H", payload[: count * 2]))
+        else:
+            return _exception(function, EXC_ILLEGAL_FUNCTION)
+
+        limit = (
+            self.max_bits
+            if reg_type in (REG_COIL, REG_DISCRETE_INPUT)
+            else self.max_registers
+        )
+        if count < 1 or count > limit:
+            return _exception(function, EXC_ILLEGAL_VALUE)
+        if not pump.in_range(reg_type, start, count):
+            return _exception(function, EXC_ILLEGAL_ADDRESS)
+        for address in range(start, start + count):
+            code = self.fail_addresses.get((reg_type, address))
+            if code is not None:
+                return _exception(function, code)
+
+        if function in READ_FUNCTIONS:
+            values = pump.read(reg_type, start, count)
+            if reg_type in (REG_COIL, REG_DISCRETE_INPUT):
+                payload = bytearray((count + 7) // 8)
+                for i, bit in enumerate(values):
+                    if bit:
+                        payload[i // 8] |= 1 << (i % 8)
+            else:
+                payload = struct.pack(f">{count}H", *values)
+            return bytes([function, len(payload)]) + bytes(payload)
+
+        pump.write(reg_type, start, values)
+        if function in (FC_WRITE_SINGLE_COIL, FC_WRITE_SINGLE_REGISTER):
+            return pdu[:5]
+        return bytes([function]) + struct.pack(">HH", start, count)
+
+
+def _exception(function, code):
+    return bytes([function | 0x80, code])
@@ -0,0 +1,104 @@
+"""Test the Thermia Genesis alarm engine."""
+from custom_components.thermiagenesis import ThermiaGenesisDataUpdateCoordinator
+from custom_components.thermiagenesis.alarms import alarm_registers
+from custom_components.thermiagenesis.alarms import AlarmEngine
+from custom_components.thermiagenesis.const import ALARM_SENSOR
+from custom_components.thermiagenesis.const import BINARY_SENSOR_TYPES
+from custom_components.thermiagenesis.const import CLASS_ALARM
+from custom_components.thermiagenesis.const import EVENT_ALARM
+from custom_components.thermiagenesis.sensor import ThermiaAlarmSensor
+from pythermiagenesis.const import ATTR_DINPUT_ALARM_ACTIVE_CLASS_A
+from pythermiagenesis.const import ATTR_DINPUT_HIGH_PRESSURE_SWITCH_ALARM
+from pythermiagenesis.const import REGISTERS
+
+
+def test_alarm_registers():
+    """Every alarm discrete input of the model gets a bit."""
+    alarms = alarm_registers("inverter")
+    expected = {
+        name
+        for name, meta in BINARY_SENSOR_TYPES.items()
+        if meta.get("device_class") == CLASS_ALARM and REGISTERS[name]["inverter"]
+    }
+    assert {meta.name for meta in alarms.values()} == expected
+    assert all(REGISTERS[meta.name]["address"] == a for a, meta in alarms.items())
+
+
+def test_transitions():
+    """Only alarms that changed since the last call are reported."""
+    engine = AlarmEngine("inverter")
+    class_a = REGISTERS[ATTR_DINPUT_ALARM_ACTIVE_CLASS_A]["address"]
+    pressure = REGISTERS[ATTR_DINPUT_HIGH_PRESSURE_SWITCH_ALARM]["address"]
+    values = [False] * 100
+
+    values[class_a] = True
+    engine.update(0, values)
+    # The alarms active at startup are the baseline
+    assert engine.transitions() == []
+    assert [meta.name for meta in engine.active()] == [ATTR_DINPUT_ALARM_ACTIVE_CLASS_A]
+
+    values[pressure] = True
+    engine.update(0, values)
+    engine.update(0, values)
+    assert [(meta.name, active) for meta, active in engine.transitions()] == [
+        (ATTR_DINPUT_HIGH_PRESSURE_SWITCH_ALARM, True)
+    ]
+    assert engine.transitions() == []
+
+    # A block starting past the class A alarm leaves its bit alone
+    values[pressure] = False
+    engine.update(pressure, values[pressure:])
+    assert [(meta.name, active) for meta, active in engine.transitions()] == [
+        (ATTR_DINPUT_HIGH_PRESSURE_SWITCH_ALARM, False)
+    ]
+    assert len(engine.active()) == 1
+
+
+def test_load():
+    """Restored register values set the bitset."""
+    engine = AlarmEngine("inverter")
+    engine.load({ATTR_DINPUT_HIGH_PRESSURE_SWITCH_ALARM: True})
+    assert [meta.name for meta in engine.active()] == [
+        ATTR_DINPUT_HIGH_PRESSURE_SWITCH_ALARM
+    ]
+
+
+async def test_alarm_events(hass, simulator):
+    """An event is fired for every alarm raised or cleared."""
+    coordinator = ThermiaGenesisDataUpdateCoordinator(
+        hass, simulator.host, simulator.port, "inverter"
+    )
+    coordinator.registerAttribute(coordinator.alarms.names)
+    events = []
+    hass.bus.async_listen(EVENT_ALARM, events.append)
+
+    await coordinator.async_refresh()
+    simulator.pump.set_raw(ATTR_DINPUT_HIGH_PRESSURE_SWITCH_ALARM, True)
+    coordinator._last_read = {}
+    await coordinator.async_refresh()
+    coordinator._last_read = {}
+    await coordinator.async_refresh()
+    simulator.pump.set_raw(ATTR_DINPUT_HIGH_PRESSURE_SWITCH_ALARM, False)
+    coordinator._last_read = {}
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert [(e.data["alarm"], e.data["active"]) for e in events] == [
+        (ATTR_DINPUT_HIGH_PRESSURE_SWITCH_ALARM, True),
+        (ATTR_DINPUT_HIGH_PRESSURE_SWITCH_ALARM, False),
+    ]
+    await coordinator.async_shutdown()
+
+
+async def test_alarm_sensor(hass):
+    """The alarm sensor counts and lists the active alarms."""
+    coordinator = ThermiaGenesisDataUpdateCoordinator(
+        hass, host="127.0.0.1", port=502, kind="inverter"
+    )
+    coordinator.alarms.load({ATTR_DINPUT_HIGH_PRESSURE_SWITCH_ALARM: True})
+    sensor = ThermiaAlarmSensor(coordinator, ALARM_SENSOR, {})
+    assert sensor.state == 1
+    assert sensor.extra_state_attributes == {
+        "alarms": [BINARY_SENSOR_TYPES[ATTR_DINPUT_HIGH_PRESSURE_SWITCH_ALARM]["label"]]
+    }
+    assert sensor.icon == "mdi:alert"
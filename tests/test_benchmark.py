@@ -0,0 +1,104 @@
+"""Benchmark full refreshes against the simulated heat pump.
+
+Run with ``pytest tests/test_benchmark.py --benchmark``. Every scenario prints
+the wall time per refresh, requests and bytes per refresh and the p50, p95 and
+p99 latency of single requests.
+"""
+import math
+import time
+
+import pytest
+from custom_components.thermiagenesis import startup_registers
+from custom_components.thermiagenesis import ThermiaGenesisDataUpdateCoordinator
+from custom_components.thermiagenesis.planner import CONDITIONAL_REGISTERS
+from pythermiagenesis.const import REGISTERS
+
+from .simulator import HeatPumpSimulator
+
+ROUNDS = 5
+LATENCY = 0.002
+JITTER = 0.002
+
+# Requests per full refresh, raise only with a good reason. The default scope
+# includes the alarm discrete inputs, split into blocks by the register ranges
+REQUEST_BUDGET = {
+    ("inverter", "default"): 10,
+    ("inverter", "all"): 18,
+    ("mega", "default"): 13,
+    ("mega", "all"): 24,
+}
+
+pytestmark = pytest.mark.benchmark
+
+
+def all_registers(kind):
+    """Return every register the model has."""
+    return [name for name, meta in REGISTERS.items() if meta[kind]]
+
+
+def percentile(values, fraction):
+    """Return the nearest-rank percentile of values."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+@pytest.mark.parametrize("scope", ["default", "all"])
+@pytest.mark.parametrize("kind", ["inverter", "mega"])
+async def test_full_refresh(hass, socket_enabled, kind, scope, record_property):
+    """Measure full refreshes of the registers in scope."""
+    simulator = HeatPumpSimulator(kind=kind, latency=LATENCY, jitter=JITTER)
+    await simulator.start()
+    coordinator = ThermiaGenesisDataUpdateCoordinator(
+        hass, host=simulator.host, port=simulator.port, kind=kind
+    )
+    registers = (
+        startup_registers(hass, kind) if scope == "default" else all_registers(kind)
+    )
+    coordinator.registerAttribute(registers)
+    coordinator.data = {name: True for name in CONDITIONAL_REGISTERS.values()}
+
+    latencies = []
+    read = coordinator.connection.async_read
+
+    async def timed_read(block, unit_id=None):
+        start = time.perf_counter()
+        try:
+            return await read(block, unit_id)
+        finally:
+            latencies.append(time.perf_counter() - start)
+
+    coordinator.connection.async_read = timed_read
+    # Connect outside the measurement
+    await coordinator.connection.async_ensure_open()
+    simulator.reset_stats()
+
+    wall_times = []
+    for _ in range(ROUNDS):
+        coordinator._last_read = {}
+        start = time.perf_counter()
+        await coordinator.async_refresh()
+        wall_times.append(time.perf_counter() - start)
+        assert coordinator.last_update_success
+    await coordinator.async_shutdown()
+    await simulator.stop()
+
+    requests = simulator.requests / ROUNDS
+    result = {
+        "registers": len(registers),
+        "wall_time": percentile(wall_times, 0.5),
+        "requests": requests,
+        "bytes": (simulator.bytes_sent + simulator.bytes_received) / ROUNDS,
+        "p50": percentile(latencies, 0.5),
+        "p95": percentile(latencies, 0.95),
+        "p99": percentile(latencies, 0.99),
+    }
+    for key, value in result.items():
+        record_property(key, value)
+    print(
+        f"\n{kind} {scope}: {result['registers']} registers, "
+        f"{result['wall_time'] * 1000:.1f} ms/refresh, "
+        f"{requests:.0f} requests, {result['bytes']:.0f} bytes, latency "
+        f"p50 {result['p50'] * 1000:.2f} ms p95 {result['p95'] * 1000:.2f} ms "
+        f"p99 {result['p99'] * 1000:.2f} ms"
+    )
+    assert requests <= REQUEST_BUDGET[(kind, scope)]
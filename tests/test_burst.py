@@ -0,0 +1,83 @@
+"""Test the Thermia Genesis alarm burst polling."""
+import time
+
+from custom_components.thermiagenesis import SCAN_INTERVAL
+from custom_components.thermiagenesis import ThermiaGenesisDataUpdateCoordinator
+from custom_components.thermiagenesis.burst import BURST_DURATION
+from custom_components.thermiagenesis.burst import BURST_INTERVAL
+from custom_components.thermiagenesis.burst import burst_registers
+from custom_components.thermiagenesis.burst import BurstRecorder
+from custom_components.thermiagenesis.burst import PRE_SAMPLES
+from custom_components.thermiagenesis.metadata import register_metadata
+from pythermiagenesis.const import ATTR_DINPUT_ALARM_ACTIVE_CLASS_A
+from pythermiagenesis.const import ATTR_DINPUT_HIGH_PRESSURE_SWITCH_ALARM
+from pythermiagenesis.const import ATTR_INPUT_BRINE_IN_TEMPERATURE
+from pythermiagenesis.const import ATTR_INPUT_COMPRESSOR_OPERATING_HOURS
+from pythermiagenesis.const import ATTR_INPUT_COMPRESSOR_SPEED_RPM
+from pythermiagenesis.const import ATTR_INPUT_HIGH_PRESSURE_SIDE
+
+CLASS_A = register_metadata("binary_sensor")[ATTR_DINPUT_ALARM_ACTIVE_CLASS_A]
+PRESSURE = register_metadata("binary_sensor")[ATTR_DINPUT_HIGH_PRESSURE_SWITCH_ALARM]
+
+
+def test_burst_registers():
+    """Temperatures, pressures and the compressor are polled in a burst."""
+    registers = burst_registers("inverter")
+    assert ATTR_INPUT_BRINE_IN_TEMPERATURE in registers
+    assert ATTR_INPUT_HIGH_PRESSURE_SIDE in registers
+    assert ATTR_INPUT_COMPRESSOR_SPEED_RPM in registers
+    assert ATTR_INPUT_COMPRESSOR_OPERATING_HOURS not in registers
+
+
+def test_capture_window():
+    """A summary alarm flip captures the samples before and after it."""
+    recorder = BurstRecorder("inverter")
+    duration = BURST_DURATION.total_seconds()
+    for second in range(PRE_SAMPLES + 3):
+        data = {ATTR_INPUT_BRINE_IN_TEMPERATURE: second}
+        assert not recorder.record(second, str(second), data, [])
+    # Other alarms don't start a burst
+    assert not recorder.record(20, "20", {}, [(PRESSURE, True)])
+    assert not recorder.active(20)
+
+    assert recorder.record(30, "30", {}, [(CLASS_A, True)])
+    assert recorder.active(30)
+    # Another flip extends the burst
+    assert not recorder.record(31, "31", {}, [(CLASS_A, False)])
+    assert recorder.active(30 + duration)
+    assert recorder.record(31 + duration, "end", {}, [])
+    assert not recorder.active(31 + duration)
+
+    (capture,) = recorder.as_dict()
+    assert capture["alarm"] == ATTR_DINPUT_ALARM_ACTIVE_CLASS_A
+    assert capture["started"] == "30"
+    assert len(capture["pre"]) == PRE_SAMPLES
+    assert capture["pre"][-1]["time"] == "20"
+    assert [sample["time"] for sample in capture["post"]] == ["30", "31", "end"]
+
+
+async def test_burst_polling(hass, simulator):
+    """The coordinator polls faster after a summary alarm flips."""
+    coordinator = ThermiaGenesisDataUpdateCoordinator(
+        hass, simulator.host, simulator.port, "inverter"
+    )
+    coordinator.registerAttribute(coordinator.alarms.names)
+    await coordinator.async_refresh()
+    assert coordinator._due_registers(time.monotonic()) == []
+
+    simulator.pump.set_raw(ATTR_DINPUT_ALARM_ACTIVE_CLASS_A, True)
+    coordinator._last_read = {}
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == BURST_INTERVAL
+    due = coordinator._due_registers(time.monotonic())
+    assert ATTR_INPUT_BRINE_IN_TEMPERATURE in due
+    assert ATTR_DINPUT_ALARM_ACTIVE_CLASS_A in due
+
+    await coordinator.async_refresh()
+    assert coordinator.data[ATTR_INPUT_BRINE_IN_TEMPERATURE] is not None
+    coordinator.burst.until = time.monotonic()
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == SCAN_INTERVAL
+    (capture,) = coordinator.burst.as_dict()
+    assert len(capture["post"]) == 3
+    await coordinator.async_shutdown()
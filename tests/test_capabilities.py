@@ -0,0 +1,235 @@
+"""Test probing which registers a Thermia Genesis heat pump answers for."""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from custom_components.thermiagenesis import ThermiaGenesisDataUpdateCoordinator
+from custom_components.thermiagenesis.capabilities import async_find_unsupported
+from custom_components.thermiagenesis.capabilities import model_registers
+from custom_components.thermiagenesis.connection import ModbusExceptionError
+from custom_components.thermiagenesis.connection import ModbusTimeoutError
+from custom_components.thermiagenesis.const import ATTR_FIRMWARE
+from custom_components.thermiagenesis.const import DOMAIN
+from homeassistant.const import CONF_HOST
+from homeassistant.const import CONF_PORT
+from homeassistant.const import CONF_TYPE
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pythermiagenesis.const import ATTR_COIL_ENABLE_FIXED_SYSTEM_SUPPLY_SET_POINT
+from pythermiagenesis.const import ATTR_HOLDING_FIXED_SYSTEM_SUPPLY_SET_POINT
+from pythermiagenesis.const import ATTR_INPUT_BRINE_IN_TEMPERATURE
+from pythermiagenesis.const import ATTR_INPUT_POOL_RETURN_LINE_TEMPERATURE
+from pythermiagenesis.const import ATTR_INPUT_SOFTWARE_VERSION_MAJOR
+from pythermiagenesis.const import REGISTERS
+
+from .simulator import EXC_ILLEGAL_ADDRESS
+from .simulator import HeatPumpSimulator
+
+
+async def test_find_unsupported_bisects():
+    """Only the registers failing on their own are reported."""
+    registers = model_registers("inverter")
+    missing = {ATTR_INPUT_BRINE_IN_TEMPERATURE}
+
+    async def read(block):
+        if missing & set(block.slots):
+            raise ModbusExceptionError("illegal address", EXC_ILLEGAL_ADDRESS)
+
+    failures = await async_find_unsupported(read, registers, "inverter")
+    assert failures.keys() == missing
+
+
+async def test_find_unsupported_raises_other_errors():
+    """A heat pump that is busy or gone stops the probing."""
+
+    async def read(block):
+        raise ModbusExceptionError("busy", 6)
+
+    with pytest.raises(ModbusExceptionError):
+        await async_find_unsupported(
+            read, [ATTR_INPUT_BRINE_IN_TEMPERATURE], "inverter"
+        )
+
+    async def slow(block):
+        raise ModbusTimeoutError("slow")
+
+    failures = await async_find_unsupported(
+        slow, [ATTR_INPUT_BRINE_IN_TEMPERATURE], "inverter"
+    )
+    assert failures.keys() == {ATTR_INPUT_BRINE_IN_TEMPERATURE}
+
+
+async def test_capabilities_persisted(hass, hass_storage, simulator):
+    """Probing is stored per firmware and repeated after an update."""
+    address = REGISTERS[ATTR_INPUT_BRINE_IN_TEMPERATURE]["address"]
+    simulator.fail_addresses[("input", address)] = EXC_ILLEGAL_ADDRESS
+    simulator.pump.set_value(ATTR_INPUT_SOFTWARE_VERSION_MAJOR, 9)
+
+    coordinator = ThermiaGenesisDataUpdateCoordinator(
+        hass, simulator.host, simulator.port, "inverter", entry_id="entry"
+    )
+    await coordinator.async_probe_capabilities()
+    assert coordinator.unsupported == {ATTR_INPUT_BRINE_IN_TEMPERATURE}
+    assert coordinator.firmware.startswith("9.")
+    stored = hass_storage[f"{DOMAIN}.entry.capabilities"]["data"]
+    assert stored["unsupported"] == [ATTR_INPUT_BRINE_IN_TEMPERATURE]
+    # Failures while probing are expected and don't slow down the polls
+    assert coordinator.tuner.errors == 0
+
+    # Unsupported registers are left out of the polls
+    coordinator.registerAttribute([ATTR_INPUT_BRINE_IN_TEMPERATURE])
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    await coordinator.async_shutdown()
+
+    simulator.reset_stats()
+    again = ThermiaGenesisDataUpdateCoordinator(
+        hass, simulator.host, simulator.port, "inverter", entry_id="entry"
+    )
+    await again.async_probe_capabilities()
+    assert again.unsupported == coordinator.unsupported
+    assert simulator.requests == 1
+
+    simulator.fail_addresses.clear()
+    simulator.pump.set_value(ATTR_INPUT_SOFTWARE_VERSION_MAJOR, 10)
+    await again.async_probe_capabilities()
+    assert again.firmware.startswith("10.")
+    assert again.unsupported == set()
+    assert simulator.requests > 2
+    await again.async_shutdown()
+
+
+async def test_timeouts_quarantined(hass, hass_storage, simulator):
+    """Registers that only time out are retried rather than stored."""
+    coordinator = ThermiaGenesisDataUpdateCoordinator(
+        hass, simulator.host, simulator.port, "inverter", entry_id="entry"
+    )
+    read_block = coordinator._async_read_block
+
+    async def slow_brine(block, tune=True):
+        if ATTR_INPUT_BRINE_IN_TEMPERATURE in block.slots:
+            raise ModbusTimeoutError("slow")
+        return await read_block(block, tune)
+
+    coordinator._async_read_block = slow_brine
+    await coordinator.async_probe_capabilities()
+    assert coordinator.unsupported == set()
+    assert coordinator.quarantine.excludes(ATTR_INPUT_BRINE_IN_TEMPERATURE)
+    assert hass_storage[f"{DOMAIN}.entry.capabilities"]["data"]["unsupported"] == []
+    await coordinator.async_shutdown()
+
+
+async def test_conditional_registers_not_stored(hass, hass_storage, socket_enabled):
+    """Conditional registers are only probed when enabled and never stored."""
+    address = REGISTERS[ATTR_HOLDING_FIXED_SYSTEM_SUPPLY_SET_POINT]["address"]
+    simulator = HeatPumpSimulator(
+        "mega", fail_addresses={("holding", address): EXC_ILLEGAL_ADDRESS}
+    )
+    await simulator.start()
+    coordinator = ThermiaGenesisDataUpdateCoordinator(
+        hass, simulator.host, simulator.port, "mega", entry_id="entry"
+    )
+    coordinator.data = {ATTR_COIL_ENABLE_FIXED_SYSTEM_SUPPLY_SET_POINT: False}
+    await coordinator.async_probe_capabilities()
+    assert not coordinator.quarantine.excludes(
+        ATTR_HOLDING_FIXED_SYSTEM_SUPPLY_SET_POINT
+    )
+
+    hass_storage.clear()
+    coordinator.firmware = None
+    coordinator.data = {ATTR_COIL_ENABLE_FIXED_SYSTEM_SUPPLY_SET_POINT: True}
+    await coordinator.async_probe_capabilities()
+    assert coordinator.unsupported == set()
+    assert coordinator.quarantine.excludes(ATTR_HOLDING_FIXED_SYSTEM_SUPPLY_SET_POINT)
+    assert hass_storage[f"{DOMAIN}.entry.capabilities"]["data"]["unsupported"] == []
+    await coordinator.async_shutdown()
+    await simulator.stop()
+
+
+async def test_probe_after_restored_refresh(
+    hass, hass_storage, enable_custom_integrations, simulator
+):
+    """A restored entry refreshes before probing in the background."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={
+            CONF_HOST: simulator.host,
+            CONF_PORT: simulator.port,
+            CONF_TYPE: "inverter",
+        },
+    )
+    entry.add_to_hass(hass)
+    hass_storage[f"{DOMAIN}.{entry.entry_id}"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.{entry.entry_id}",
+        "data": {"kind": "inverter", "data": {}, "read_at": {}},
+    }
+    hass_storage[f"{DOMAIN}.{entry.entry_id}.capabilities"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.{entry.entry_id}.capabilities",
+        "data": {
+            "kind": "inverter",
+            ATTR_FIRMWARE: "0.0.0",
+            "unsupported": [ATTR_INPUT_BRINE_IN_TEMPERATURE],
+        },
+    }
+    stale = []
+
+    async def probe(coordinator):
+        stale.append(coordinator.stale)
+
+    with patch.object(
+        ThermiaGenesisDataUpdateCoordinator,
+        "async_probe_capabilities",
+        autospec=True,
+        side_effect=probe,
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        coordinator = hass.data[DOMAIN][entry.entry_id]
+        # The stored result applies until the probe is done
+        assert coordinator.unsupported == {ATTR_INPUT_BRINE_IN_TEMPERATURE}
+        assert stale == []
+        # Background tasks aren't waited for by async_block_till_done
+        for _ in range(100):
+            if stale:
+                break
+            await asyncio.sleep(0.01)
+    assert stale == [False]
+    assert coordinator.last_update_success
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_unsupported_entities_skipped(
+    hass, enable_custom_integrations, simulator
+):
+    """No entity is created for a register the heat pump doesn't answer for."""
+    address = REGISTERS[ATTR_INPUT_BRINE_IN_TEMPERATURE]["address"]
+    simulator.fail_addresses[("input", address)] = EXC_ILLEGAL_ADDRESS
+    address = REGISTERS[ATTR_INPUT_POOL_RETURN_LINE_TEMPERATURE]["address"]
+    simulator.fail_addresses[("input", address)] = EXC_ILLEGAL_ADDRESS
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={
+            CONF_HOST: simulator.host,
+            CONF_PORT: simulator.port,
+            CONF_TYPE: "inverter",
+        },
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    registry = er.async_get(hass)
+    unique_ids = {
+        entity.unique_id
+        for entity in er.async_entries_for_config_entry(registry, entry.entry_id)
+    }
+    assert (
+        f"{DOMAIN}_{entry.entry_id}_{ATTR_INPUT_BRINE_IN_TEMPERATURE}" not in unique_ids
+    )
+    assert f"{DOMAIN}_{entry.entry_id}_pool" not in unique_ids
+    assert f"{DOMAIN}_{entry.entry_id}_tap_water" in unique_ids
+    assert f"{DOMAIN}_{entry.entry_id}_heatpump" in unique_ids
+    assert await hass.config_entries.async_unload(entry.entry_id)
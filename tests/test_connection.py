@@ -0,0 +1,41 @@
+"""Test Thermia Genesis connection manager."""
+from unittest.mock import patch
+
+import pytest
+from custom_components.thermiagenesis.connection import ThermiaConnection
+
+
+async def test_reconnect_backoff(hass):
+    """Failed connects back off before the next attempt."""
+    connection = ThermiaConnection(hass, "127.0.0.1", 502)
+    with patch.object(connection._client, "open", return_value=False) as mock_open:
+        with pytest.raises(ConnectionError):
+            await connection.async_ensure_open()
+        with pytest.raises(ConnectionError, match="before reconnecting"):
+            await connection.async_ensure_open()
+        assert mock_open.call_count == 1
+
+        connection._retry_at = 0
+        with pytest.raises(ConnectionError):
+            await connection.async_ensure_open()
+        assert mock_open.call_count == 2
+        assert connection._failures == 2
+
+
+async def test_stale_connection_is_reopened(hass):
+    """An idle connection that fails the probe read is reopened."""
+    connection = ThermiaConnection(hass, "127.0.0.1", 502)
+    client = connection._client
+    with patch.object(client, "is_open", return_value=True), patch.object(
+        client, "read_input_registers", return_value=None
+    ), patch.object(client, "close") as mock_close, patch.object(
+        client, "open", return_value=True
+    ) as mock_open:
+        await connection.async_ensure_open()
+        assert mock_close.called
+        assert mock_open.called
+
+        # A recently used connection is trusted without probing
+        mock_open.reset_mock()
+        await connection.async_ensure_open()
+        assert not mock_open.called
@@ -0,0 +1,316 @@
+"""Test Thermia Genesis data update coordinator."""
+import asyncio
+import time
+from datetime import timedelta
+from unittest.mock import AsyncMock
+from unittest.mock import patch
+
+from custom_components.thermiagenesis import poll_tier
+from custom_components.thermiagenesis import startup_registers
+from custom_components.thermiagenesis import ThermiaGenesisDataUpdateCoordinator
+from custom_components.thermiagenesis.const import DOMAIN
+from custom_components.thermiagenesis.const import HEATPUMP_SENSOR
+from custom_components.thermiagenesis.const import POLL_FAST
+from custom_components.thermiagenesis.const import POLL_NORMAL
+from custom_components.thermiagenesis.const import POLL_ONCE
+from custom_components.thermiagenesis.const import POLL_SLOW
+from custom_components.thermiagenesis.planner import plan_reads
+from homeassistant.const import CONF_HOST
+from homeassistant.const import CONF_PORT
+from homeassistant.const import CONF_TYPE
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pythermiagenesis.const import ATTR_COIL_ENABLE_FIXED_SYSTEM_SUPPLY_SET_POINT
+from pythermiagenesis.const import ATTR_COIL_ENABLE_HEAT
+from pythermiagenesis.const import ATTR_HOLDING_COMFORT_WHEEL_SETTING
+from pythermiagenesis.const import ATTR_HOLDING_FIXED_SYSTEM_SUPPLY_SET_POINT
+from pythermiagenesis.const import ATTR_INPUT_COMPRESSOR_SPEED_RPM
+from pythermiagenesis.const import ATTR_INPUT_FIRST_PRIORITISED_DEMAND
+from pythermiagenesis.const import ATTR_INPUT_ROOM_TEMPERATURE_SENSOR
+from pythermiagenesis.const import ATTR_INPUT_SOFTWARE_VERSION_MAJOR
+
+from .simulator import HeatPumpSimulator
+
+
+def _coordinator(hass):
+    return ThermiaGenesisDataUpdateCoordinator(
+        hass, host="127.0.0.1", port=502, kind="inverter"
+    )
+
+
+async def test_poll_tiers(hass):
+    """Registers get the tier declared next to their entity type."""
+    assert poll_tier(ATTR_INPUT_COMPRESSOR_SPEED_RPM) == POLL_FAST
+    assert poll_tier(ATTR_HOLDING_COMFORT_WHEEL_SETTING) == POLL_SLOW
+    assert poll_tier(ATTR_INPUT_SOFTWARE_VERSION_MAJOR) == POLL_ONCE
+    # Registers without an entity type of their own use the normal tier
+    assert poll_tier(ATTR_COIL_ENABLE_HEAT) == POLL_NORMAL
+
+
+async def test_due_registers(hass):
+    """Only registers whose tier interval has elapsed are due."""
+    coordinator = _coordinator(hass)
+    registers = [
+        ATTR_INPUT_COMPRESSOR_SPEED_RPM,
+        ATTR_HOLDING_COMFORT_WHEEL_SETTING,
+        ATTR_INPUT_SOFTWARE_VERSION_MAJOR,
+        ATTR_COIL_ENABLE_HEAT,
+    ]
+    coordinator.registerAttribute(registers)
+    assert sorted(coordinator._due_registers(0)) == sorted(registers)
+
+    for name in registers:
+        coordinator._last_read[name] = 0
+    assert coordinator._due_registers(1) == []
+    assert coordinator._due_registers(5) == [ATTR_INPUT_COMPRESSOR_SPEED_RPM]
+    assert sorted(coordinator._due_registers(30)) == sorted(
+        [ATTR_INPUT_COMPRESSOR_SPEED_RPM, ATTR_COIL_ENABLE_HEAT]
+    )
+    assert ATTR_HOLDING_COMFORT_WHEEL_SETTING in coordinator._due_registers(300)
+    assert ATTR_INPUT_SOFTWARE_VERSION_MAJOR not in coordinator._due_registers(10**6)
+
+
+async def test_listeners_notified_on_change(hass):
+    """Listeners are only called when one of their registers changed."""
+    coordinator = _coordinator(hass)
+    coordinator.data = {ATTR_INPUT_COMPRESSOR_SPEED_RPM: 1000, ATTR_COIL_ENABLE_HEAT: 1}
+    calls = []
+    coordinator.async_add_listener(
+        lambda: calls.append("rpm"), (ATTR_INPUT_COMPRESSOR_SPEED_RPM,)
+    )
+    coordinator.async_add_listener(
+        lambda: calls.append("heat"), (ATTR_COIL_ENABLE_HEAT,)
+    )
+    coordinator.async_add_listener(lambda: calls.append("all"))
+
+    # The first notification after setup reaches everyone
+    coordinator.async_update_listeners()
+    assert sorted(calls) == ["all", "heat", "rpm"]
+
+    calls.clear()
+    coordinator._changed = coordinator._changed_registers(
+        {ATTR_INPUT_COMPRESSOR_SPEED_RPM: 1200, ATTR_COIL_ENABLE_HEAT: 1}
+    )
+    coordinator.async_update_listeners()
+    assert sorted(calls) == ["all", "rpm"]
+
+    # Availability changes reach everyone
+    calls.clear()
+    coordinator.last_update_success = False
+    coordinator._changed = set()
+    coordinator.async_update_listeners()
+    assert sorted(calls) == ["all", "heat", "rpm"]
+    await coordinator.async_shutdown()
+
+
+async def test_read_back_enabled_register(hass, socket_enabled):
+    """Registers enabled by a write are read back with it."""
+    simulator = HeatPumpSimulator("mega")
+    await simulator.start()
+    coordinator = ThermiaGenesisDataUpdateCoordinator(
+        hass, simulator.host, simulator.port, "mega"
+    )
+    coordinator.data = {ATTR_COIL_ENABLE_FIXED_SYSTEM_SUPPLY_SET_POINT: False}
+    await coordinator._async_set_data(
+        ATTR_COIL_ENABLE_FIXED_SYSTEM_SUPPLY_SET_POINT, True
+    )
+    assert coordinator.data[ATTR_COIL_ENABLE_FIXED_SYSTEM_SUPPLY_SET_POINT]
+    assert ATTR_HOLDING_FIXED_SYSTEM_SUPPLY_SET_POINT in coordinator.data
+    await coordinator.async_shutdown()
+    await simulator.stop()
+
+
+async def test_read_back_failure(hass):
+    """A failed read back doesn't fail the write but asks for a refresh."""
+    coordinator = _coordinator(hass)
+    coordinator.data = {ATTR_COIL_ENABLE_HEAT: False}
+    coordinator.tuner.delay = 0
+    with patch.object(
+        coordinator.connection, "async_ensure_open", AsyncMock()
+    ), patch.object(coordinator.connection, "async_write", AsyncMock()), patch.object(
+        coordinator.connection, "async_read", AsyncMock(side_effect=ConnectionError)
+    ), patch.object(
+        coordinator, "async_request_refresh", AsyncMock()
+    ) as refresh:
+        await coordinator._async_set_data(ATTR_COIL_ENABLE_HEAT, True)
+    refresh.assert_awaited_once()
+    await coordinator.async_shutdown()
+
+
+async def test_read_back_after_write(hass):
+    """A write reads back the register and its dependencies only."""
+    coordinator = _coordinator(hass)
+    coordinator.data = {
+        ATTR_COIL_ENABLE_HEAT: False,
+        ATTR_INPUT_FIRST_PRIORITISED_DEMAND: "No demand",
+        ATTR_INPUT_COMPRESSOR_SPEED_RPM: 0,
+    }
+    coordinator.tuner.delay = 0
+    read = AsyncMock(
+        side_effect=lambda block, unit_id=None: (
+            [4] * block.count if block.reg_type == "input" else [True] * block.count
+        )
+    )
+    calls = []
+    coordinator.async_add_listener(
+        lambda: calls.append("heat"), (ATTR_COIL_ENABLE_HEAT,)
+    )
+    coordinator.async_add_listener(
+        lambda: calls.append("rpm"), (ATTR_INPUT_COMPRESSOR_SPEED_RPM,)
+    )
+    coordinator._notified_success = True
+    with patch.object(
+        coordinator.connection, "async_ensure_open", AsyncMock()
+    ), patch.object(
+        coordinator.connection, "async_write", AsyncMock()
+    ) as write, patch.object(
+        coordinator.connection, "async_read", read
+    ):
+        await coordinator._async_set_data(ATTR_COIL_ENABLE_HEAT, True)
+
+    block = write.await_args.args[0]
+    assert (block.reg_type, block.start, block.values) == ("coil", 9, [True])
+    assert read.await_count == 2
+    assert coordinator.data[ATTR_COIL_ENABLE_HEAT] is True
+    assert coordinator.data[ATTR_INPUT_FIRST_PRIORITISED_DEMAND] == "Heat"
+    assert calls == ["heat"]
+    await coordinator.async_shutdown()
+
+
+async def test_queued_writes_are_coalesced(hass):
+    """Rapid writes are debounced into one write with the last values."""
+    coordinator = _coordinator(hass)
+    with patch.object(coordinator, "_async_set_data_many", AsyncMock()) as set_many:
+        tasks = [
+            hass.async_create_task(
+                coordinator._async_queue_set_data(
+                    {ATTR_HOLDING_COMFORT_WHEEL_SETTING: value}
+                )
+            )
+            for value in (20, 21, 22)
+        ]
+        tasks.append(
+            hass.async_create_task(
+                coordinator._async_queue_set_data({ATTR_COIL_ENABLE_HEAT: True})
+            )
+        )
+        await asyncio.sleep(0)
+        assert not set_many.called
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+        await asyncio.gather(*tasks)
+
+    set_many.assert_awaited_once_with(
+        {ATTR_HOLDING_COMFORT_WHEEL_SETTING: 22, ATTR_COIL_ENABLE_HEAT: True}
+    )
+
+
+async def test_startup_registers(hass):
+    """The startup read covers the entities that will be enabled."""
+    registry = er.async_get(hass)
+    registry.async_get_or_create(
+        "sensor", DOMAIN, f"thermiagenesis_{ATTR_INPUT_COMPRESSOR_SPEED_RPM}"
+    )
+    registry.async_get_or_create(
+        "climate",
+        DOMAIN,
+        "thermiagenesis_heat",
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+    registers = startup_registers(hass, "inverter")
+    assert HEATPUMP_SENSOR in registers
+    # Disabled by default but enabled in the entity registry
+    assert ATTR_INPUT_COMPRESSOR_SPEED_RPM in registers
+    # Enabled by default but disabled by the user
+    assert ATTR_INPUT_ROOM_TEMPERATURE_SENSOR not in registers
+    assert ATTR_HOLDING_COMFORT_WHEEL_SETTING not in registers
+
+
+async def test_setup_reads_once(hass, enable_custom_integrations, simulator):
+    """Setting up an entry reads the entity registers in one refresh."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_HOST: simulator.host,
+            CONF_PORT: simulator.port,
+            CONF_TYPE: "inverter",
+        },
+    )
+    entry.add_to_hass(hass)
+    # Probing the registers is covered by test_capabilities
+    with patch.object(
+        ThermiaGenesisDataUpdateCoordinator, "async_probe_capabilities", AsyncMock()
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    registers = startup_registers(hass, "inverter")
+    assert set(registers) <= set(coordinator.data)
+    assert simulator.requests == len(plan_reads(registers, "inverter"))
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_snapshot_restore(hass, hass_storage, simulator):
+    """Values persisted before a restart are restored as stale."""
+    registers = [
+        ATTR_INPUT_COMPRESSOR_SPEED_RPM,
+        ATTR_HOLDING_COMFORT_WHEEL_SETTING,
+        ATTR_INPUT_SOFTWARE_VERSION_MAJOR,
+    ]
+    coordinator = ThermiaGenesisDataUpdateCoordinator(
+        hass, simulator.host, simulator.port, "inverter", entry_id="entry"
+    )
+    coordinator.registerAttribute(registers)
+    await coordinator.async_refresh()
+    await coordinator.async_shutdown()
+    assert hass_storage[f"{DOMAIN}.entry"]["data"]["data"] == coordinator.data
+
+    restored = ThermiaGenesisDataUpdateCoordinator(
+        hass, simulator.host, simulator.port, "inverter", entry_id="entry"
+    )
+    restored.registerAttribute(registers)
+    assert await restored.async_restore_snapshot()
+    assert restored.stale
+    assert restored.data == coordinator.data
+    # Registers read just before the restart are not due again, except for
+    # those that are read once per start
+    assert restored._due_registers(time.monotonic()) == [
+        ATTR_INPUT_SOFTWARE_VERSION_MAJOR
+    ]
+
+    calls = []
+    restored.async_add_listener(
+        lambda: calls.append("wheel"), (ATTR_HOLDING_COMFORT_WHEEL_SETTING,)
+    )
+    await restored.async_refresh()
+    assert not restored.stale
+    assert calls == ["wheel"]
+    await restored.async_shutdown()
+
+
+async def test_remove_entry_stores(
+    hass, hass_storage, enable_custom_integrations, simulator
+):
+    """Removing an entry removes its snapshot and capabilities."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={
+            CONF_HOST: simulator.host,
+            CONF_PORT: simulator.port,
+            CONF_TYPE: "inverter",
+        },
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    assert f"{DOMAIN}.{entry.entry_id}" in hass_storage
+    assert f"{DOMAIN}.{entry.entry_id}.capabilities" in hass_storage
+
+    await hass.config_entries.async_remove(entry.entry_id)
+    assert f"{DOMAIN}.{entry.entry_id}" not in hass_storage
+    assert f"{DOMAIN}.{entry.entry_id}.capabilities" not in hass_storage
@@ -0,0 +1,66 @@
+"""Test the Thermia Genesis demand-aware polling."""
+import time
+
+from custom_components.thermiagenesis import ThermiaGenesisDataUpdateCoordinator
+from custom_components.thermiagenesis.const import HEATPUMP_SENSOR
+from custom_components.thermiagenesis.const import POLL_FAST
+from custom_components.thermiagenesis.demand import demand_registers
+from custom_components.thermiagenesis.demand import DemandPolicy
+from custom_components.thermiagenesis.demand import IDLE_TIER
+from pythermiagenesis.const import ATTR_INPUT_BRINE_IN_TEMPERATURE
+from pythermiagenesis.const import ATTR_INPUT_COMPRESSOR_CURRENT_GEAR
+from pythermiagenesis.const import ATTR_INPUT_COMPRESSOR_SPEED_RPM
+from pythermiagenesis.const import ATTR_INPUT_SYSTEM_SUPPLY_LINE_TEMPERATURE
+
+
+def test_demand_registers():
+    """Compressor, brine and supply registers follow the demand."""
+    registers = demand_registers("inverter")
+    assert ATTR_INPUT_COMPRESSOR_SPEED_RPM in registers
+    assert ATTR_INPUT_BRINE_IN_TEMPERATURE in registers
+    assert ATTR_INPUT_SYSTEM_SUPPLY_LINE_TEMPERATURE in registers
+    assert ATTR_INPUT_COMPRESSOR_CURRENT_GEAR not in registers
+    assert HEATPUMP_SENSOR not in registers
+
+
+def test_policy():
+    """Idle slows the demand registers, demand and gear changes wake them."""
+    policy = DemandPolicy("inverter")
+    rpm = ATTR_INPUT_COMPRESSOR_SPEED_RPM
+    # Unknown demand counts as active
+    assert not policy.update({})
+    assert policy.tier(rpm, POLL_FAST) == POLL_FAST
+
+    assert not policy.update({HEATPUMP_SENSOR: "No demand"})
+    assert policy.tier(rpm, POLL_FAST) == IDLE_TIER
+    assert policy.tier(HEATPUMP_SENSOR, POLL_FAST) == POLL_FAST
+
+    assert policy.update({HEATPUMP_SENSOR: "Heat"})
+    assert policy.tier(rpm, POLL_FAST) == POLL_FAST
+    heating = {HEATPUMP_SENSOR: "Heat", ATTR_INPUT_COMPRESSOR_CURRENT_GEAR: 3}
+    assert not policy.update(heating)
+    assert not policy.update(heating)
+    assert policy.update({**heating, ATTR_INPUT_COMPRESSOR_CURRENT_GEAR: 4})
+
+
+async def test_idle_polling(hass, simulator):
+    """The demand registers are read less often while the pump is idle."""
+    coordinator = ThermiaGenesisDataUpdateCoordinator(
+        hass, simulator.host, simulator.port, "inverter"
+    )
+    coordinator.registerAttribute([HEATPUMP_SENSOR, ATTR_INPUT_COMPRESSOR_SPEED_RPM])
+    simulator.pump.set_raw(HEATPUMP_SENSOR, 99)
+    await coordinator.async_refresh()
+    assert coordinator.demand.idle
+    later = time.monotonic() + 10
+    assert coordinator._due_registers(later) == [HEATPUMP_SENSOR]
+
+    simulator.pump.set_raw(HEATPUMP_SENSOR, 4)
+    coordinator._last_read[HEATPUMP_SENSOR] = 0
+    await coordinator.async_refresh()
+    assert not coordinator.demand.idle
+    # Waking up makes the demand registers due right away
+    assert coordinator._due_registers(time.monotonic()) == [
+        ATTR_INPUT_COMPRESSOR_SPEED_RPM
+    ]
+    await coordinator.async_shutdown()
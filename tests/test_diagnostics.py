@@ -0,0 +1,38 @@
+"""Test Thermia Genesis diagnostics."""
+from custom_components.thermiagenesis.const import DOMAIN
+from custom_components.thermiagenesis.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from homeassistant.components.diagnostics import REDACTED
+from homeassistant.const import CONF_HOST
+from homeassistant.const import CONF_PORT
+from homeassistant.const import CONF_TYPE
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from .simulator import EXC_ILLEGAL_ADDRESS
+
+
+async def test_config_entry_diagnostics(hass, enable_custom_integrations, simulator):
+    """Diagnostics show the tuning, metrics and quarantine without the host."""
+    simulator.fail_addresses[("input", 14)] = EXC_ILLEGAL_ADDRESS
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={
+            CONF_HOST: simulator.host,
+            CONF_PORT: simulator.port,
+            CONF_TYPE: "inverter",
+        },
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    assert diagnostics["entry"][CONF_HOST] == REDACTED
+    assert diagnostics["entry"][CONF_PORT] == simulator.port
+    assert simulator.host not in str(diagnostics)
+    assert "input:14" in diagnostics["quarantine"]
+    assert diagnostics["tuning"]["max_block"]
+    assert diagnostics["metrics"]
+    assert await hass.config_entries.async_unload(entry.entry_id)
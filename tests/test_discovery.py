@@ -0,0 +1,81 @@
+"""Test searching the network for Thermia Genesis heat pumps."""
+import pytest
+from custom_components.thermiagenesis.const import CONF_NETWORK
+from custom_components.thermiagenesis.const import CONF_UNIT_ID
+from custom_components.thermiagenesis.const import DOMAIN
+from custom_components.thermiagenesis.discovery import async_identify
+from custom_components.thermiagenesis.discovery import async_scan
+from custom_components.thermiagenesis.discovery import mega_fingerprint
+from homeassistant import config_entries
+from homeassistant.const import CONF_HOST
+from homeassistant.const import CONF_PORT
+from homeassistant.const import CONF_TYPE
+from homeassistant.data_entry_flow import FlowResultType
+from pythermiagenesis.const import REGISTERS
+
+from .simulator import HeatPumpSimulator
+
+
+def test_mega_fingerprint():
+    """The fingerprint register only exists on the Mega."""
+    meta = REGISTERS[mega_fingerprint()]
+    assert meta["mega"] and not meta["inverter"]
+
+
+async def test_identify(hass, socket_enabled):
+    """Inverter and Mega are told apart."""
+    for kind in ("inverter", "mega"):
+        simulator = HeatPumpSimulator(kind=kind)
+        await simulator.start()
+        assert await async_identify(hass, simulator.host, simulator.port) == kind
+        await simulator.stop()
+    assert await async_identify(hass, simulator.host, simulator.port) is None
+
+
+async def test_scan(hass, simulator):
+    """Only hosts answering Modbus requests are found."""
+    assert await async_scan(hass, "127.0.0.1/32", simulator.port) == {
+        "127.0.0.1": "inverter"
+    }
+    closed = HeatPumpSimulator()
+    await closed.start()
+    await closed.stop()
+    assert await async_scan(hass, "127.0.0.1/32", closed.port) == {}
+    with pytest.raises(ValueError):
+        await async_scan(hass, "10.0.0.0/16", simulator.port)
+    # Rejected without listing the hosts
+    with pytest.raises(ValueError):
+        await async_scan(hass, "fd00::/64", simulator.port)
+
+
+async def test_scan_flow(hass, enable_custom_integrations, simulator):
+    """A heat pump found in the network can be added."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    assert result["type"] == FlowResultType.MENU
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"next_step_id": "scan"}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_NETWORK: "not a network", CONF_PORT: simulator.port}
+    )
+    assert result["errors"] == {CONF_NETWORK: "invalid_network"}
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_NETWORK: "127.0.0.1/32", CONF_PORT: simulator.port}
+    )
+    assert result["step_id"] == "select"
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_HOST: "127.0.0.1"}
+    )
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert result["data"] == {
+        CONF_HOST: "127.0.0.1",
+        CONF_PORT: simulator.port,
+        CONF_TYPE: "inverter",
+        CONF_UNIT_ID: 1,
+    }
+    await hass.async_block_till_done()
+    entry = result["result"]
+    assert await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,119 @@
+"""Test Thermia Genesis platform entities."""
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock
+from unittest.mock import patch
+
+from custom_components.thermiagenesis import ThermiaGenesisDataUpdateCoordinator
+from custom_components.thermiagenesis.binary_sensor import ThermiaBinarySensor
+from custom_components.thermiagenesis.climate import ThermiaClimateSensor
+from custom_components.thermiagenesis.const import BINARY_SENSOR_TYPES
+from custom_components.thermiagenesis.const import NUMBER_TYPES
+from custom_components.thermiagenesis.const import SENSOR_TYPES
+from custom_components.thermiagenesis.number import ThermiaGenericNumber
+from custom_components.thermiagenesis.sensor import ThermiaGenericSensor
+from custom_components.thermiagenesis.sensor import ThermiaHeatpumpSensor
+from homeassistant.components.climate.const import ATTR_TARGET_TEMP_HIGH
+from homeassistant.components.climate.const import ATTR_TARGET_TEMP_LOW
+from homeassistant.components.sensor import SensorStateClass
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+from pythermiagenesis.const import ATTR_DINPUT_ALARM_ACTIVE_CLASS_A
+from pythermiagenesis.const import ATTR_HOLDING_MAXIMUM_ALLOWED_GEAR_IN_HEATING
+from pythermiagenesis.const import ATTR_HOLDING_START_TEMPERATURE_TAP_WATER
+from pythermiagenesis.const import ATTR_HOLDING_STOP_TEMPERATURE_TAP_WATER
+from pythermiagenesis.const import ATTR_INPUT_COMPRESSOR_OPERATING_HOURS
+from pythermiagenesis.const import ATTR_INPUT_COMPRESSOR_SPEED_RPM
+from pythermiagenesis.const import ATTR_INPUT_FIRST_PRIORITISED_DEMAND
+
+
+async def test_static_metadata(hass):
+    """Entities expose the metadata of their entity type."""
+    coordinator = ThermiaGenesisDataUpdateCoordinator(
+        hass, host="127.0.0.1", port=502, kind="inverter"
+    )
+    coordinator.data = {ATTR_INPUT_COMPRESSOR_SPEED_RPM: 2400}
+
+    sensor = ThermiaGenericSensor(coordinator, ATTR_INPUT_COMPRESSOR_SPEED_RPM, {})
+    meta = SENSOR_TYPES[ATTR_INPUT_COMPRESSOR_SPEED_RPM]
+    assert sensor.name == meta["label"]
+    assert sensor.unique_id == f"thermiagenesis_{ATTR_INPUT_COMPRESSOR_SPEED_RPM}"
+    assert sensor.icon == meta["icon"]
+    assert sensor.unit_of_measurement == meta["unit"]
+    assert sensor.state_class == SensorStateClass.MEASUREMENT
+    assert sensor.entity_registry_enabled_default is False
+    assert not sensor.should_poll
+    assert sensor.state == 2400
+
+    number = ThermiaGenericNumber(
+        coordinator, ATTR_HOLDING_MAXIMUM_ALLOWED_GEAR_IN_HEATING, {}
+    )
+    meta = NUMBER_TYPES[ATTR_HOLDING_MAXIMUM_ALLOWED_GEAR_IN_HEATING]
+    assert number.native_min_value == meta["min_value"]
+    assert number.native_max_value == meta["max_value"]
+    assert number.native_step == 1
+
+    binary = ThermiaBinarySensor(coordinator, ATTR_DINPUT_ALARM_ACTIVE_CLASS_A, {})
+    meta = BINARY_SENSOR_TYPES[ATTR_DINPUT_ALARM_ACTIVE_CLASS_A]
+    assert binary.device_class == meta.get("device_class")
+    assert binary.extra_state_attributes == {}
+
+
+async def test_heatpump_attributes_follow_changes(hass):
+    """Only the attributes of changed registers are recomputed."""
+    coordinator = ThermiaGenesisDataUpdateCoordinator(
+        hass, host="127.0.0.1", port=502, kind="inverter"
+    )
+    coordinator.data = {ATTR_INPUT_COMPRESSOR_SPEED_RPM: 2400}
+    sensor = ThermiaHeatpumpSensor(coordinator, ATTR_INPUT_FIRST_PRIORITISED_DEMAND, {})
+    sensor.async_write_ha_state = lambda: None
+    await sensor.async_added_to_hass()
+    coordinator.async_set_updated_data(coordinator.data)
+    assert sensor.extra_state_attributes["Compressor_Speed_Rpm"] == "2400 rpm"
+    assert sensor.icon == "mdi-pulse"
+
+    coordinator.data = {
+        ATTR_INPUT_COMPRESSOR_SPEED_RPM: 3000,
+        ATTR_INPUT_COMPRESSOR_OPERATING_HOURS: 10,
+        ATTR_DINPUT_ALARM_ACTIVE_CLASS_A: True,
+    }
+    coordinator._changed = {
+        ATTR_INPUT_COMPRESSOR_OPERATING_HOURS,
+        ATTR_DINPUT_ALARM_ACTIVE_CLASS_A,
+    }
+    coordinator.async_update_listeners()
+    attributes = sensor.extra_state_attributes
+    assert attributes["Compressor_Speed_Rpm"] == "2400 rpm"
+    assert attributes["Compressor_Operating_Hours"] == "10 h"
+    assert "Active alarms" in attributes
+    assert sensor.icon == "mdi-alert"
+
+    coordinator.data = {ATTR_INPUT_COMPRESSOR_SPEED_RPM: 3000}
+    coordinator.async_set_updated_data(coordinator.data)
+    assert sensor.extra_state_attributes["Compressor_Speed_Rpm"] == "3000 rpm"
+    assert "Active alarms" not in sensor.extra_state_attributes
+    assert sensor.icon == "mdi-pulse"
+    await coordinator.async_shutdown()
+
+
+async def test_climate_temperatures_written_together(hass):
+    """Setting a temperature range writes both registers in one batch."""
+    coordinator = ThermiaGenesisDataUpdateCoordinator(
+        hass, host="127.0.0.1", port=502, kind="inverter"
+    )
+    climate = ThermiaClimateSensor(coordinator, "tap_water", {})
+    with patch.object(coordinator, "_async_set_data_many", AsyncMock()) as set_many:
+        task = hass.async_create_task(
+            climate.async_set_temperature(
+                **{ATTR_TARGET_TEMP_LOW: 45, ATTR_TARGET_TEMP_HIGH: 55}
+            )
+        )
+        await asyncio.sleep(0)
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+        await task
+    set_many.assert_awaited_once_with(
+        {
+            ATTR_HOLDING_START_TEMPERATURE_TAP_WATER: 45,
+            ATTR_HOLDING_STOP_TEMPERATURE_TAP_WATER: 55,
+        }
+    )
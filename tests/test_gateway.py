@@ -0,0 +1,120 @@
+"""Test several Thermia Genesis units behind one Modbus TCP gateway."""
+from custom_components.thermiagenesis.const import CONF_UNIT_ID
+from custom_components.thermiagenesis.const import DATA_GATEWAYS
+from custom_components.thermiagenesis.const import DOMAIN
+from homeassistant import config_entries
+from homeassistant.const import CONF_HOST
+from homeassistant.const import CONF_PORT
+from homeassistant.const import CONF_TYPE
+from homeassistant.data_entry_flow import FlowResultType
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pythermiagenesis.const import ATTR_INPUT_BRINE_IN_TEMPERATURE
+
+
+async def test_units_share_a_connection(hass, enable_custom_integrations, simulator):
+    """Units behind one gateway share its connection and read their own data."""
+    simulator.units = {1: simulator.pump, 2: type(simulator.pump)("inverter")}
+    simulator.units[1].set_value(ATTR_INPUT_BRINE_IN_TEMPERATURE, 5)
+    simulator.units[2].set_value(ATTR_INPUT_BRINE_IN_TEMPERATURE, -5)
+    entries = []
+    for unit_id in (1, 2):
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            version=2,
+            data={
+                CONF_HOST: simulator.host,
+                CONF_PORT: simulator.port,
+                CONF_TYPE: "inverter",
+                CONF_UNIT_ID: unit_id,
+            },
+        )
+        entry.add_to_hass(hass)
+        entries.append(entry)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert simulator.connections == 1
+    assert {unit_id for unit_id, _ in simulator.log} == {1, 2}
+    first, second = (hass.data[DOMAIN][entry.entry_id] for entry in entries)
+    assert first.gateway is second.gateway
+    assert first.data[ATTR_INPUT_BRINE_IN_TEMPERATURE] == 5
+    assert second.data[ATTR_INPUT_BRINE_IN_TEMPERATURE] == -5
+
+    assert await hass.config_entries.async_unload(entries[0].entry_id)
+    assert second.connection.is_open
+    assert await hass.config_entries.async_unload(entries[1].entry_id)
+    assert not second.connection.is_open
+    assert hass.data[DATA_GATEWAYS] == {}
+
+
+async def test_config_flow_unit_id(hass, enable_custom_integrations, simulator):
+    """The config flow checks the unit answers behind the gateway."""
+    data = {
+        CONF_HOST: simulator.host,
+        CONF_PORT: simulator.port,
+        CONF_TYPE: "inverter",
+        CONF_UNIT_ID: 3,
+    }
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}, data=data
+    )
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {"base": "connection_error"}
+
+    simulator.units[3] = simulator.pump
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}, data=data
+    )
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert result["title"] == f"{simulator.host}:{simulator.port} unit 3"
+
+
+async def test_config_flow_legacy_entry(hass, enable_custom_integrations, simulator):
+    """An entry without a unit id counts as unit 1 of its host."""
+    MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={
+            CONF_HOST: simulator.host,
+            CONF_PORT: simulator.port,
+            CONF_TYPE: "inverter",
+        },
+    ).add_to_hass(hass)
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": config_entries.SOURCE_USER},
+        data={
+            CONF_HOST: simulator.host,
+            CONF_PORT: simulator.port,
+            CONF_TYPE: "inverter",
+            CONF_UNIT_ID: 1,
+        },
+    )
+    assert result["type"] == FlowResultType.ABORT
+    assert result["reason"] == "already_configured"
+
+
+async def test_config_flow_through_gateway(hass, enable_custom_integrations, simulator):
+    """A unit behind a gateway in use is checked through its connection."""
+    simulator.units[2] = type(simulator.pump)("inverter")
+    data = {
+        CONF_HOST: simulator.host,
+        CONF_PORT: simulator.port,
+        CONF_TYPE: "inverter",
+    }
+    entry = MockConfigEntry(domain=DOMAIN, version=2, data=data)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": config_entries.SOURCE_USER},
+        data={**data, CONF_UNIT_ID: 2},
+    )
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    await hass.async_block_till_done()
+    assert simulator.connections == 1
+    assert hass.data[DOMAIN][entry.entry_id].connection.is_open
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        assert await hass.config_entries.async_unload(entry.entry_id)
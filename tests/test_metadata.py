@@ -0,0 +1,31 @@
+"""Test Thermia Genesis compiled register metadata."""
+import pytest
+from custom_components.thermiagenesis.const import NUMBER_TYPES
+from custom_components.thermiagenesis.const import SENSOR_TYPES
+from custom_components.thermiagenesis.metadata import platform_metadata
+from custom_components.thermiagenesis.metadata import register_metadata
+from pythermiagenesis.const import ATTR_HOLDING_COMFORT_WHEEL_SETTING
+from pythermiagenesis.const import ATTR_INPUT_COMPRESSOR_SPEED_RPM
+from pythermiagenesis.const import REGISTERS
+
+
+def test_compiled_from_const():
+    """Records carry the entity type and register details."""
+    meta = register_metadata("sensor")[ATTR_INPUT_COMPRESSOR_SPEED_RPM]
+    assert meta.label == SENSOR_TYPES[ATTR_INPUT_COMPRESSOR_SPEED_RPM]["label"]
+    assert meta.address == REGISTERS[ATTR_INPUT_COMPRESSOR_SPEED_RPM]["address"]
+    assert meta.reg_type == "input"
+    number = register_metadata("number")[ATTR_HOLDING_COMFORT_WHEEL_SETTING]
+    assert number.max_value == NUMBER_TYPES[ATTR_HOLDING_COMFORT_WHEEL_SETTING].get(
+        "max_value"
+    )
+    with pytest.raises(AttributeError):
+        meta.label = "Changed"
+
+
+def test_filtered_per_model():
+    """Each model only gets the registers it has, built once."""
+    for kind in ("inverter", "mega"):
+        names = [meta.name for meta in platform_metadata("sensor", kind)]
+        assert names == [name for name in SENSOR_TYPES if REGISTERS[name][kind]]
+    assert platform_metadata("sensor", "mega") is platform_metadata("sensor", "mega")
@@ -0,0 +1,77 @@
+"""Test Thermia Genesis Modbus request statistics."""
+from custom_components.thermiagenesis import ThermiaGenesisDataUpdateCoordinator
+from custom_components.thermiagenesis.connection import ModbusExceptionError
+from custom_components.thermiagenesis.connection import ModbusTimeoutError
+from custom_components.thermiagenesis.const import DIAGNOSTIC_FAILURES
+from custom_components.thermiagenesis.const import DIAGNOSTIC_POLL_DURATION
+from custom_components.thermiagenesis.metrics import LatencyHistogram
+from custom_components.thermiagenesis.metrics import ModbusMetrics
+from custom_components.thermiagenesis.metrics import read_sizes
+from custom_components.thermiagenesis.planner import plan_reads
+from pythermiagenesis.const import ATTR_INPUT_COMPRESSOR_SPEED_RPM
+from pythermiagenesis.const import ATTR_INPUT_SYSTEM_SUPPLY_LINE_TEMPERATURE
+from pythermiagenesis.const import REGISTERS
+
+from .simulator import EXC_ILLEGAL_ADDRESS
+
+
+def test_histogram_buckets():
+    """Latencies land in the first bucket they fit in."""
+    histogram = LatencyHistogram()
+    for latency in (0.001, 0.005, 0.007, 10):
+        histogram.observe(latency)
+    result = histogram.as_dict()
+    assert result["count"] == 4
+    assert result["buckets"]["<=5ms"] == 2
+    assert result["buckets"]["<=10ms"] == 1
+    assert result["buckets"][">5000ms"] == 1
+    assert result["max_ms"] == 10000
+
+
+def test_failures_per_register():
+    """Failures count against every register of the request."""
+    metrics = ModbusMetrics()
+    (block,) = plan_reads(
+        [ATTR_INPUT_COMPRESSOR_SPEED_RPM, ATTR_INPUT_SYSTEM_SUPPLY_LINE_TEMPERATURE],
+        "inverter",
+    )
+    metrics.record_failure(block.slots, ModbusTimeoutError("slow"), read_sizes(block))
+    metrics.record_failure(
+        block.slots, ModbusExceptionError("busy", 6), read_sizes(block)
+    )
+    metrics.record_read(block, 0.01)
+
+    stats = metrics.registers[ATTR_INPUT_COMPRESSOR_SPEED_RPM]
+    assert stats == {"retries": 2, "timeouts": 1, "errors": 0, "exceptions": {6: 1}}
+    assert metrics.requests == 3
+    assert metrics.failures == 2
+    assert metrics.bytes_sent == 3 * 12
+    assert metrics.value(DIAGNOSTIC_FAILURES) == 2
+
+
+async def test_coordinator_metrics(hass, simulator):
+    """Polls against the simulator fill in the statistics."""
+    address = REGISTERS[ATTR_INPUT_COMPRESSOR_SPEED_RPM]["address"]
+    simulator.fail_addresses[("input", address)] = EXC_ILLEGAL_ADDRESS
+    coordinator = ThermiaGenesisDataUpdateCoordinator(
+        hass, host=simulator.host, port=simulator.port, kind="inverter"
+    )
+    coordinator.registerAttribute([ATTR_INPUT_COMPRESSOR_SPEED_RPM])
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert ATTR_INPUT_COMPRESSOR_SPEED_RPM not in coordinator.data
+    simulator.fail_addresses.clear()
+    coordinator.quarantine.until[("input", address)] = 0
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert ATTR_INPUT_COMPRESSOR_SPEED_RPM in coordinator.data
+    await coordinator.async_shutdown()
+
+    metrics = coordinator.metrics
+    stats = metrics.as_dict()
+    assert stats["registers"][ATTR_INPUT_COMPRESSOR_SPEED_RPM]["exceptions"] == {
+        EXC_ILLEGAL_ADDRESS: 1
+    }
+    assert stats["requests"] == simulator.requests
+    assert metrics.bytes == simulator.bytes_sent + simulator.bytes_received
+    assert metrics.value(DIAGNOSTIC_POLL_DURATION) is not None
@@ -0,0 +1,104 @@
+"""Test Thermia Genesis read planner."""
+import pytest
+from custom_components.thermiagenesis.planner import plan_reads
+from custom_components.thermiagenesis.planner import plan_writes
+from pythermiagenesis.const import ATTR_COIL_ENABLE_FIXED_SYSTEM_SUPPLY_SET_POINT
+from pythermiagenesis.const import ATTR_HOLDING_FIXED_SYSTEM_SUPPLY_SET_POINT
+from pythermiagenesis.const import KEY_REG_TYPE
+from pythermiagenesis.const import REG_INPUT
+from pythermiagenesis.const import REGISTERS
+
+
+def test_plan_covers_all_registers():
+    """Every readable register ends up in exactly one block."""
+    for kind in ("inverter", "mega"):
+        registers = [name for name, meta in REGISTERS.items() if meta[kind]]
+        blocks = plan_reads(registers, kind, known={})
+        planned = [name for block in blocks for name in block.slots]
+        expected = set(registers) - {ATTR_HOLDING_FIXED_SYSTEM_SUPPLY_SET_POINT}
+        assert sorted(planned) == sorted(expected)
+        # Far fewer requests than one per 16 registers
+        assert len(blocks) < len(registers) / 8
+
+
+def test_plan_merges_neighbours_and_splits_gaps():
+    """Near registers share a block, distant ones do not."""
+    inputs = sorted(
+        (meta["address"], name)
+        for name, meta in REGISTERS.items()
+        if meta["inverter"] and meta[KEY_REG_TYPE] == REG_INPUT
+    )
+    near = [inputs[0][1], inputs[1][1]]
+    blocks = plan_reads(near, "inverter")
+    assert len(blocks) == 1
+    assert blocks[0].start == inputs[0][0]
+
+    far = [inputs[0][1], inputs[-1][1]]
+    assert len(plan_reads(far, "inverter")) == 2
+
+
+def test_plan_respects_max_block():
+    """Blocks never exceed the requested size."""
+    registers = [name for name, meta in REGISTERS.items() if meta["mega"]]
+    max_block = {"coil": 8, "dinput": 8, "input": 4, "holding": 4}
+    for block in plan_reads(registers, "mega", max_block=max_block):
+        assert block.count <= max_block[block.reg_type]
+
+
+def test_plan_conditional_register():
+    """The fixed supply set point is only read when enabled."""
+    registers = [ATTR_HOLDING_FIXED_SYSTEM_SUPPLY_SET_POINT]
+    assert plan_reads(registers, "mega") == []
+    known = {ATTR_COIL_ENABLE_FIXED_SYSTEM_SUPPLY_SET_POINT: True}
+    assert len(plan_reads(registers, "mega", known=known)) == 1
+
+
+def test_block_decode():
+    """Block values are decoded like the library does."""
+    blocks = plan_reads(
+        [
+            "input_compressor_operating_hours",
+            "input_first_prioritised_demand",
+            "input_outdoor_temperature",
+        ],
+        "inverter",
+    )
+    data = {}
+    for block in blocks:
+        values = [0] * block.count
+        for name, offset in block.slots.items():
+            if name == "input_compressor_operating_hours":
+                values[offset : offset + 2] = [1, 2]
+            elif name == "input_first_prioritised_demand":
+                values[offset] = 4
+            else:
+                values[offset] = 65536 - 250
+        data.update(block.decode(values))
+    assert data["input_compressor_operating_hours"] == 65538
+    assert data["input_first_prioritised_demand"] == "Heat"
+    assert data["input_outdoor_temperature"] == -2.5
+
+
+def test_plan_writes_merges_adjacent_registers():
+    """Adjacent holding registers are written in one request."""
+    blocks = plan_writes(
+        {
+            "holding_stop_temperature_tap_water": 55,
+            "holding_start_temperature_tap_water": -1.5,
+            "coil_enable_heat": 1,
+        }
+    )
+    assert [(b.reg_type, b.start, b.values) for b in blocks] == [
+        ("coil", 9, [True]),
+        ("holding", 22, [65386, 5500]),
+    ]
+    assert blocks[1].names == [
+        "holding_start_temperature_tap_water",
+        "holding_stop_temperature_tap_water",
+    ]
+
+
+def test_plan_writes_rejects_read_only_registers():
+    """Input registers can not be written."""
+    with pytest.raises(ValueError):
+        plan_writes({"input_outdoor_temperature": 1})
@@ -0,0 +1,146 @@
+"""Test several Thermia Genesis heat pumps sharing one installation."""
+import asyncio
+from unittest.mock import AsyncMock
+from unittest.mock import patch
+
+from custom_components.thermiagenesis import SCAN_INTERVAL
+from custom_components.thermiagenesis import ThermiaGenesisDataUpdateCoordinator
+from custom_components.thermiagenesis.const import CONF_UNIT_ID
+from custom_components.thermiagenesis.const import DATA_POLL_GROUP
+from custom_components.thermiagenesis.const import DEFAULT_UNIT_ID
+from custom_components.thermiagenesis.const import DOMAIN
+from custom_components.thermiagenesis.entity import ATTR_MODEL
+from custom_components.thermiagenesis.entity import entity_unique_id
+from custom_components.thermiagenesis.polling import PollGroup
+from homeassistant.const import CONF_HOST
+from homeassistant.const import CONF_PORT
+from homeassistant.const import CONF_TYPE
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pythermiagenesis.const import ATTR_INPUT_COMPRESSOR_SPEED_RPM
+from pythermiagenesis.const import ATTR_INPUT_FIRST_PRIORITISED_DEMAND
+
+from .simulator import HeatPumpSimulator
+
+
+def _entry(simulator, version=2):
+    return MockConfigEntry(
+        domain=DOMAIN,
+        version=version,
+        data={
+            CONF_HOST: simulator.host,
+            CONF_PORT: simulator.port,
+            CONF_TYPE: "inverter",
+        },
+    )
+
+
+async def test_poll_sessions_are_capped(hass):
+    """No more than max_sessions heat pumps are polled at a time."""
+    group = PollGroup(max_sessions=1)
+    coordinators = [
+        ThermiaGenesisDataUpdateCoordinator(
+            hass, "127.0.0.1", 502 + n, "inverter", poll_group=group
+        )
+        for n in range(3)
+    ]
+    assert [c.poll_offset for c in coordinators] == [0, 1 / 3, 2 / 3]
+
+    polling = []
+    overlaps = []
+
+    async def read(registers, priority):
+        polling.append(1)
+        overlaps.append(len(polling))
+        await asyncio.sleep(0.01)
+        polling.pop()
+        return {}, {}
+
+    for coordinator in coordinators:
+        coordinator._async_read_registers = read
+        coordinator.registerAttribute(ATTR_INPUT_FIRST_PRIORITISED_DEMAND)
+    await asyncio.gather(*(c.async_refresh() for c in coordinators))
+    assert overlaps == [1, 1, 1]
+
+    await coordinators[0].async_shutdown()
+    assert group.members == coordinators[1:]
+    for coordinator in coordinators[1:]:
+        await coordinator.async_shutdown()
+
+
+async def test_two_heat_pumps(hass, enable_custom_integrations, socket_enabled):
+    """Entries get their own devices and entities."""
+    simulators = [HeatPumpSimulator(), HeatPumpSimulator()]
+    entries = []
+    for simulator in simulators:
+        await simulator.start()
+        entry = _entry(simulator)
+        entry.add_to_hass(hass)
+        entries.append(entry)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert len(hass.data[DATA_POLL_GROUP].members) == 2
+    registry = er.async_get(hass)
+    device_registry = dr.async_get(hass)
+    for entry in entries:
+        assert registry.async_get_entity_id(
+            "sensor", DOMAIN, entity_unique_id(entry.entry_id, "heatpump")
+        )
+        assert device_registry.async_get_device(identifiers={(DOMAIN, entry.entry_id)})
+
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    assert hass.data[DATA_POLL_GROUP].members == []
+    for simulator in simulators:
+        await simulator.stop()
+
+
+async def test_poll_offset_shifts_once(hass):
+    """A new poll offset delays the next scheduled poll by its share."""
+    coordinator = ThermiaGenesisDataUpdateCoordinator(
+        hass, "127.0.0.1", 502, "inverter"
+    )
+    coordinator._async_read_registers = AsyncMock(return_value=({}, {}))
+    coordinator.set_poll_offset(0.5)
+    with patch.object(hass.loop, "call_at", wraps=hass.loop.call_at) as call_at:
+        unsub = coordinator.async_add_listener(lambda: None)
+        (unshifted, *_), _ = call_at.call_args_list[-2]
+        (shifted, *_), _ = call_at.call_args_list[-1]
+        assert round(shifted - unshifted) == round(SCAN_INTERVAL.total_seconds() / 2)
+        # Later polls aren't shifted again
+        await coordinator.async_refresh()
+        assert call_at.call_count == 3
+    unsub()
+    await coordinator.async_shutdown()
+
+
+async def test_migrate_ids(hass, enable_custom_integrations, simulator):
+    """Ids of entries from before multiple heat pumps are scoped to the entry."""
+    entry = _entry(simulator, version=1)
+    entry.add_to_hass(hass)
+    registry = er.async_get(hass)
+    legacy = registry.async_get_or_create(
+        "sensor",
+        DOMAIN,
+        f"thermiagenesis_{ATTR_INPUT_COMPRESSOR_SPEED_RPM}",
+        config_entry=entry,
+    )
+    device_registry = dr.async_get(hass)
+    device = device_registry.async_get_or_create(
+        config_entry_id=entry.entry_id, identifiers={(DOMAIN, ATTR_MODEL)}
+    )
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.version == 2
+    assert entry.data[CONF_UNIT_ID] == DEFAULT_UNIT_ID
+    assert registry.async_get(legacy.entity_id).unique_id == entity_unique_id(
+        entry.entry_id, ATTR_INPUT_COMPRESSOR_SPEED_RPM
+    )
+    assert device_registry.async_get(device.id).identifiers == {
+        (DOMAIN, entry.entry_id)
+    }
+    assert await hass.config_entries.async_unload(entry.entry_id)
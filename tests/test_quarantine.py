@@ -0,0 +1,125 @@
+"""Test the quarantine of Thermia Genesis addresses that fail to read."""
+from custom_components.thermiagenesis import ThermiaGenesisDataUpdateCoordinator
+from custom_components.thermiagenesis.planner import plan_reads
+from custom_components.thermiagenesis.quarantine import MAX_REPROBE_INTERVAL
+from custom_components.thermiagenesis.quarantine import Quarantine
+from custom_components.thermiagenesis.quarantine import REPROBE_INTERVAL
+from pythermiagenesis.const import ATTR_INPUT_BRINE_IN_TEMPERATURE
+from pythermiagenesis.const import ATTR_INPUT_BRINE_OUT_TEMPERATURE
+from pythermiagenesis.const import ATTR_INPUT_CONDENSER_OUT_TEMPERATURE
+from pythermiagenesis.const import ATTR_INPUT_OUTDOOR_TEMPERATURE
+from pythermiagenesis.const import ATTR_INPUT_TAP_WATER_TOP_TEMPERATURE
+from pythermiagenesis.const import KEY_ADDRESS
+from pythermiagenesis.const import KEY_REG_TYPE
+from pythermiagenesis.const import REGISTERS
+
+from .simulator import EXC_ILLEGAL_ADDRESS
+from .simulator import HeatPumpSimulator
+
+REGISTERED = [
+    ATTR_INPUT_CONDENSER_OUT_TEMPERATURE,
+    ATTR_INPUT_BRINE_IN_TEMPERATURE,
+    ATTR_INPUT_BRINE_OUT_TEMPERATURE,
+    ATTR_INPUT_OUTDOOR_TEMPERATURE,
+    ATTR_INPUT_TAP_WATER_TOP_TEMPERATURE,
+]
+
+
+def test_reprobe_backoff():
+    """Addresses failing again wait longer until a read covers them."""
+    quarantine = Quarantine()
+    address = ("input", 10)
+    quarantine.add({address}, 0)
+    assert address in quarantine
+    assert quarantine.excludes(ATTR_INPUT_BRINE_IN_TEMPERATURE)
+    assert not quarantine.release_due(1)
+    assert quarantine.release_due(REPROBE_INTERVAL.total_seconds()) == {address}
+    assert not quarantine.excludes(ATTR_INPUT_BRINE_IN_TEMPERATURE)
+
+    quarantine.add({address}, 0)
+    assert quarantine.until[address] == 2 * REPROBE_INTERVAL.total_seconds()
+    for _ in range(20):
+        quarantine.add({address}, 0)
+    assert quarantine.until[address] == MAX_REPROBE_INTERVAL.total_seconds()
+
+    quarantine.release_due(MAX_REPROBE_INTERVAL.total_seconds())
+    quarantine.confirm("input", 5, 15)
+    quarantine.add({address}, 0)
+    assert quarantine.until[address] == REPROBE_INTERVAL.total_seconds()
+
+
+def test_plan_avoids_addresses():
+    """Blocks don't span an address to avoid."""
+    registers = [ATTR_INPUT_OUTDOOR_TEMPERATURE, ATTR_INPUT_TAP_WATER_TOP_TEMPERATURE]
+    assert len(plan_reads(registers, "inverter")) == 1
+    assert len(plan_reads(registers, "inverter", avoid={("input", 14)})) == 2
+
+
+async def test_bad_register_quarantined(hass, simulator):
+    """A register failing with an illegal address doesn't fail the poll."""
+    address = REGISTERS[ATTR_INPUT_BRINE_IN_TEMPERATURE]["address"]
+    simulator.fail_addresses[("input", address)] = EXC_ILLEGAL_ADDRESS
+    coordinator = ThermiaGenesisDataUpdateCoordinator(
+        hass, simulator.host, simulator.port, "inverter"
+    )
+    coordinator.registerAttribute(REGISTERED)
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert ("input", address) in coordinator.quarantine
+    assert set(coordinator.data) == set(REGISTERED) - {ATTR_INPUT_BRINE_IN_TEMPERATURE}
+    # A bad address says nothing about the load the heat pump can take
+    assert coordinator.tuner.errors == 0
+
+    # The quarantined register is left out without failing requests
+    failures = coordinator.metrics.failures
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert coordinator.metrics.failures == failures
+
+    # And read again once due for a reprobe
+    simulator.fail_addresses.clear()
+    coordinator.quarantine.until[("input", address)] = 0
+    await coordinator.async_refresh()
+    assert ATTR_INPUT_BRINE_IN_TEMPERATURE in coordinator.data
+    assert not coordinator.quarantine.until
+    assert not coordinator.quarantine.strikes
+    await coordinator.async_shutdown()
+
+
+async def test_bad_gap_quarantined(hass, simulator):
+    """An address failing between two registers splits their block."""
+    simulator.fail_addresses[("input", 14)] = EXC_ILLEGAL_ADDRESS
+    coordinator = ThermiaGenesisDataUpdateCoordinator(
+        hass, simulator.host, simulator.port, "inverter"
+    )
+    coordinator.registerAttribute(REGISTERED)
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert set(coordinator.data) == set(REGISTERED)
+    assert coordinator.quarantine.as_dict() == ["input:14"]
+    await coordinator.async_shutdown()
+
+
+async def test_oversized_block_shrinks(hass, socket_enabled):
+    """Illegal value for a block too large shrinks blocks, not quarantines."""
+    registers = [
+        name
+        for name, meta in REGISTERS.items()
+        if meta[KEY_REG_TYPE] == "input" and meta[KEY_ADDRESS] <= 26
+    ]
+    simulator = HeatPumpSimulator("inverter", max_registers=16)
+    await simulator.start()
+    coordinator = ThermiaGenesisDataUpdateCoordinator(
+        hass, simulator.host, simulator.port, "inverter"
+    )
+    coordinator.registerAttribute(registers)
+    coordinator.tuner.max_block["input"] = 32
+    await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+    assert not coordinator.quarantine.until
+    assert coordinator.tuner.max_block["input"] == 16
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert not coordinator.quarantine.until
+    await coordinator.async_shutdown()
+    await simulator.stop()
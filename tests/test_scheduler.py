@@ -0,0 +1,111 @@
+"""Test the Thermia Genesis request scheduler."""
+import asyncio
+
+import pytest
+from custom_components.thermiagenesis.scheduler import PRIORITY_POLL
+from custom_components.thermiagenesis.scheduler import PRIORITY_READ
+from custom_components.thermiagenesis.scheduler import PRIORITY_WRITE
+from custom_components.thermiagenesis.scheduler import RequestScheduler
+
+
+async def test_runs_in_priority_order(hass):
+    """Writes run before targeted reads, which run before polls."""
+    scheduler = RequestScheduler(hass, "test")
+    release = asyncio.Event()
+    order = []
+
+    async def job(name):
+        if name == "busy":
+            await release.wait()
+        order.append(name)
+        return name
+
+    busy = asyncio.ensure_future(
+        scheduler.async_run(PRIORITY_POLL, lambda: job("busy"))
+    )
+    await asyncio.sleep(0)
+    queued = [
+        asyncio.ensure_future(scheduler.async_run(priority, lambda n=name: job(n)))
+        for priority, name in (
+            (PRIORITY_POLL, "poll"),
+            (PRIORITY_READ, "read"),
+            (PRIORITY_WRITE, "write"),
+        )
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.queued == 3
+    release.set()
+    await asyncio.gather(busy, *queued)
+    assert order == ["busy", "write", "read", "poll"]
+
+
+async def test_identical_reads_are_joined(hass):
+    """Queued requests with the same key are performed once."""
+    scheduler = RequestScheduler(hass, "test")
+    calls = []
+
+    async def job():
+        calls.append(1)
+        return [1, 2]
+
+    results = await asyncio.gather(
+        scheduler.async_run(PRIORITY_POLL, job, key=("input", 0, 2)),
+        scheduler.async_run(PRIORITY_READ, job, key=("input", 0, 2)),
+    )
+    assert results == [[1, 2], [1, 2]]
+    assert len(calls) == 1
+
+
+async def test_errors_reach_the_caller(hass):
+    """A failing request raises for its caller and the queue keeps working."""
+    scheduler = RequestScheduler(hass, "test")
+
+    async def fail():
+        raise ConnectionError("gone")
+
+    async def succeed():
+        return True
+
+    with pytest.raises(ConnectionError):
+        await scheduler.async_run(PRIORITY_WRITE, fail)
+    assert await scheduler.async_run(PRIORITY_POLL, succeed)
+    await scheduler.async_stop()
+
+
+async def test_cancelled_request(hass):
+    """A cancelled request doesn't leave its or the queued callers waiting."""
+    scheduler = RequestScheduler(hass, "test")
+    release = asyncio.Event()
+
+    async def cancelled():
+        await release.wait()
+        raise asyncio.CancelledError
+
+    async def succeed():
+        return True
+
+    first = asyncio.ensure_future(scheduler.async_run(PRIORITY_POLL, cancelled))
+    await asyncio.sleep(0)
+    queued = asyncio.ensure_future(scheduler.async_run(PRIORITY_POLL, succeed))
+    await asyncio.sleep(0)
+    assert scheduler.queued == 1
+    release.set()
+    results = await asyncio.gather(first, queued, return_exceptions=True)
+    assert isinstance(results[0], asyncio.CancelledError)
+    assert isinstance(results[1], ConnectionError)
+    # A new worker takes the next request
+    assert await scheduler.async_run(PRIORITY_POLL, succeed)
+    await scheduler.async_stop()
+
+
+async def test_stop_after_cancelled_request(hass):
+    """Stopping doesn't raise for a worker ended by a cancelled request."""
+    scheduler = RequestScheduler(hass, "test")
+
+    async def cancelled():
+        raise asyncio.CancelledError
+
+    with pytest.raises(asyncio.CancelledError):
+        await scheduler.async_run(PRIORITY_POLL, cancelled)
+    await asyncio.sleep(0)
+    await scheduler.async_stop()
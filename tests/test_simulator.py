@@ -0,0 +1,101 @@
+"""Test the integration against the simulated Modbus TCP heat pump."""
+import pytest
+from custom_components.thermiagenesis import ThermiaGenesisDataUpdateCoordinator
+from custom_components.thermiagenesis.connection import ModbusExceptionError
+from custom_components.thermiagenesis.connection import ThermiaConnection
+from custom_components.thermiagenesis.planner import CONDITIONAL_REGISTERS
+from custom_components.thermiagenesis.planner import plan_reads
+from pythermiagenesis.const import ATTR_COIL_ENABLE_HEAT
+from pythermiagenesis.const import ATTR_HOLDING_COMFORT_WHEEL_SETTING
+from pythermiagenesis.const import ATTR_INPUT_COMPRESSOR_OPERATING_HOURS
+from pythermiagenesis.const import ATTR_INPUT_COMPRESSOR_SPEED_RPM
+from pythermiagenesis.const import REGISTERS
+
+from .simulator import EXC_ILLEGAL_ADDRESS
+from .simulator import EXC_ILLEGAL_VALUE
+
+INVERTER_REGISTERS = [name for name, meta in REGISTERS.items() if meta["inverter"]]
+ENABLED = {name: True for name in CONDITIONAL_REGISTERS.values()}
+
+
+async def _read_all(connection, kind="inverter"):
+    await connection.async_ensure_open()
+    data = {}
+    for block in plan_reads(INVERTER_REGISTERS, kind, known=ENABLED):
+        data.update(block.decode(await connection.async_read(block)))
+    return data
+
+
+async def test_read_register_map(hass, simulator):
+    """Every inverter register is served and decodes to the stored value."""
+    simulator.pump.set_value(ATTR_INPUT_COMPRESSOR_SPEED_RPM, 3210)
+    simulator.pump.set_value(ATTR_HOLDING_COMFORT_WHEEL_SETTING, -2.5)
+    simulator.pump.set_value(ATTR_INPUT_COMPRESSOR_OPERATING_HOURS, 123456)
+    connection = ThermiaConnection(hass, simulator.host, simulator.port)
+    data = await _read_all(connection)
+    await connection.async_close()
+
+    assert len(data) == len(INVERTER_REGISTERS)
+    assert data[ATTR_INPUT_COMPRESSOR_SPEED_RPM] == 3210
+    assert data[ATTR_HOLDING_COMFORT_WHEEL_SETTING] == -2.5
+    assert data[ATTR_INPUT_COMPRESSOR_OPERATING_HOURS] == 123456
+    assert simulator.requests == len(
+        plan_reads(INVERTER_REGISTERS, "inverter", known=ENABLED)
+    )
+
+
+async def test_exception_responses(hass, simulator):
+    """Oversized requests and failing addresses answer with exceptions."""
+    address = REGISTERS[ATTR_INPUT_COMPRESSOR_SPEED_RPM]["address"]
+    simulator.max_registers = 8
+    simulator.fail_addresses[("input", address)] = EXC_ILLEGAL_ADDRESS
+    connection = ThermiaConnection(hass, simulator.host, simulator.port)
+    await connection.async_ensure_open()
+
+    (block,) = plan_reads([ATTR_INPUT_COMPRESSOR_SPEED_RPM], "inverter")
+    with pytest.raises(ModbusExceptionError) as error:
+        await connection.async_read(block)
+    assert error.value.code == EXC_ILLEGAL_ADDRESS
+
+    simulator.fail_addresses.clear()
+    block.end = block.start + 31
+    with pytest.raises(ModbusExceptionError) as error:
+        await connection.async_read(block)
+    assert error.value.code == EXC_ILLEGAL_VALUE
+
+    await connection.async_close()
+
+
+async def test_dropped_connection(hass, simulator):
+    """A dropped connection fails the request and is reopened afterwards."""
+    connection = ThermiaConnection(hass, simulator.host, simulator.port)
+    (block,) = plan_reads([ATTR_INPUT_COMPRESSOR_SPEED_RPM], "inverter")
+    await connection.async_ensure_open()
+    simulator.drop_rate = 1
+    with pytest.raises(ConnectionError):
+        await connection.async_read(block)
+
+    simulator.drop_rate = 0
+    await connection.async_ensure_open()
+    assert await connection.async_read(block)
+    assert simulator.connections == 2
+    await connection.async_close()
+
+
+async def test_coordinator_round_trip(hass, simulator):
+    """The coordinator polls and writes through the simulator."""
+    coordinator = ThermiaGenesisDataUpdateCoordinator(
+        hass, host=simulator.host, port=simulator.port, kind="inverter"
+    )
+    coordinator.registerAttribute(
+        [ATTR_COIL_ENABLE_HEAT, ATTR_HOLDING_COMFORT_WHEEL_SETTING]
+    )
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert coordinator.data[ATTR_COIL_ENABLE_HEAT] is False
+
+    await coordinator._async_set_data(ATTR_COIL_ENABLE_HEAT, True)
+    address = REGISTERS[ATTR_COIL_ENABLE_HEAT]["address"]
+    assert simulator.pump.memory["coil"][address] is True
+    assert coordinator.data[ATTR_COIL_ENABLE_HEAT] is True
+    await coordinator.async_shutdown()
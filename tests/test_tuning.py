@@ -0,0 +1,50 @@
+"""Test Thermia Genesis adaptive request tuning."""
+from custom_components.thermiagenesis.connection import ModbusExceptionError
+from custom_components.thermiagenesis.connection import ModbusTimeoutError
+from custom_components.thermiagenesis.tuning import AdaptiveTuner
+from custom_components.thermiagenesis.tuning import DEFAULT_DELAY
+from custom_components.thermiagenesis.tuning import MIN_BLOCK
+from custom_components.thermiagenesis.tuning import SUCCESS_STREAK
+
+
+def test_speed_up_while_device_keeps_up():
+    """A streak of fast requests lowers the delay and grows blocks."""
+    tuner = AdaptiveTuner()
+    block = tuner.max_block["input"]
+    for _ in range(SUCCESS_STREAK):
+        tuner.record_success("input", 0.01)
+    assert tuner.delay < DEFAULT_DELAY
+    assert tuner.max_block["input"] > block
+    assert tuner.max_block["holding"] == block
+
+
+def test_slow_requests_break_the_streak():
+    """A request far slower than average does not count towards speeding up."""
+    tuner = AdaptiveTuner()
+    for i in range(SUCCESS_STREAK * 2):
+        tuner.record_success("input", 0.01 if i % 10 else 1)
+    assert tuner.delay == DEFAULT_DELAY
+
+
+def test_back_off_on_errors():
+    """Timeouts and exception responses slow down and shrink blocks."""
+    tuner = AdaptiveTuner()
+    tuner.record_failure("coil", ModbusTimeoutError("timeout"))
+    assert tuner.delay == DEFAULT_DELAY * 2
+    for _ in range(10):
+        tuner.record_failure("coil", ModbusExceptionError("illegal address", 2))
+    assert tuner.max_block["coil"] == MIN_BLOCK
+    diagnostics = tuner.as_dict()
+    assert diagnostics["timeouts"] == 1
+    assert diagnostics["errors"] == 10
+
+
+def test_fits_largest_good_block():
+    """Blocks up to the largest read so far are known not to be too large."""
+    tuner = AdaptiveTuner()
+    assert tuner.fits("input", MIN_BLOCK)
+    assert not tuner.fits("input", 40)
+    tuner.record_success("input", 0.01, 40)
+    assert tuner.fits("input", 40)
+    assert not tuner.fits("input", 41)
+    assert not tuner.fits("holding", 40)